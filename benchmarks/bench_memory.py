@@ -0,0 +1,52 @@
+"""Compare the memory used per record by SecurityTXT and CompactSecurityTXT.
+
+Run with: python -m benchmarks.bench_memory [number of records]
+"""
+import os
+import sys
+import tracemalloc
+from typing import Callable, List
+
+from securitytxt.securitytxt import SecurityTXT
+
+example_file = open(f"{os.path.dirname(os.path.realpath(__file__))}/../tests/files/test_signed/in.txt").read()
+# The unique contact is added to the end of the signed body, since nothing after the signature is parsed
+signed_body, signature = example_file.split("-----BEGIN PGP SIGNATURE-----")
+
+
+def measure(records: int, create: Callable[[int], object]) -> float:
+    """
+    Measure the memory used per record when keeping the given number of records in memory.
+    :param records: The number of records to create.
+    :param create: Creates the record with the given number.
+    :return: The number of bytes per record.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept: List[object] = [create(i) for i in range(records)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return used / records
+
+
+def parse(i: int) -> SecurityTXT:
+    """Parse a copy of the example file, with a unique source url and contact like a real corpus."""
+    text = f"{signed_body}Contact: mailto:security@host{i}.example\n-----BEGIN PGP SIGNATURE-----{signature}"
+    securitytxt = SecurityTXT.from_text(text)
+    securitytxt.source_url = f"https://host{i}.example/.well-known/security.txt"
+    return securitytxt
+
+
+def main(records: int) -> None:
+    results = {
+        'SecurityTXT': measure(records, parse),
+        'CompactSecurityTXT': measure(records, lambda i: parse(i).compact()),
+        'CompactSecurityTXT (raw dropped)': measure(records, lambda i: parse(i).compact(keep_raw=False)),
+    }
+    for name, per_record in results.items():
+        print(f"{name:<34} {per_record:>8.0f} bytes/record")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
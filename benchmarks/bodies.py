@@ -0,0 +1,33 @@
+"""Deterministic synthetic security.txt bodies, so that benchmark runs on different machines parse the same input."""
+from typing import Dict
+
+
+def unsigned_body(lines: int) -> str:
+    """
+    Create an unsigned body with roughly the given number of lines, with a typical mix of fields and comments.
+    :param lines: The number of lines.
+    :return: The body.
+    """
+    body = ["# Our security policy", "Expires: 2030-12-31T23:59:59Z", "Preferred-Languages: en, nl"]
+    for i in range(max(lines - len(body), 1)):
+        body.append([f"Contact: mailto:security{i}@example.com",
+                     f"Encryption: https://example.com/pgp-key-{i}.txt",
+                     f"Policy: https://example.com/security-policy-{i}",
+                     f"# Comment line {i}",
+                     f"Canonical: https://example.com/.well-known/security.txt"][i % 5])
+    return '\n'.join(body[:max(lines, 4)]) + '\n'
+
+
+def signed_body(lines: int) -> str:
+    """
+    Create a signed body with roughly the given number of lines. The signature is not a valid signature.
+    :param lines: The number of lines.
+    :return: The body.
+    """
+    signature = '\n'.join('iQIzBAEBCAAdFiEEqvs1Pw7pNc/gvcvRX9Oj3XV3pEYFAmEBhSgACgkQX9Oj3XV3' for _ in range(12))
+    return (f"-----BEGIN PGP SIGNED MESSAGE-----\nHash: SHA512\n\n{unsigned_body(lines)}"
+            f"-----BEGIN PGP SIGNATURE-----\n\n{signature}\n=ab12\n-----END PGP SIGNATURE-----\n")
+
+
+# The sizes of the bodies: a minimal file, a typical file, and a huge file
+sizes: Dict[str, int] = {'small': 4, 'typical': 40, 'huge': 20000}
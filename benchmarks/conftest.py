@@ -0,0 +1,18 @@
+import pytest
+
+from tests.local_server import LocalServer
+
+
+@pytest.fixture(scope='module')
+def local_server():
+    """A factory for stand-in HTTP servers, which are shut down at the end of the module."""
+    servers = []
+
+    def create(routes, delay=0.0) -> LocalServer:
+        server = LocalServer(routes, delay).__enter__()
+        servers.append(server)
+        return server
+
+    yield create
+    for server in servers:
+        server.__exit__(None, None, None)
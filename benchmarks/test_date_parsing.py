@@ -0,0 +1,35 @@
+from itertools import count
+
+import pytest
+
+from securitytxt.parsers.textparsers.field_line_parser import FieldLineParser
+
+values = {
+    'rfc3339': " 2030-12-31T23:59:59Z",
+    'rfc3339_offset': " 2030-12-31T23:59:59.123+02:00",
+    'lenient': " Tue, 31 Dec 2030 23:59:59 +0000",
+}
+
+
+@pytest.mark.parametrize('value', values)
+def test_uncached(benchmark, value):
+    # Skip the memo, so every call parses the value
+    benchmark(FieldLineParser.parse_datetime.__wrapped__, values[value])
+
+
+@pytest.mark.parametrize('value', values)
+def test_cached(benchmark, value):
+    FieldLineParser.parse_datetime(values[value])
+    benchmark(FieldLineParser.parse_datetime, values[value])
+
+
+def test_distinct_values(benchmark):
+    # Distinct values that do not fit in the memo, as in a crawl of many hosts
+    seconds = count()
+
+    def parse():
+        second = next(seconds)
+        FieldLineParser.parse_datetime(f"{2030 + second // 86400 % 50}-12-31T"
+                                       f"{second // 3600 % 24:02}:{second // 60 % 60:02}:{second % 60:02}Z")
+
+    benchmark(parse)
@@ -0,0 +1,22 @@
+import pytest
+
+from benchmarks.bodies import sizes, signed_body, unsigned_body
+from securitytxt.parsers.file_parser import FileParser
+
+
+@pytest.mark.parametrize('size', sizes)
+def test_unsigned(benchmark, size):
+    body = unsigned_body(sizes[size])
+    benchmark(FileParser, body)
+
+
+@pytest.mark.parametrize('size', sizes)
+def test_signed(benchmark, size):
+    body = signed_body(sizes[size])
+    benchmark(FileParser, body)
+
+
+@pytest.mark.parametrize('size', sizes)
+def test_crlf(benchmark, size):
+    body = unsigned_body(sizes[size]).replace('\n', '\r\n')
+    benchmark(FileParser, body)
@@ -0,0 +1,31 @@
+import pytest
+
+from securitytxt.parsers.textparsers.signed_text_parser import SignedTextParser
+
+lines = 20000
+worst_cases = {
+    # Every line could start the signature, and there is no end of the signature
+    'signature_lines_without_end': "-----BEGIN PGP SIGNED MESSAGE-----\n" + "-----BEGIN PGP SIGNATURE-----\n" * lines,
+    # Every line could start or end the signature
+    'signature_lines_with_end': ("-----BEGIN PGP SIGNED MESSAGE-----\n" + "-----BEGIN PGP SIGNATURE-----\n" * lines +
+                                 "\n-----END PGP SIGNATURE-----\n" * lines),
+    # Every line of the signed text is dash-escaped
+    'dash_escaped': ("-----BEGIN PGP SIGNED MESSAGE-----\nHash: SHA512\n\n" +
+                     "- -----BEGIN PGP SIGNATURE-----\n" * lines +
+                     "-----BEGIN PGP SIGNATURE-----\n\nabc\n-----END PGP SIGNATURE-----\n"),
+    # Many armor headers before the signed text
+    'hash_headers': ("-----BEGIN PGP SIGNED MESSAGE-----\n" + "Hash: SHA512\n" * lines +
+                     "\nContact: mailto:a@b.c\n-----BEGIN PGP SIGNATURE-----\n\nabc\n-----END PGP SIGNATURE-----\n"),
+}
+
+
+def parse(text: str) -> None:
+    try:
+        SignedTextParser(text)
+    except AttributeError:
+        pass
+
+
+@pytest.mark.parametrize('case', worst_cases)
+def test_worst_case(benchmark, case):
+    benchmark(parse, worst_cases[case])
@@ -0,0 +1,53 @@
+import os
+
+import pytest
+
+from benchmarks.bodies import signed_body
+from securitytxt.parsers.http_session import create_session
+from securitytxt.parsers.url_parser import URLParser
+
+sites = 20
+# (latency in seconds, ratio of sites without a security.txt, ratio of sites that return an HTML-page)
+scenarios = {
+    'all_found': (0.0, 0.0, 0.0),
+    'mixed': (0.0, 0.5, 0.25),
+    'mixed_latency': (float(os.environ.get('SECURITYTXT_BENCHMARK_LATENCY', 0.005)), 0.5, 0.25),
+}
+
+
+def routes(not_found_ratio: float, html_ratio: float):
+    """
+    Create the routes of the stand-in server: every site has its own paths, and either a security.txt on the second
+    path, an HTML-page on both paths, or nothing at all.
+    """
+    routes = {}
+    for site in range(sites):
+        if site < sites * not_found_ratio:
+            continue
+        if site < sites * (not_found_ratio + html_ratio):
+            routes[f"/{site}/.well-known/security.txt"] = (200, "<html><body>Not here</body></html>")
+            routes[f"/{site}/security.txt"] = (200, "<html><body>Not here</body></html>")
+        else:
+            routes[f"/{site}/security.txt"] = (200, signed_body(40))
+    return routes
+
+
+def lookup_all(netloc: str, session) -> int:
+    found = 0
+    for site in range(sites):
+        try:
+            URLParser(netloc, possible_paths=[f"/{site}/.well-known/security.txt", f"/{site}/security.txt"],
+                      possible_schemes=['http'], session=session)
+            found += 1
+        except FileNotFoundError:
+            pass
+    return found
+
+
+@pytest.mark.parametrize('scenario', scenarios)
+def test_lookups(benchmark, local_server, scenario):
+    delay, not_found_ratio, html_ratio = scenarios[scenario]
+    server = local_server(routes(not_found_ratio, html_ratio), delay)
+    session = create_session(timeout=5)
+    found = benchmark.pedantic(lookup_all, args=(server.netloc, session), rounds=5, warmup_rounds=1)
+    assert found == sites - round(sites * not_found_ratio) - round(sites * html_ratio)
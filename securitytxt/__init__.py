@@ -1 +1,2 @@
 from .securitytxt import SecurityTXT
+from .compact_securitytxt import CompactSecurityTXT
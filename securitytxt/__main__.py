@@ -0,0 +1,5 @@
+import sys
+
+from securitytxt.cli import main
+
+sys.exit(main())
@@ -0,0 +1,150 @@
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Union
+
+from securitytxt.parsers.probe_order import ProbeOrder
+from securitytxt.parsers.rate_limiter import RateLimiter
+from securitytxt.scheduler import RecrawlScheduler
+from securitytxt.securitytxt import SecurityTXT
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Look for security.txt files on hosts, and write the results as JSON lines. Run with --help for the options.
+    :param argv: (optional) The command line arguments. Defaults to sys.argv.
+    :return: The exit code.
+    """
+    args = _parse_args(argv)
+    hosts = _read_hosts(_open(args.hosts))
+    finished = _finished_hosts(args.output) if args.resume and args.output != '-' else set()
+    scheduler = None
+    if args.schedule:
+        scheduler_kwargs = {'min_interval': args.min_interval, 'max_interval': args.max_interval}
+        scheduler = RecrawlScheduler.load(args.schedule, **scheduler_kwargs) if os.path.exists(args.schedule) \
+            else RecrawlScheduler(**scheduler_kwargs)
+        for host in hosts:
+            scheduler.add(host)
+        hosts = scheduler.due()
+    hosts = (host for host in hosts if host not in finished)
+    rate_limiter = None
+    if args.host_rate or args.ip_rate or args.max_in_flight:
+        rate_limiter = RateLimiter(host_rate=args.host_rate, ip_rate=args.ip_rate, max_in_flight=args.max_in_flight)
+    probe_order = None
+    if args.probe_order:
+        probe_order = ProbeOrder.load(args.probe_order, by_domain=args.probe_order_by_domain) \
+            if os.path.exists(args.probe_order) else ProbeOrder(by_domain=args.probe_order_by_domain)
+    output = sys.stdout if args.output == '-' else open(args.output, 'a' if args.resume else 'w', encoding='utf-8')
+    try:
+        results = SecurityTXT.from_urls(hosts, max_workers=args.workers, strict_url=args.strict_url,
+                                        timeout=args.timeout, rate_limiter=rate_limiter, probe_order=probe_order)
+        for host, result in results:
+            output.write(json.dumps(to_record(host, result, args.raw)) + '\n')
+            # Every finished host is on disk, so an interrupted run can be resumed from the output
+            output.flush()
+            if scheduler is not None:
+                scheduler.update(host, result)
+    finally:
+        if scheduler is not None:
+            scheduler.save(args.schedule)
+        if probe_order is not None:
+            probe_order.save(args.probe_order)
+            print(json.dumps({'hits': probe_order.hits, 'misses': probe_order.misses,
+                              'probes_saved': probe_order.probes_saved}), file=sys.stderr)
+        if output is not sys.stdout:
+            output.close()
+        if rate_limiter is not None:
+            print(json.dumps(rate_limiter.snapshot()), file=sys.stderr)
+    return 0
+
+
+def to_record(host: str, result: Union[SecurityTXT, Exception], raw: bool = False) -> Dict[str, Any]:
+    """
+    Convert the result of a lookup to a dictionary that can be serialized as JSON.
+    :param host: The host that was looked up.
+    :param result: The SecurityTXT found on the host, or the exception raised while looking for it.
+    :param raw: Whether to include the raw text of the file.
+    :return: The host, the fields of the SecurityTXT, whether it is valid, and the type of the error if any. The host,
+    valid and error keys take precedence over fields of the file with the same name.
+    """
+    if isinstance(result, Exception):
+        return {'host': host, 'valid': False, 'error': type(result).__name__, 'message': str(result)}
+    fields = {key: value.isoformat() if isinstance(value, datetime) else value
+              for key, value in result.to_dict(include_raw=raw).items()}
+    return {**fields, 'host': host, 'valid': result.is_valid(), 'error': None}
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(prog='securitytxt', description="Look for security.txt files on hosts, and "
+                                     "write one JSON line per host as soon as its lookup has finished.")
+    parser.add_argument('hosts', nargs='?', default='-', help="file with one host or url per line (default: stdin)")
+    parser.add_argument('-o', '--output', default='-', help="file to write the JSON lines to (default: stdout)")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help="number of concurrent lookups (default: 16)")
+    parser.add_argument('--timeout', type=float, default=10.0, help="timeout per request in seconds (default: 10)")
+    parser.add_argument('--strict-url', action='store_true', help="only look at the given urls, not at the paths "
+                        "where a security.txt may be located")
+    parser.add_argument('--raw', action='store_true', help="include the raw text of the files")
+    parser.add_argument('--resume', action='store_true', help="skip the hosts that are already in the output file, "
+                        "and append to it")
+    parser.add_argument('--schedule', metavar='STATE', help="only look up the hosts that are due according to the "
+                        "expiry of their files, and keep the schedule in this file")
+    parser.add_argument('--min-interval', type=float, default=None, help="minimum seconds between two lookups of a "
+                        "host when scheduling (default: 1 day)")
+    parser.add_argument('--max-interval', type=float, default=None, help="maximum seconds between two lookups of a "
+                        "host when scheduling (default: 30 days)")
+    parser.add_argument('--probe-order', metavar='STATE', help="request the url where the security.txt of a host was "
+                        "found before first, keep what was learned in this file, and write the number of requests "
+                        "saved to stderr at the end")
+    parser.add_argument('--probe-order-by-domain', action='store_true', help="with --probe-order, also request the "
+                        "url that worked for another host of the same domain first. This saves more requests, but may "
+                        "choose a lower-priority file on a host that serves several")
+    parser.add_argument('--host-rate', type=float, default=None, help="maximum requests per second per host. Any of "
+                        "the pacing options paces the requests per host and per IP address and honours 429 responses, "
+                        "and writes the pacing metrics to stderr at the end (default: 1 when pacing)")
+    parser.add_argument('--ip-rate', type=float, default=None, help="maximum requests per second per IP address "
+                        "when pacing (default: 10)")
+    parser.add_argument('--max-in-flight', type=int, default=None, help="maximum number of requests at the same time "
+                        "when pacing (default: no maximum)")
+    return parser.parse_args(argv)
+
+
+def _read_hosts(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Read the hosts from the lines of a file, skipping empty lines and comments.
+    :param lines: The lines.
+    :return: An iterator of the hosts.
+    """
+    for line in lines:
+        host = line.strip()
+        if host and not host.startswith('#'):
+            yield host
+
+
+def _finished_hosts(path: str) -> Set[str]:
+    """
+    Get the hosts that are already in an output file. A line that was only partly written when the previous run was
+    interrupted is removed from the file.
+    :param path: The path of the output file.
+    :return: The hosts in the output file.
+    """
+    if not os.path.exists(path):
+        return set()
+    finished = set()
+    with open(path, 'r+b') as output:
+        end = 0
+        for line in output:
+            if not line.endswith(b'\n'):
+                break
+            end += len(line)
+            finished.add(json.loads(line)['host'])
+        output.truncate(end)
+    return finished
+
+
+def _open(path: str) -> TextIO:
+    """Open a file for reading, or stdin for '-'."""
+    return sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
@@ -0,0 +1,156 @@
+import zlib
+from datetime import datetime
+from sys import intern
+from typing import Tuple, Union, Optional, Dict, Any, Iterable
+
+from securitytxt.securitytxt import SecurityTXT
+
+
+class CompactSecurityTXT:
+    """A memory-efficient representation of a security.txt file, for keeping many of them in memory. It has the same
+    attributes and methods as SecurityTXT, but it has no per-instance __dict__, stores the list fields as tuples that
+    share a single empty tuple when absent, interns the URIs and languages so that values repeated across files are
+    stored once, and keeps the raw text compressed, or drops it.
+
+    Attributes:
+        raw: the raw text of the securitytxt, decompressed on access. Empty if the raw text has been dropped.
+        source_url, contact, expires, expires_format, encryption, acknowledgments, preferred_languages, canonical,
+        policy, hiring, comments, signature, encoding, decoding: see SecurityTXT. The list fields are tuples.
+        Unknown fields added with add_field are available as attributes as well.
+
+    Public methods:
+        from_securitytxt: Create a compact representation of a SecurityTXT (class method)
+        to_securitytxt: Create a SecurityTXT from the compact representation
+        to_dict: Get the fields as a dictionary, see SecurityTXT.to_dict
+        add_field: Add a field (key/value pair) to the securitytxt object
+        is_valid: Checks if securitytxt file is considered valid according to the draft RFC.
+        required_fields_present: Checks if the fields required according to the draft RFC are non-empty
+        canonical_url: Checks if a given url is in the list of canonical urls
+        expired: Checks if a security.txt has expired according to the specified expiry date.
+    """
+    __slots__ = ('_raw', 'source_url', 'contact', 'expires', 'expires_format', 'encryption', 'acknowledgments',
+                 'preferred_languages', 'canonical', 'policy', 'hiring', 'comments', 'signature', 'encoding',
+                 'decoding', '_extra')
+
+    # The fields that are tuples, and whose values are interned
+    tuple_fields = ('contact', 'encryption', 'acknowledgments', 'preferred_languages', 'canonical', 'policy', 'hiring')
+
+    expired = SecurityTXT.expired
+    canonical_url = SecurityTXT.canonical_url
+    required_fields_present = SecurityTXT.required_fields_present
+    is_valid = SecurityTXT.is_valid
+
+    def __init__(self, raw: str = "", source_url: Optional[str] = None, contact: Iterable[str] = (),
+                 expires: Optional[datetime] = None, encryption: Iterable[str] = (),
+                 acknowledgments: Iterable[str] = (), preferred_languages: Iterable[str] = (),
+                 canonical: Iterable[str] = (), policy: Iterable[str] = (),
+                 hiring: Iterable[str] = (), comments: Iterable[str] = (), signature: Optional[str] = None,
+                 expires_format: Optional[str] = None, encoding: Optional[str] = None, decoding: Optional[str] = None,
+                 keep_raw: bool = True):
+        """Initialize all variables"""
+        self.raw = raw if keep_raw else ""
+        self.source_url = intern(source_url) if source_url else None
+        self.contact = self._intern_tuple(contact)
+        self.expires = expires
+        self.expires_format = expires_format
+        self.encryption = self._intern_tuple(encryption)
+        self.acknowledgments = self._intern_tuple(acknowledgments)
+        self.preferred_languages = self._intern_tuple(preferred_languages)
+        self.canonical = self._intern_tuple(canonical)
+        self.policy = self._intern_tuple(policy)
+        self.hiring = self._intern_tuple(hiring)
+        self.comments = tuple(comments) if comments else ()
+        self.signature = signature
+        self.encoding = encoding
+        self.decoding = decoding
+        self._extra: Optional[Dict[str, Any]] = None
+
+    @property
+    def raw(self) -> str:
+        """The raw text of the securitytxt."""
+        return zlib.decompress(self._raw).decode('utf-8', 'surrogatepass') if self._raw else ""
+
+    @raw.setter
+    def raw(self, raw: str) -> None:
+        """Compress and store the raw text of the securitytxt."""
+        self._raw = zlib.compress(raw.encode('utf-8', 'surrogatepass')) if raw else None
+
+    def __getattr__(self, key: str) -> Any:
+        """Get the value of an unknown field that has been added with add_field."""
+        extra = CompactSecurityTXT._extra.__get__(self) if not key.startswith('_') else None
+        if extra and key in extra:
+            return extra[key]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{key}'")
+
+    @classmethod
+    def from_securitytxt(cls, securitytxt: SecurityTXT, keep_raw: bool = True) -> 'CompactSecurityTXT':
+        """
+        Create a compact representation of a SecurityTXT, including its unknown fields.
+        :param securitytxt: The SecurityTXT to represent.
+        :param keep_raw: Whether to keep the raw text. If False, the raw text is dropped to save memory.
+        :return: The compact representation.
+        """
+        fields = dict(vars(securitytxt))
+        compact = cls(fields.pop('raw'), fields.pop('source_url'), fields.pop('contact'), fields.pop('expires'),
+                      fields.pop('encryption'), fields.pop('acknowledgments'), fields.pop('preferred_languages'),
+                      fields.pop('canonical'), fields.pop('policy'), fields.pop('hiring'), fields.pop('comments'),
+                      fields.pop('signature'), securitytxt.expires_format, securitytxt.encoding, securitytxt.decoding,
+                      keep_raw)
+        for key in ('expires_format', 'encoding', 'decoding'):
+            fields.pop(key, None)
+        if fields:
+            compact._extra = fields
+        return compact
+
+    def to_securitytxt(self) -> SecurityTXT:
+        """
+        Create a SecurityTXT from the compact representation.
+        :return: A SecurityTXT with the same fields.
+        """
+        securitytxt = SecurityTXT(self.raw, self.source_url, list(self.contact), self.expires, list(self.encryption),
+                                  list(self.acknowledgments), list(self.preferred_languages), list(self.canonical),
+                                  list(self.policy), list(self.hiring), list(self.comments), self.signature)
+        for key in ('expires_format', 'encoding', 'decoding'):
+            if getattr(self, key) is not None:
+                setattr(securitytxt, key, getattr(self, key))
+        for key, value in (self._extra or {}).items():
+            setattr(securitytxt, key, list(value) if type(value) is list else value)
+        return securitytxt
+
+    def to_dict(self, include_raw: bool = True) -> Dict[str, Any]:
+        """
+        Get the fields as a dictionary, in the same form as SecurityTXT.to_dict.
+        :param include_raw: Whether to include the raw text.
+        :return: The fields, by name.
+        """
+        return self.to_securitytxt().to_dict(include_raw)
+
+    def add_field(self, key: str, value: Union[str, datetime]) -> None:
+        """
+        Add a field value to the securitytxt
+        :param key: The key of the field
+        :param value: The value of the field
+        """
+        if key in self.tuple_fields:
+            values = self._intern_tuple(value) if type(value) is list else (intern(value),)
+            setattr(self, key, values if type(value) is list else getattr(self, key) + values)
+        elif key in self.__slots__:
+            setattr(self, key, value)
+        else:
+            extra = self._extra if self._extra is not None else {}
+            if key not in extra:
+                extra[key] = [value]
+            elif (type(extra[key]) is not list) or (type(value) is list):
+                extra[key] = value
+            else:
+                extra[key].append(value)
+            self._extra = extra
+
+    @staticmethod
+    def _intern_tuple(values: Iterable[str]) -> Tuple[str, ...]:
+        """
+        Create a tuple of interned strings. An empty tuple is shared by all empty fields.
+        :param values: The strings.
+        :return: The tuple of interned strings.
+        """
+        return tuple(map(intern, values)) if values else ()
@@ -0,0 +1,192 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from time import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from securitytxt.parsers.textparsers.field_line_parser import FieldLineParser
+from securitytxt.securitytxt import SecurityTXT
+
+
+class CorpusIndex:
+    """An in-memory index of the securitytxts of many hosts, to answer questions about the whole corpus without looking
+    at every securitytxt: which hosts share a contact or an encryption key, which expire in a given period, and which
+    have canonical urls on another host. The URI fields have an inverted index from each value to the hosts that list
+    it, and the expiry dates a sorted index for range queries. Hosts are normalized to their lowercase hostname, and
+    URI values to a lowercase scheme and host (and a lowercase address for mailto: URIs). Securitytxts can be added
+    and removed one by one, for example when a host is scanned again.
+
+    Attributes:
+        :class indexed_fields: the URI fields that have an inverted index.
+
+    Public methods:
+        add: Add the securitytxt of a host, replacing the previous one
+        remove: Remove the securitytxt of a host
+        get: Get the securitytxt of a host
+        find: Find the hosts that list a value in a field
+        values: Get the values of a field with the number of hosts that list them
+        expiring: Find the hosts that expire in a period
+        expired: Find the hosts that have expired
+        off_domain_canonical: Find the hosts that have a canonical url on another host
+        normalize_host: Normalize a host or url to the host key of the index (static method)
+        normalize_value: Normalize a URI value to the key of the inverted index (static method)
+
+    Raises:
+        :raises KeyError: if a host is not in the index.
+    """
+    indexed_fields: Tuple[str, ...] = tuple(FieldLineParser.uri_fields)
+
+    def __init__(self, securitytxts: Iterable[SecurityTXT] = ()):
+        """
+        Initialize the indexes.
+        :param securitytxts: (optional) The securitytxts to add. Their host is taken from their source_url.
+        """
+        self._securitytxts: Dict[str, SecurityTXT] = {}
+        self._inverted: Dict[str, Dict[str, Set[str]]] = {field: {} for field in self.indexed_fields}
+        self._expires: List[Tuple[float, str]] = []
+        self._without_expires: Set[str] = set()
+        self._off_domain: Set[str] = set()
+        for securitytxt in securitytxts:
+            self.add(securitytxt)
+
+    def __len__(self) -> int:
+        """The number of hosts in the index."""
+        return len(self._securitytxts)
+
+    def __contains__(self, host: str) -> bool:
+        """Whether a host is in the index."""
+        return self.normalize_host(host) in self._securitytxts
+
+    def add(self, securitytxt: SecurityTXT, host: Optional[str] = None) -> str:
+        """
+        Add the securitytxt of a host. If the host is already in the index, its previous securitytxt is replaced.
+        :param securitytxt: The securitytxt.
+        :param host: (optional) The host or url the securitytxt was found on. Defaults to its source_url.
+        :return: The normalized host.
+        :raises KeyError: if no host is given and the securitytxt has no source_url.
+        """
+        if not host and not securitytxt.source_url:
+            raise KeyError("The securitytxt has no source_url, so the host must be given")
+        host = self.normalize_host(host if host else securitytxt.source_url)
+        if host in self._securitytxts:
+            self.remove(host)
+        self._securitytxts[host] = securitytxt
+        for field in self.indexed_fields:
+            index = self._inverted[field]
+            for value in getattr(securitytxt, field):
+                index.setdefault(self.normalize_value(value), set()).add(host)
+        if securitytxt.expires:
+            insort(self._expires, (securitytxt.expires.timestamp(), host))
+        else:
+            self._without_expires.add(host)
+        if any(self.normalize_host(url) != host for url in securitytxt.canonical):
+            self._off_domain.add(host)
+        return host
+
+    def remove(self, host: str) -> SecurityTXT:
+        """
+        Remove the securitytxt of a host.
+        :param host: The host or url.
+        :return: The securitytxt that was removed.
+        :raises KeyError: if the host is not in the index.
+        """
+        host = self.normalize_host(host)
+        securitytxt = self._securitytxts.pop(host)
+        for field in self.indexed_fields:
+            index = self._inverted[field]
+            for value in getattr(securitytxt, field):
+                key = self.normalize_value(value)
+                hosts = index.get(key)
+                if hosts is not None:
+                    hosts.discard(host)
+                    if not hosts:
+                        del index[key]
+        if securitytxt.expires:
+            position = bisect_left(self._expires, (securitytxt.expires.timestamp(), host))
+            if position < len(self._expires) and self._expires[position][1] == host:
+                del self._expires[position]
+        self._without_expires.discard(host)
+        self._off_domain.discard(host)
+        return securitytxt
+
+    def get(self, host: str) -> SecurityTXT:
+        """
+        Get the securitytxt of a host.
+        :param host: The host or url.
+        :return: The securitytxt.
+        :raises KeyError: if the host is not in the index.
+        """
+        return self._securitytxts[self.normalize_host(host)]
+
+    def find(self, field: str, value: str) -> Set[str]:
+        """
+        Find the hosts that list a value in a field, for example the hosts that share a contact.
+        :param field: One of the indexed_fields.
+        :param value: The value.
+        :return: The hosts.
+        :raises KeyError: if the field is not indexed.
+        """
+        return set(self._inverted[field].get(self.normalize_value(value), ()))
+
+    def values(self, field: str) -> Dict[str, int]:
+        """
+        Get the values of a field with the number of hosts that list them, for example to find the most shared contacts.
+        :param field: One of the indexed_fields.
+        :return: The number of hosts per normalized value.
+        :raises KeyError: if the field is not indexed.
+        """
+        return {value: len(hosts) for value, hosts in self._inverted[field].items()}
+
+    def expiring(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[str]:
+        """
+        Find the hosts that expire in a period, ordered by their expiry date. Hosts without an expiry date are not
+        included.
+        :param start: (optional) The start of the period (inclusive). Defaults to the earliest expiry date.
+        :param end: (optional) The end of the period (exclusive). Defaults to the latest expiry date.
+        :return: The hosts.
+        """
+        low = bisect_left(self._expires, (start.timestamp(),)) if start else 0
+        high = bisect_left(self._expires, (end.timestamp(),)) if end else len(self._expires)
+        return [host for _, host in self._expires[low:high]]
+
+    def expired(self, now: Optional[datetime] = None) -> Set[str]:
+        """
+        Find the hosts that have expired. As with SecurityTXT.expired, this includes the hosts without an expiry date.
+        :param now: (optional) The time to check the expiry against. Defaults to now.
+        :return: The hosts.
+        """
+        high = bisect_right(self._expires, (now.timestamp() if now else time(),))
+        return {host for _, host in self._expires[:high]} | self._without_expires
+
+    def off_domain_canonical(self) -> Set[str]:
+        """
+        Find the hosts that have a canonical url on another host.
+        :return: The hosts.
+        """
+        return set(self._off_domain)
+
+    @staticmethod
+    def normalize_host(host: str) -> str:
+        """
+        Normalize a host or url to the host key of the index: its lowercase hostname, without port or trailing dot.
+        :param host: The host or url.
+        :return: The normalized host.
+        """
+        hostname = urlsplit(host if '//' in host else f"//{host}").hostname
+        return hostname.rstrip('.') if hostname else host.strip().lower()
+
+    @staticmethod
+    def normalize_value(value: str) -> str:
+        """
+        Normalize a URI value to the key of the inverted index. The scheme and host are case-insensitive, and so is the
+        address of a mailto: URI in practice.
+        :param value: The value.
+        :return: The normalized value.
+        """
+        value = value.strip()
+        if value[:7].lower() == 'mailto:':
+            return value.lower()
+        parts = urlsplit(value)
+        if not parts.scheme or not parts.netloc:
+            return value
+        return parts._replace(scheme=parts.scheme.lower(), netloc=parts.netloc.lower()).geturl()
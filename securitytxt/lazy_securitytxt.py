@@ -0,0 +1,92 @@
+from typing import Any, Dict, List, Optional
+
+from securitytxt.parsers.file_parser import FileParser
+from securitytxt.parsers.textparsers.field_line_parser import FieldLineParser
+from securitytxt.securitytxt import SecurityTXT
+
+
+class _LazyField:
+    """A field of a LazySecurityTXT that is parsed on first access. The parsed value is stored on the instance, which
+    takes precedence over this descriptor, so the field is parsed only once."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Optional['LazySecurityTXT'], owner: type) -> Any:
+        if instance is None:
+            return self
+        value = instance._parse_attribute(self.name)
+        instance.__dict__[self.name] = value
+        return value
+
+
+class LazySecurityTXT(SecurityTXT):
+    """A security.txt file whose fields are parsed on first access. It is created by the LazyFileParser, which only
+    indexes the lines of the file by their key. Reading a field parses the lines with that key, and caches the result.
+    Jobs that only look at a few fields, such as the expiry date, skip parsing the rest of the file. Unknown fields are
+    parsed on access as well, but only show up in vars() after they have been accessed.
+
+    Attributes:
+        See SecurityTXT.
+
+    Public methods:
+        See SecurityTXT.
+    """
+    contact = _LazyField()
+    expires = _LazyField()
+    expires_format = _LazyField()
+    encryption = _LazyField()
+    acknowledgments = _LazyField()
+    preferred_languages = _LazyField()
+    canonical = _LazyField()
+    policy = _LazyField()
+    hiring = _LazyField()
+    comments = _LazyField()
+
+    _lazy_fields = ('contact', 'expires', 'expires_format', 'encryption', 'acknowledgments', 'preferred_languages',
+                    'canonical', 'policy', 'hiring', 'comments')
+    # The key of the lines to parse for an attribute, if it differs from the attribute itself
+    _attribute_keys = {f"{key}_format": key for key in FieldLineParser.datetime_fields}
+
+    def __init__(self, raw: str = "", lines: List[str] = None, index: Dict[str, List[int]] = None):
+        """
+        Initialize the variables that are not parsed lazily
+        :param raw: The raw text of the securitytxt.
+        :param lines: The lines of the unsigned text.
+        :param index: The numbers of the lines per normalized key. Comments are indexed under 'comments'.
+        """
+        self.raw: str = raw
+        self.source_url: Optional[str] = None
+        self.signature: Optional[str] = None
+        self._lines: List[str] = lines if lines else []
+        self._index: Dict[str, List[int]] = index if index else {}
+
+    def __getattr__(self, key: str) -> Any:
+        """Parse an unknown field on first access."""
+        index = self.__dict__.get('_index')
+        if key.startswith('_') or not index or key not in index:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{key}'")
+        value = self._parse_attribute(key)
+        self.__dict__[key] = value
+        return value
+
+    def to_dict(self, include_raw: bool = True) -> Dict[str, Any]:
+        """
+        Parse all fields, and get them as a dictionary. See SecurityTXT.to_dict.
+        :param include_raw: Whether to include the raw text.
+        :return: The fields, by name.
+        """
+        for key in [*self._lazy_fields, *self._index]:
+            getattr(self, key, None)
+        return super().to_dict(include_raw)
+
+    def _parse_attribute(self, attribute: str) -> Any:
+        """
+        Parse the lines for an attribute.
+        :param attribute: The attribute to parse.
+        :return: The value of the attribute.
+        :raises AttributeError: if the lines do not set the attribute.
+        """
+        key = self._attribute_keys.get(attribute, attribute)
+        text = '\n'.join(self._lines[number] for number in self._index.get(key, ()))
+        return getattr(FileParser(text).securitytxt, attribute)
@@ -0,0 +1,99 @@
+import asyncio
+from typing import Iterable, AsyncIterator, Tuple, Union, Dict, Optional
+
+import aiohttp
+
+from securitytxt.parsers.async_url_parser import AsyncURLParser
+from securitytxt.securitytxt import SecurityTXT
+
+
+class AsyncBulkURLParser:
+    """The asyncio counterpart of the BulkURLParser. It looks for security.txt files on many URLs concurrently on one
+    event loop, sharing a single aiohttp session. Iterating over the parser with 'async for' yields a (url, result)
+    tuple per url as soon as its lookup has finished, where the result is either the SecurityTXT found or the exception
+    raised while looking for it. The input iterable is consumed lazily, so at most max_concurrency lookups are in
+    flight.
+
+    Attributes:
+        :class default_max_concurrency: the default number of lookups in flight.
+        :class caught_exceptions: the exceptions that are returned as a result instead of being raised.
+        urls: the urls to look up.
+        max_concurrency: the number of lookups that run at the same time.
+        strict_url: passed on to the AsyncURLParser for every url.
+        session: the aiohttp session used for the requests. If not given, one is created while iterating.
+        url_parser_kwargs: additional keyword arguments passed on to the AsyncURLParser for every url.
+
+    Public methods:
+        None
+    """
+    default_max_concurrency: int = 100
+    caught_exceptions = (FileNotFoundError, AttributeError, ValueError, aiohttp.ClientError, asyncio.TimeoutError)
+
+    def __init__(self, urls: Iterable[str], max_concurrency: Optional[int] = None, strict_url: bool = False,
+                 session: Optional[aiohttp.ClientSession] = None, **url_parser_kwargs):
+        """Initialize the variables."""
+        self.urls: Iterable[str] = urls
+        self.max_concurrency: int = max_concurrency if max_concurrency else self.default_max_concurrency
+        self.strict_url: bool = strict_url
+        self.session: Optional[aiohttp.ClientSession] = session
+        self.url_parser_kwargs: Dict = url_parser_kwargs
+
+    async def __aiter__(self) -> AsyncIterator[Tuple[str, Union[SecurityTXT, Exception]]]:
+        """
+        Run the lookups and yield the results in the order in which they finish.
+        :return: An asynchronous iterator of (url, SecurityTXT or exception) tuples.
+        """
+        if self.session:
+            async for result in self._run(self.session):
+                yield result
+        else:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            async with aiohttp.ClientSession(connector=connector) as session:
+                async for result in self._run(session):
+                    yield result
+
+    async def _run(self, session: aiohttp.ClientSession) -> AsyncIterator[Tuple[str, Union[SecurityTXT, Exception]]]:
+        """
+        Run the lookups on the given session and yield the results in the order in which they finish.
+        :param session: The session to use for the requests.
+        :return: An asynchronous iterator of (url, SecurityTXT or exception) tuples.
+        """
+        urls = iter(self.urls)
+        pending: Dict[asyncio.Task, str] = {}
+        try:
+            self._fill(session, urls, pending)
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield pending.pop(task), self._get_result(task)
+                self._fill(session, urls, pending)
+        finally:
+            # If the caller stops iterating early, cancel the lookups that are still running
+            for task in pending:
+                task.cancel()
+
+    def _fill(self, session: aiohttp.ClientSession, urls: Iterable[str], pending: Dict[asyncio.Task, str]) -> None:
+        """
+        Take urls from the input and start their lookups, until max_concurrency lookups are in flight or the input is
+        exhausted.
+        :param session: The session to use for the requests.
+        :param urls: The iterator of urls still to look up.
+        :param pending: The tasks that are in flight, mapped to their url. New tasks are added to this dict.
+        """
+        while len(pending) < self.max_concurrency:
+            url = next(urls, None)
+            if url is None:
+                return
+            parser = AsyncURLParser(url, self.strict_url, session=session, **self.url_parser_kwargs)
+            pending[asyncio.ensure_future(parser.parse())] = url
+
+    def _get_result(self, task: asyncio.Task) -> Union[SecurityTXT, Exception]:
+        """
+        Get the result of a finished lookup. Expected exceptions are returned instead of raised.
+        :param task: The finished lookup.
+        :return: The SecurityTXT found, or the exception raised during the lookup.
+        """
+        try:
+            return task.result()
+        except self.caught_exceptions as e:
+            return e
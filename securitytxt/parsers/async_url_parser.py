@@ -0,0 +1,149 @@
+import asyncio
+from time import monotonic
+from typing import Optional, List, Dict, Union, Callable
+
+import aiohttp
+
+from securitytxt.parsers.base_url_parser import BaseURLParser
+from securitytxt.parsers.negative_cache import NegativeCache
+from securitytxt.parsers.parse_memo import ParseMemo
+from securitytxt.parsers.probe_stats import ProbeEvent, ProbeRecord
+from securitytxt.securitytxt import SecurityTXT
+
+
+class AsyncURLParser(BaseURLParser):
+    """The asyncio counterpart of the URLParser. It looks for security.txt files on the same paths, in the same order,
+    and rejects the same responses as the URLParser, but fetches them with aiohttp. Since the lookup has to be awaited,
+    creating an object of the parser does not parse the url: await the parse method instead.
+
+    Attributes:
+        :class caught_exceptions: the exceptions of a request after which the next url is probed, the aiohttp
+        counterparts of the caught_exceptions of the URLParser.
+        url: the url to look for a security.txt on.
+        session: the aiohttp session used for the requests. If not given, a session is created for every lookup.
+        securitytxt: the resulting securitytxt after parsing.
+        strict_url: Whether to actively look for a securitytxt on the domain of the url, or whether to 'strictly' use
+        the provided url. Default is False.
+        timeout: The timeout of each request, as an aiohttp.ClientTimeout or a total number of seconds. If not given,
+        the timeout of the session is used.
+        negative_cache: If set, hosts without a security.txt are remembered, and looking them up again raises a
+        FileNotFoundError without sending any request. See URLParser. Default is None.
+        circuit_breaker: If True, the remaining urls are not probed when the host could not be resolved, and the
+        remaining urls with the same scheme and port are not probed when the host refused the connection on that port.
+        Default is False.
+        detect_encoding: Whether to detect the charset of a file that has no charset in its Content-Type and is not
+        valid UTF-8. See BytesParser. Default is False.
+        parse_memo: If set, files that are identical to a file parsed before are not parsed again. See ParseMemo.
+        on_probe: If set, it is called with a ProbeEvent for every url that is requested. Default is None.
+
+    Public methods:
+        parse: Look for a security.txt on the url and parse it (coroutine)
+
+    Raises:
+        :raises FileNotFoundError: if no security.txt could be found on the url.
+    """
+    caught_exceptions = (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError)
+
+    def __init__(self, url: str, strict_url: bool = False, possible_paths: Optional[List[str]] = None,
+                 headers: Optional[Dict] = None, possible_schemes: Optional[List[str]] = None,
+                 allow_redirects: bool = True, session: Optional[aiohttp.ClientSession] = None,
+                 timeout: Optional[Union[float, aiohttp.ClientTimeout]] = None,
+                 negative_cache: Optional[NegativeCache] = None, circuit_breaker: bool = False,
+                 detect_encoding: bool = False, parse_memo: Optional[ParseMemo] = None,
+                 on_probe: Optional[Callable[[ProbeEvent], None]] = None):
+        """Initialize the variables."""
+        self.url: str = url
+        self.session: Optional[aiohttp.ClientSession] = session
+        if timeout is not None and not isinstance(timeout, aiohttp.ClientTimeout):
+            timeout = aiohttp.ClientTimeout(total=timeout)
+        self.timeout: Optional[aiohttp.ClientTimeout] = timeout
+        self.negative_cache: Optional[NegativeCache] = negative_cache
+        self.circuit_breaker: bool = circuit_breaker
+        self._configure(strict_url, possible_paths, headers, possible_schemes, allow_redirects, detect_encoding,
+                        parse_memo, on_probe)
+
+    async def parse(self) -> SecurityTXT:
+        """
+        Look for security.txt files on the domain and parse if one is found.
+        :return: A SecurityTXT object, that represents the securitytxt found.
+        :raises FileNotFoundError: if no security.txt could be found on the url.
+        :raises AttributeError: if a security.txt has been found, but could not be parsed.
+        """
+        if self.session:
+            await self._parse(self.session, self.url)
+        else:
+            async with aiohttp.ClientSession() as session:
+                await self._parse(session, self.url)
+        return self.securitytxt
+
+    async def _parse(self, session: aiohttp.ClientSession, url: str) -> None:
+        """
+        Look for security.txt files on the domain and parse if one is found.
+        :param session: The session to use for the requests.
+        :param url: The url to search for a security.txt.
+        :raises FileNotFoundError: if no security.txt could be found on the url.
+        """
+        netloc = self._check_negative_cache(url)
+        file_urls = self._get_possible_file_urls(url)
+        for file_url in file_urls:
+            if self._skip(file_url):
+                continue
+            if await self._parse_file_url(session, file_url):
+                return
+            if self._unreachable():
+                break
+        self._not_found(url, netloc, file_urls)
+
+    async def _parse_file_url(self, session: aiohttp.ClientSession, file_url: str) -> bool:
+        """
+        Given a URL to (possibly) a security.txt file, get the file and parse it into a securityTXT object.
+        :param session: The session to use for the request.
+        :param file_url: A URL to location where a security.txt might be located.
+        :returns True if a file has been found and parsed. False otherwise.
+        :raises AttributeError: if the file could not be parsed.
+        """
+        try:
+            file = await self._get_file(session, file_url)
+        except self.caught_exceptions as e:
+            self._failed(file_url, e)
+            return False
+        self._set_securitytxt(file, file_url)
+        return True
+
+    async def _get_file(self, session: aiohttp.ClientSession, url: str) -> SecurityTXT:
+        """
+        Get a file from the URL, check if it could be a security.txt file and parse it. If on_probe is set, it is called
+        with the outcome of the probe.
+        :param session: The session to use for the request.
+        :param url: A URL to location where a security.txt might be located.
+        :return: The parsed SecurityTXT.
+        :raises ConnectionError: If the URL does not contain a security.txt
+        :raises AttributeError: If the file could not be parsed.
+        """
+        if self.on_probe is None:
+            return await self._fetch_file(session, url)
+        probe = self._probes.current = ProbeRecord(url)
+        try:
+            securitytxt = await self._fetch_file(session, url)
+        except Exception as e:
+            self.on_probe(probe.event(e))
+            raise
+        self.on_probe(probe.event())
+        return securitytxt
+
+    async def _fetch_file(self, session: aiohttp.ClientSession, url: str) -> SecurityTXT:
+        """
+        Get a file from the URL, check if it could be a security.txt file and parse it.
+        :param session: The session to use for the request.
+        :param url: A URL to location where a security.txt might be located.
+        :return: The parsed SecurityTXT.
+        :raises ConnectionError: If the URL does not contain a security.txt
+        :raises AttributeError: If the file could not be parsed.
+        """
+        # Without a timeout, the timeout of the session applies, so it is only passed if it is set
+        timeout = {'timeout': self.timeout} if self.timeout is not None else {}
+        async with session.get(url, headers=self.headers, allow_redirects=self.allow_redirects, **timeout) as response:
+            self._record(status=response.status, request_time=monotonic() - self._probes.current.start
+                         if self.on_probe is not None else None)
+            return self._parse_content(url, response.ok, response.status, await response.read(),
+                                       response.headers.get('Content-Type', ''))
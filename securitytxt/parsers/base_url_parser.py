@@ -0,0 +1,233 @@
+from time import monotonic
+from threading import local, Lock
+from typing import Optional, List, Dict, Tuple, Callable
+
+from urllib.parse import urlparse
+
+from securitytxt.parsers.bytes_parser import BytesParser
+from securitytxt.parsers.file_parser import FileParser
+from securitytxt.parsers.negative_cache import NegativeCache
+from securitytxt.parsers.parse_memo import ParseMemo
+from securitytxt.parsers.probe_stats import ProbeEvent
+from securitytxt.securitytxt import SecurityTXT
+
+
+class BaseURLParser:
+    """The base class of the URLParser and the AsyncURLParser. It determines which urls are probed for a security.txt,
+    which responses are rejected, and what is remembered about a host that has none. The subclasses send the requests.
+
+    Attributes:
+        :class possible_paths: the paths where to look for a security.txt on a domain. Overridable in the __init__.
+        :class headers: the headers for the request. Overridable in the __init__.
+        :class possible_schemes: the schemes with which the paths are requested. Overridable in the __init__.
+        :class not_found_status_codes: the status codes that show that a url has no security.txt, as opposed to a
+        failure that may be transient.
+        securitytxt: the resulting securitytxt after parsing.
+        strict_url: Whether to actively look for a securitytxt on the domain of the url, or whether to 'strictly' use
+        the provided url.
+        negative_cache: If set, hosts without a security.txt are remembered. See NegativeCache.
+        circuit_breaker: If True, urls on a host that cannot be reached are not probed.
+
+    Public methods:
+        None
+    """
+    possible_paths = ['/.well-known/security.txt', '/security.txt']
+    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 6.0; WOW64; rv:24.0) Gecko/20100101 Firefox/24.0'}
+    possible_schemes = ["https", "http"]
+    not_found_status_codes = (404, 410)
+
+    def _configure(self, strict_url: bool, possible_paths: Optional[List[str]], headers: Optional[Dict],
+                   possible_schemes: Optional[List[str]], allow_redirects: bool, detect_encoding: bool,
+                   parse_memo: Optional[ParseMemo], on_probe: Optional[Callable[[ProbeEvent], None]]) -> None:
+        """Set the variables that determine where and how to look for a security.txt."""
+        self.securitytxt: Optional[SecurityTXT] = None
+        self.strict_url = strict_url
+        self.possible_paths = possible_paths if possible_paths else self.possible_paths
+        self.headers = headers if headers else self.headers
+        self.possible_schemes = possible_schemes if possible_schemes else self.possible_schemes
+        self.allow_redirects = allow_redirects
+        self.detect_encoding = detect_encoding
+        self.parse_memo = parse_memo
+        self.on_probe = on_probe
+        # The probe in progress per thread, since the urls may be probed concurrently
+        self._probes = local()
+        # The number of probes that showed that there is no security.txt at their url, see _miss
+        self._misses: int = 0
+        self._misses_lock = Lock()
+        # Whether the host could not be resolved, and the (scheme, port) pairs on which it refused the connection
+        self._dns_failure: bool = False
+        self._refused: set = set()
+
+    def _get_possible_file_urls(self, base_url: str) -> List[str]:
+        """
+        Returns all the possible urls where a security.txt could be located according to the draft RFC, section 4.
+        If strict_url has been set, it simply returns the given URL.
+        :param base_url: The base url.
+        :return: A list of URLS where the security.txt could be located. If strict_url is True, it returns a list
+        containing only the given url.
+        """
+        if self.strict_url:
+            return [base_url]
+        normalized_url = self._normalize_url(base_url)
+        parsed_url = urlparse(normalized_url)
+        return [f"{scheme}://{parsed_url.netloc}{path}"
+                for path in self.possible_paths
+                for scheme in self.possible_schemes]
+
+    def _normalize_url(self, url: str) -> str:
+        """
+        Normalize a url for further processing, e.g. add slashes for urlparse
+        :param url: The url to normalize
+        :return: The normalized url.
+        """
+        return url if '//' in url else f"//{url}"
+
+    def _check_negative_cache(self, url: str) -> str:
+        """
+        Look up the host of a url in the negative cache, if it is set.
+        :param url: The url to search for a security.txt.
+        :return: The netloc of the url.
+        :raises FileNotFoundError: if the host is remembered as not having a security.txt.
+        """
+        netloc = urlparse(self._normalize_url(url)).netloc
+        outcome = self.negative_cache.get(netloc) if self.negative_cache is not None else None
+        if outcome and (outcome != NegativeCache.NOT_FOUND or not self.strict_url):
+            raise FileNotFoundError(f"No SecurityTXT File found on this url: {url} ({outcome}, cached)")
+        return netloc
+
+    def _not_found(self, url: str, netloc: str, file_urls: List[str]) -> None:
+        """
+        Remember the host in the negative cache, if it is set and the probes showed that the host has no security.txt.
+        :param url: The url that was searched for a security.txt.
+        :param netloc: The netloc of the url.
+        :param file_urls: The urls that have been probed.
+        :raises FileNotFoundError: always.
+        """
+        if self.negative_cache is not None:
+            # A host is only remembered as not having a security.txt if every url was a definite miss, and not if a
+            # request failed for a reason that may be transient, such as a timeout or a server error. A refused
+            # connection only applies to one port, so the host is only remembered if every url was refused.
+            outcome = None
+            if self._dns_failure:
+                outcome = NegativeCache.DNS_FAILURE
+            elif all(self._endpoint(file_url) in self._refused for file_url in file_urls):
+                outcome = NegativeCache.CONNECTION_REFUSED
+            elif not self.strict_url and self._misses == len(file_urls):
+                outcome = NegativeCache.NOT_FOUND
+            if outcome:
+                self.negative_cache.set(netloc, outcome)
+        raise FileNotFoundError(f"No SecurityTXT File found on this url: {url}")
+
+    def _skip(self, file_url: str) -> bool:
+        """
+        Whether a url is not probed, because the circuit breaker is set and the host refused the connection on the
+        scheme and port of the url.
+        :param file_url: The url.
+        :return: True if the url is not probed.
+        """
+        return self.circuit_breaker and self._endpoint(file_url) in self._refused
+
+    def _unreachable(self) -> bool:
+        """
+        Whether the remaining urls are not probed, because the circuit breaker is set and the host could not be
+        resolved.
+        :return: True if the remaining urls are not probed.
+        """
+        return self.circuit_breaker and self._dns_failure
+
+    def _failed(self, file_url: str, exception: Exception) -> None:
+        """
+        Remember why the request of a url failed, if the host could not be resolved or refused the connection.
+        :param file_url: The url of the failed request.
+        :param exception: The exception raised by the request.
+        """
+        outcome = NegativeCache.classify(exception)
+        if outcome == NegativeCache.DNS_FAILURE:
+            self._dns_failure = True
+        elif outcome == NegativeCache.CONNECTION_REFUSED:
+            self._refused.add(self._endpoint(file_url))
+
+    @staticmethod
+    def _endpoint(file_url: str) -> Tuple[str, int]:
+        """
+        Get the scheme and port that a url is requested on.
+        :param file_url: The url.
+        :return: The scheme and the port of the url, which defaults to the port of the scheme.
+        """
+        parsed_url = urlparse(file_url)
+        return parsed_url.scheme, parsed_url.port or (443 if parsed_url.scheme == 'https' else 80)
+
+    def _set_securitytxt(self, securitytxt: SecurityTXT, file_url: str) -> None:
+        """
+        Set a parsed security.txt file as the resulting securitytxt.
+        :param securitytxt: The parsed security.txt file.
+        :param file_url: The URL the file was retrieved from.
+        """
+        self.securitytxt = securitytxt
+        self.securitytxt.source_url = file_url
+
+    def _parse_content(self, url: str, ok: bool, status_code: int, content: bytes, content_type: str) -> SecurityTXT:
+        """
+        Decode the content of a response, check if it could be a security.txt file and parse it.
+        :param url: The URL the response was retrieved from.
+        :param ok: Whether the response has a successful status code.
+        :param status_code: The status code of the response.
+        :param content: The content of the response.
+        :param content_type: The Content-Type header of the response.
+        :return: The parsed SecurityTXT.
+        :raises ConnectionError: If the response is not a security.txt
+        :raises AttributeError: If the file could not be parsed.
+        """
+        self._record(size=len(content), downloaded=monotonic())
+        start = monotonic() if self.on_probe is not None else 0.0
+        text, encoding, decoding = BytesParser.decode(content, BytesParser.get_charset(content_type),
+                                                      self.detect_encoding)
+        text = self._check_file(url, ok, status_code, text)
+        try:
+            securitytxt = self.parse_memo.parse(text) if self.parse_memo is not None else FileParser(text).securitytxt
+        finally:
+            self._record(parse_time=monotonic() - start if self.on_probe is not None else 0.0)
+        securitytxt.encoding = encoding
+        securitytxt.decoding = decoding
+        return securitytxt
+
+    def _check_file(self, url: str, ok: bool, status_code: int, text: str) -> str:
+        """
+        Check if a response could be a security.txt file.
+        :param url: The URL the response was retrieved from.
+        :param ok: Whether the response has a successful status code.
+        :param status_code: The status code of the response.
+        :param text: The text of the response.
+        :return: The text of a security.txt
+        :raises ConnectionError: If the response is not a security.txt
+        """
+        if not ok:
+            if status_code in self.not_found_status_codes:
+                self._miss(ProbeEvent.NON_SUCCESSFUL)
+            else:
+                self._record(outcome=ProbeEvent.NON_SUCCESSFUL)
+            raise ConnectionError(f"Url {url} returned non-successful status code {status_code}")
+        if '<htm' in text:
+            self._miss(ProbeEvent.HTML)
+            raise ConnectionError(f"Url {url} returned an HTML-page")
+        return text
+
+    def _miss(self, outcome: str) -> None:
+        """
+        Count a probe that showed that there is no security.txt at its url, because the url was not found or is an
+        HTML-page, and record its outcome.
+        :param outcome: The outcome of the probe.
+        """
+        with self._misses_lock:
+            self._misses += 1
+        self._record(outcome=outcome)
+
+    def _record(self, **values) -> None:
+        """
+        Record values on the probe in progress, if on_probe is set.
+        :param values: The values to set on the ProbeRecord.
+        """
+        probe = getattr(self._probes, 'current', None) if self.on_probe is not None else None
+        if probe is not None:
+            for key, value in values.items():
+                setattr(probe, key, value)
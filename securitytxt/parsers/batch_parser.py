@@ -0,0 +1,124 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from itertools import islice
+from typing import Iterable, Iterator, Tuple, Union, Dict, List, Optional
+
+from securitytxt.compact_securitytxt import CompactSecurityTXT
+from securitytxt.parsers.file_parser import FileParser
+
+
+class BatchParser:
+    """Takes an iterable of security.txt texts and parses them on a pool of worker processes. The texts are sent to the
+    workers in chunks, and every worker sends back a CompactSecurityTXT per text, without the raw text: the caller
+    already has it, and leaving it out keeps the results small to pickle. Iterating over the parser yields an
+    (index, result) tuple per text, where the index is the position of the text in the input and the result is either
+    the CompactSecurityTXT or the AttributeError or ValueError raised while parsing the text. The input iterable is
+    consumed lazily, so only a bounded number of chunks is in flight at any moment.
+
+    Attributes:
+        :class default_chunksize: the default number of texts per chunk.
+        :class caught_exceptions: the exceptions that are returned as a result instead of being raised.
+        texts: the texts to parse.
+        processes: the number of worker processes. If 1, the texts are parsed in the current process.
+        chunksize: the number of texts sent to a worker at once.
+        ordered: whether the results are yielded in input order, or as soon as their chunk has been parsed.
+        keep_raw: whether to send the raw texts back with the results.
+        max_pending: the maximum number of chunks that have been taken from the input but have not been yielded yet.
+
+    Public methods:
+        None
+    """
+    default_chunksize: int = 256
+    caught_exceptions = (AttributeError, ValueError)
+
+    def __init__(self, texts: Iterable[str], processes: Optional[int] = None, chunksize: Optional[int] = None,
+                 ordered: bool = True, keep_raw: bool = False, max_pending: Optional[int] = None):
+        """Initialize the variables."""
+        self.texts: Iterable[str] = texts
+        self.processes: Optional[int] = processes
+        self.chunksize: int = chunksize if chunksize else self.default_chunksize
+        self.ordered: bool = ordered
+        self.keep_raw: bool = keep_raw
+        self.max_pending: Optional[int] = max_pending
+
+    def __iter__(self) -> Iterator[Tuple[int, Union[CompactSecurityTXT, Exception]]]:
+        """
+        Parse the texts and yield the results.
+        :return: An iterator of (index, CompactSecurityTXT or exception) tuples.
+        """
+        chunks = self._chunks()
+        if self.processes == 1:
+            for start, texts in chunks:
+                yield from enumerate(self._parse_chunk(texts, self.keep_raw), start)
+            return
+        with ProcessPoolExecutor(max_workers=self.processes) as executor:
+            max_pending = self.max_pending if self.max_pending else 2 * (self.processes or os.cpu_count() or 1)
+            pending: Dict[Future, int] = {}
+            finished: Dict[int, List] = {}
+            next_start = 0
+            try:
+                self._fill(executor, chunks, pending, max_pending)
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finished[pending.pop(future)] = future.result()
+                    if not self.ordered:
+                        for start in list(finished):
+                            yield from enumerate(finished.pop(start), start)
+                    # In order, a chunk can only be yielded when all the chunks before it have been yielded
+                    while next_start in finished:
+                        results = finished.pop(next_start)
+                        yield from enumerate(results, next_start)
+                        next_start += len(results)
+                    self._fill(executor, chunks, pending, max_pending - len(finished))
+            finally:
+                # If the caller stops iterating early, do not start the chunks that are still queued
+                for future in pending:
+                    future.cancel()
+
+    def _chunks(self) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Split the input into chunks.
+        :return: An iterator of (index of the first text, texts) tuples.
+        """
+        texts = iter(self.texts)
+        start = 0
+        while True:
+            chunk = list(islice(texts, self.chunksize))
+            if not chunk:
+                return
+            yield start, chunk
+            start += len(chunk)
+
+    def _fill(self, executor: ProcessPoolExecutor, chunks: Iterator[Tuple[int, List[str]]], pending: Dict[Future, int],
+              max_pending: int) -> None:
+        """
+        Take chunks from the input and submit them to the pool, until max_pending chunks are in flight or the input is
+        exhausted.
+        :param executor: The pool to submit the chunks to.
+        :param chunks: The iterator of chunks still to parse.
+        :param pending: The futures that are in flight, mapped to the index of their first text. New futures are added
+        to this dict.
+        :param max_pending: The maximum number of chunks in flight.
+        """
+        while len(pending) < max_pending:
+            start, texts = next(chunks, (None, None))
+            if texts is None:
+                return
+            pending[executor.submit(self._parse_chunk, texts, self.keep_raw)] = start
+
+    @staticmethod
+    def _parse_chunk(texts: List[str], keep_raw: bool) -> List[Union[CompactSecurityTXT, Exception]]:
+        """
+        Parse a chunk of texts. Runs in a worker process.
+        :param texts: The texts to parse.
+        :param keep_raw: Whether to keep the raw texts in the results.
+        :return: A CompactSecurityTXT per text, or the exception raised while parsing it.
+        """
+        results: List[Union[CompactSecurityTXT, Exception]] = []
+        for text in texts:
+            try:
+                results.append(CompactSecurityTXT.from_securitytxt(FileParser(text).securitytxt, keep_raw))
+            except BatchParser.caught_exceptions as e:
+                results.append(e)
+        return results
@@ -0,0 +1,107 @@
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Iterable, Iterator, Tuple, Union, Dict, Optional
+
+from requests import exceptions
+
+from securitytxt.parsers.http_session import create_session
+from securitytxt.parsers.url_parser import URLParser
+from securitytxt.securitytxt import SecurityTXT
+
+
+class BulkURLParser:
+    """Takes an iterable of URLs and looks for security.txt files on all of them concurrently, using a bounded pool of
+    worker threads. Iterating over the parser yields a (url, result) tuple per url as soon as its lookup has finished,
+    where the result is either the SecurityTXT found or the exception raised while looking for it. The input iterable is
+    consumed lazily, so only a bounded number of urls is in flight at any moment.
+
+    Attributes:
+        :class default_max_workers: the default number of worker threads.
+        :class caught_exceptions: the exceptions that are returned as a result instead of being raised.
+        urls: the urls to look up.
+        max_workers: the number of worker threads, i.e. the number of lookups that run at the same time.
+        max_pending: the maximum number of urls that have been taken from the input but have not been yielded yet.
+        strict_url: passed on to the URLParser for every url.
+        url_parser_kwargs: additional keyword arguments passed on to the URLParser for every url. If no session is
+        given, a session with a connection pool sized to max_workers and max_pending is created while iterating, shared
+        by all lookups, and closed when the iteration ends.
+
+    Public methods:
+        None
+    """
+    default_max_workers: int = 16
+    caught_exceptions = (FileNotFoundError, AttributeError, ValueError, exceptions.RequestException)
+
+    def __init__(self, urls: Iterable[str], max_workers: Optional[int] = None, strict_url: bool = False,
+                 max_pending: Optional[int] = None, **url_parser_kwargs):
+        """Initialize the variables."""
+        self.urls: Iterable[str] = urls
+        self.max_workers: int = max_workers if max_workers else self.default_max_workers
+        self.max_pending: int = max_pending if max_pending else 2 * self.max_workers
+        self.strict_url: bool = strict_url
+        self.url_parser_kwargs: Dict = url_parser_kwargs
+
+    def __iter__(self) -> Iterator[Tuple[str, Union[SecurityTXT, Exception]]]:
+        """
+        Run the lookups on the worker pool and yield the results in the order in which they finish.
+        :return: An iterator of (url, SecurityTXT or exception) tuples.
+        """
+        urls = iter(self.urls)
+        pending: Dict[Future, str] = {}
+        url_parser_kwargs = self.url_parser_kwargs
+        session = None
+        if not url_parser_kwargs.get('session'):
+            session = create_session(pool_connections=self.max_pending, pool_maxsize=self.max_workers)
+            url_parser_kwargs = dict(url_parser_kwargs, session=session)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                try:
+                    self._fill(executor, urls, pending, url_parser_kwargs)
+                    while pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield pending.pop(future), self._get_result(future)
+                        self._fill(executor, urls, pending, url_parser_kwargs)
+                finally:
+                    # If the caller stops iterating early, do not start the lookups that are still queued
+                    for future in pending:
+                        future.cancel()
+        finally:
+            # The pool has waited for the running lookups, so a session created by the parser is no longer used
+            if session is not None:
+                session.close()
+
+    def _fill(self, executor: ThreadPoolExecutor, urls: Iterator[str], pending: Dict[Future, str],
+              url_parser_kwargs: Dict) -> None:
+        """
+        Take urls from the input and submit them to the pool, until max_pending urls are in flight or the input is
+        exhausted.
+        :param executor: The pool to submit the lookups to.
+        :param urls: The iterator of urls still to look up.
+        :param pending: The futures that are in flight, mapped to their url. New futures are added to this dict.
+        :param url_parser_kwargs: The keyword arguments passed on to the URLParser.
+        """
+        while len(pending) < self.max_pending:
+            url = next(urls, None)
+            if url is None:
+                return
+            pending[executor.submit(self._lookup, url, url_parser_kwargs)] = url
+
+    def _lookup(self, url: str, url_parser_kwargs: Dict) -> SecurityTXT:
+        """
+        Look for a security.txt on a single url.
+        :param url: The url to look up.
+        :param url_parser_kwargs: The keyword arguments passed on to the URLParser.
+        :return: The SecurityTXT found on the url.
+        """
+        return URLParser(url, self.strict_url, **url_parser_kwargs).securitytxt
+
+    def _get_result(self, future: Future) -> Union[SecurityTXT, Exception]:
+        """
+        Get the result of a finished lookup. Expected exceptions are returned instead of raised.
+        :param future: The finished lookup.
+        :return: The SecurityTXT found, or the exception raised during the lookup.
+        """
+        try:
+            return future.result()
+        except self.caught_exceptions as e:
+            return e
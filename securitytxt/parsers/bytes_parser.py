@@ -0,0 +1,89 @@
+from re import compile, IGNORECASE
+from typing import Optional, Tuple
+
+from securitytxt.parsers.file_parser import FileParser
+from securitytxt.securitytxt import SecurityTXT
+
+
+class BytesParser:
+    """Takes the raw bytes of a security.txt file, decodes them and parses the resulting text. Creating an object of the
+    parser immediately parses the given bytes. The draft RFC requires security.txt files to be UTF-8 encoded, so the
+    bytes are decoded as UTF-8 unless a charset is given. Charset detection is slow, and only used when requested.
+    The decoding that was used is set on the resulting securitytxt.
+
+    Attributes:
+        :class DECODING_CHARSET: the decoding when the given charset was used.
+        :class DECODING_UTF8: the decoding when the bytes were valid UTF-8 (optionally with a byte order mark).
+        :class DECODING_DETECTED: the decoding when the charset was detected.
+        :class DECODING_FALLBACK: the decoding when none of the above worked and the fallback encoding was used.
+        :class fallback_encoding: the encoding used if everything else fails. It can decode any sequence of bytes.
+        text: the decoded text.
+        encoding: the encoding that was used to decode the bytes.
+        decoding: how the encoding was chosen, one of the DECODING_* values.
+        securitytxt: the resulting securitytxt after parsing.
+
+    Public methods:
+        decode: Decode bytes according to the decoding policy (static method)
+        get_charset: Get the charset from a Content-Type header (static method)
+
+    Raises:
+        :raises AttributeError: if the format of the file is invalid.
+    """
+    DECODING_CHARSET: str = 'charset'
+    DECODING_UTF8: str = 'utf-8'
+    DECODING_DETECTED: str = 'detected'
+    DECODING_FALLBACK: str = 'fallback'
+
+    fallback_encoding: str = 'iso-8859-1'
+    _charset_pattern = compile(r'charset\s*=\s*["\']?([^"\';\s]+)', IGNORECASE)
+
+    def __init__(self, data: bytes, charset: Optional[str] = None, detect_encoding: bool = False):
+        """
+        Decode the bytes and run the parser.
+        :param data: The bytes to parse.
+        :param charset: (optional) The charset to decode with, for example from the Content-Type header.
+        :param detect_encoding: Whether to detect the charset if the bytes are not valid UTF-8.
+        :raises AttributeError: if the file does not has an incorrect format.
+        """
+        self.text, self.encoding, self.decoding = self.decode(data, charset, detect_encoding)
+        self.securitytxt: SecurityTXT = FileParser(self.text).securitytxt
+        self.securitytxt.encoding = self.encoding
+        self.securitytxt.decoding = self.decoding
+
+    @staticmethod
+    def decode(data: bytes, charset: Optional[str] = None, detect_encoding: bool = False) -> Tuple[str, str, str]:
+        """
+        Decode bytes. The given charset is tried first, then UTF-8, then charset detection if requested, and finally
+        the fallback encoding.
+        :param data: The bytes to decode.
+        :param charset: (optional) The charset to decode with.
+        :param detect_encoding: Whether to detect the charset if the bytes are not valid UTF-8.
+        :return: A tuple of the text, the encoding used, and how that encoding was chosen.
+        """
+        if charset:
+            try:
+                return str(data, charset), charset.lower(), BytesParser.DECODING_CHARSET
+            except (LookupError, UnicodeDecodeError):
+                pass
+        try:
+            if data.startswith(b'\xef\xbb\xbf'):
+                return str(data, 'utf-8-sig'), 'utf-8-sig', BytesParser.DECODING_UTF8
+            return str(data, 'utf-8'), 'utf-8', BytesParser.DECODING_UTF8
+        except UnicodeDecodeError:
+            pass
+        if detect_encoding:
+            from charset_normalizer import from_bytes
+            match = from_bytes(data).best()
+            if match:
+                return str(match), match.encoding, BytesParser.DECODING_DETECTED
+        return str(data, BytesParser.fallback_encoding), BytesParser.fallback_encoding, BytesParser.DECODING_FALLBACK
+
+    @staticmethod
+    def get_charset(content_type: Optional[str]) -> Optional[str]:
+        """
+        Get the charset from a Content-Type header.
+        :param content_type: The value of the Content-Type header.
+        :return: The charset, or None if the header does not specify one.
+        """
+        match = BytesParser._charset_pattern.search(content_type) if content_type else None
+        return match.group(1) if match else None
@@ -0,0 +1,98 @@
+import mmap
+from struct import Struct
+from typing import Iterable, Iterator, Tuple, Union
+
+from securitytxt.parsers.stream_parser import StreamParser
+from securitytxt.securitytxt import SecurityTXT
+
+
+class CorpusReader:
+    """Reads an archive of security.txt files, for example a crawl stored for later analysis. The archive is a
+    concatenation of records, where every record is the length of the body as a 4-byte big-endian unsigned integer,
+    followed by the body itself (UTF-8 encoded). The archive is memory-mapped and every body is parsed line by line from
+    the mapping, so the archive is never loaded as a whole and the memory used does not grow with its size. Iterating
+    over the reader yields an (index, result) tuple per record, where the result is either the SecurityTXT or the
+    AttributeError or ValueError raised while parsing the body.
+
+    Attributes:
+        :class length_format: the struct format of the length prefix of a record.
+        :class caught_exceptions: the exceptions that are returned as a result instead of being raised.
+        path: the path of the archive.
+        keep_raw: whether to set the raw text on the securitytxts.
+
+    Public methods:
+        bodies: Iterate over the bodies in the archive
+        write: Write bodies to an archive (static method)
+
+    Raises:
+        :raises ValueError: if the archive is truncated.
+    """
+    length_format = Struct('>I')
+    caught_exceptions = (AttributeError, ValueError)
+
+    def __init__(self, path: str, keep_raw: bool = True):
+        """Initialize the variables."""
+        self.path: str = path
+        self.keep_raw: bool = keep_raw
+
+    def __iter__(self) -> Iterator[Tuple[int, Union[SecurityTXT, Exception]]]:
+        """
+        Parse the bodies in the archive.
+        :return: An iterator of (index, SecurityTXT or exception) tuples.
+        :raises ValueError: if the archive is truncated.
+        """
+        for index, (buffer, start, end) in enumerate(self._records()):
+            try:
+                yield index, StreamParser(StreamParser.buffer_lines(buffer, start, end), self.keep_raw).securitytxt
+            except self.caught_exceptions as e:
+                # The traceback refers to the lines of the mapping, which could then not be closed
+                yield index, e.with_traceback(None)
+
+    def bodies(self) -> Iterator[bytes]:
+        """
+        Iterate over the bodies in the archive, for example to pass them on to SecurityTXT.parse_many. Only the body
+        that is yielded is copied into memory.
+        :return: An iterator of the bodies.
+        :raises ValueError: if the archive is truncated.
+        """
+        return (buffer[start:end] for buffer, start, end in self._records())
+
+    @staticmethod
+    def write(path: str, bodies: Iterable[Union[str, bytes]]) -> int:
+        """
+        Write bodies to an archive that can be read by the CorpusReader.
+        :param path: The path of the archive. An existing file is overwritten.
+        :param bodies: The bodies to write. Strings are encoded as UTF-8.
+        :return: The number of records written.
+        """
+        records = 0
+        with open(path, 'wb') as archive:
+            for body in bodies:
+                body = body.encode('utf-8') if isinstance(body, str) else body
+                archive.write(CorpusReader.length_format.pack(len(body)))
+                archive.write(body)
+                records += 1
+        return records
+
+    def _records(self) -> Iterator[Tuple[mmap.mmap, int, int]]:
+        """
+        Memory-map the archive and locate the records.
+        :return: An iterator of (mapping, start, end) tuples, where start and end are the positions of a body.
+        :raises ValueError: if the archive is truncated.
+        """
+        with open(self.path, 'rb') as archive:
+            if not archive.seek(0, 2):
+                return
+            with mmap.mmap(archive.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                if hasattr(buffer, 'madvise'):
+                    buffer.madvise(mmap.MADV_SEQUENTIAL)
+                position, size = 0, len(buffer)
+                while position < size:
+                    start = position + self.length_format.size
+                    if start > size:
+                        raise ValueError(f"The archive is truncated at position {position}")
+                    end = start + self.length_format.unpack_from(buffer, position)[0]
+                    if end > size:
+                        raise ValueError(f"The archive is truncated at position {position}")
+                    yield buffer, start, end
+                    position = end
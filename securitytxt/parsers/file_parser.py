@@ -1,3 +1,5 @@
+from typing import Iterable
+
 from securitytxt.parsers.textparsers.comment_line_parser import CommentLineParser
 from securitytxt.parsers.textparsers.field_line_parser import FieldLineParser
 from securitytxt.parsers.textparsers.signed_text_parser import SignedTextParser
@@ -16,6 +18,10 @@ class FileParser:
     Raises:
         :raises AttributeError: if the format of the file is invalid.
     """
+    # The fields that are always a list on the securitytxt, so values can be appended directly
+    _list_fields = frozenset(FieldLineParser.uri_fields)
+    _datetime_fields = frozenset(FieldLineParser.datetime_fields)
+
     def __init__(self, text: str):
         """
         Initialize SecurityTXT and run the parser to fill this object
@@ -60,34 +66,42 @@ class FileParser:
         Parse an unsigned security.txt file
         :param unsigned_text: the unsigned text to parse
         """
-        for line in unsigned_text.splitlines():
-            self._parse_line(line)
+        self._parse_lines(unsigned_text.splitlines())
 
-    def _parse_line(self, line: str) -> None:
-        """
-        Parse a line in a security.txt file
-        :param line: a line from the file
-        """
-        if FieldLineParser.is_field(line):
-            self._parse_field(line)
-        elif CommentLineParser.is_comment(line):
-            self._parse_comment(line)
+    def _parse_lines(self, lines: Iterable[str]) -> None:
+        """
+        Parse the lines of an unsigned security.txt file in a single pass. Every line is classified once, and the value
+        of a field is parsed by the value parser for its key, without creating a line parser object per line.
+        :param lines: the lines to parse, without line endings
+        """
+        comments = self.securitytxt.comments
+        comment_identifier = CommentLineParser.comment_identifier
+        comment_characters = comment_identifier + ' '
+        field_separator = FieldLineParser.field_separator
+        for line in lines:
+            if line.lstrip().startswith(comment_identifier):
+                comments.append(line.lstrip(comment_characters))
+            elif field_separator in line:
+                self._parse_field(line)
 
     def _parse_field(self, line: str) -> None:
         """
-        Parse a field line
+        Parse a field line. Fields with an empty key or value are ignored.
         :param line: The line to parse
         """
+        key, value = line.split(FieldLineParser.field_separator, 1)
+        key = FieldLineParser.normalize_key(key)
+        if key in self._datetime_fields:
+            value, datetime_format = FieldLineParser.parse_datetime(value)
+            setattr(self.securitytxt, f"{key}_format", datetime_format)
+        else:
+            value = FieldLineParser.parse_value(key, value)
+        if not key or not value:
+            return
+        if key in self._list_fields:
+            getattr(self.securitytxt, key).append(value)
+            return
         try:
-            field = FieldLineParser(line)
-            self.securitytxt.add_field(field.key, field.value)
+            self.securitytxt.add_field(key, value)
         except AttributeError:
             pass
-
-    def _parse_comment(self, line: str) -> None:
-        """
-        Parse a comment
-        :param line: The comment
-        """
-        comment = CommentLineParser(line)
-        self.securitytxt.comments.append(comment.comment)
@@ -0,0 +1,97 @@
+import pickle
+from time import time
+from typing import Optional, NamedTuple, Dict
+
+from securitytxt.parsers.sqlite_cache import SQLiteCache
+from securitytxt.securitytxt import SecurityTXT
+
+
+class CacheEntry(NamedTuple):
+    """A cached security.txt: the parsed file and the validators to revalidate it with."""
+    securitytxt: SecurityTXT
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    @property
+    def conditional_headers(self) -> Dict[str, str]:
+        """The headers for a conditional request, that returns 304 Not Modified if the file has not changed."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HTTPCache(SQLiteCache):
+    """A persistent cache of parsed security.txt files, keyed by the url of the file and stored in an SQLite database.
+    An URLParser with a cache sends a conditional request for a cached url, and uses the cached SecurityTXT without
+    parsing if the server answers 304 Not Modified. An entry is dropped after the ttl, or when the security.txt expires
+    if that is earlier. When the entries together are larger than max_size, the least recently used ones are evicted.
+    Only use a cache file that you trust, since the entries are pickled.
+
+    Attributes:
+        :class default_max_size: the default maximum size of all entries together, in bytes.
+        :class default_ttl: the default maximum age of an entry, in seconds.
+        path: the path to the database file. ':memory:' keeps the cache in memory.
+        max_size: the maximum size of all entries together, in bytes.
+        ttl: the maximum age of an entry, in seconds.
+
+    Public methods:
+        get: Get the cache entry of a url, if it is present and fresh.
+        set: Store a parsed security.txt and its validators.
+        delete: Remove the cache entry of a url.
+        clear: Remove all cache entries.
+        close: Close the database.
+    """
+    table: str = 'entries'
+    default_max_size: int = 64 * 1024 * 1024
+    default_ttl: float = 7 * 24 * 60 * 60
+
+    def __init__(self, path: str = ':memory:', max_size: Optional[int] = None, ttl: Optional[float] = None):
+        """Initialize the variables and create the database if it does not exist."""
+        self.ttl: float = ttl if ttl else self.default_ttl
+        super().__init__(path, max_size,
+                         "CREATE TABLE IF NOT EXISTS entries (url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+                         "data BLOB, size INTEGER, expires_at REAL, last_access REAL)",
+                         "CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """
+        Get the cache entry of a url.
+        :param url: The url of the security.txt file.
+        :return: The cache entry, or None if the url is not cached or the entry is no longer fresh.
+        """
+        now = time()
+        with self._lock, self._connection:
+            row = self._connection.execute("SELECT etag, last_modified, data, expires_at FROM entries WHERE url = ?",
+                                           (url,)).fetchone()
+            if not row:
+                return None
+            etag, last_modified, data, expires_at = row
+            if expires_at <= now:
+                self._remove(url)
+                return None
+            self._connection.execute("UPDATE entries SET last_access = ? WHERE url = ?", (now, url))
+        return CacheEntry(pickle.loads(data), etag, last_modified)
+
+    def set(self, url: str, securitytxt: SecurityTXT, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
+        """
+        Store a parsed security.txt. It is only stored if there is a validator to revalidate it with.
+        :param url: The url of the security.txt file.
+        :param securitytxt: The parsed security.txt.
+        :param etag: The ETag header of the response.
+        :param last_modified: The Last-Modified header of the response.
+        """
+        if not etag and not last_modified:
+            return
+        now = time()
+        expires_at = now + self.ttl
+        if securitytxt.expires:
+            expires_at = min(expires_at, securitytxt.expires.timestamp())
+        if expires_at <= now:
+            return
+        data = pickle.dumps(securitytxt, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self._connection:
+            self._store(url, len(data), (url, etag, last_modified, data, len(data), expires_at, now))
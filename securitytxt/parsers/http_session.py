@@ -0,0 +1,63 @@
+from threading import Lock
+from typing import Optional, Union
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """An HTTPAdapter that applies a default timeout to every request that does not set its own timeout.
+
+    Attributes:
+        timeout: the default timeout in seconds, or a (connect timeout, read timeout) tuple. None means no timeout.
+
+    Public methods:
+        send: Send a request, using the default timeout if none is given.
+    """
+
+    def __init__(self, timeout: Optional[Union[float, tuple]] = None, **kwargs):
+        """Initialize the variables. Other keyword arguments are passed on to the HTTPAdapter."""
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        """Send a request, using the default timeout if none is given. See HTTPAdapter.send."""
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def create_session(pool_connections: int = 10, pool_maxsize: int = 10, max_retries: Union[int, Retry] = 0,
+                   timeout: Optional[Union[float, tuple]] = None) -> Session:
+    """
+    Create a requests session with a connection pool, to share between URLParsers. Connections are kept alive and
+    reused, both between the probes on a single host and between lookups of the same host.
+    :param pool_connections: The number of hosts for which a connection pool is kept.
+    :param pool_maxsize: The maximum number of connections kept per host.
+    :param max_retries: The number of retries, or a urllib3 Retry object for finer control.
+    :param timeout: The default timeout in seconds, or a (connect timeout, read timeout) tuple.
+    :return: A requests session.
+    """
+    session = Session()
+    adapter = TimeoutHTTPAdapter(timeout=timeout, pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                 max_retries=max_retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_default_session: Optional[Session] = None
+_default_session_lock = Lock()
+
+
+def get_default_session() -> Session:
+    """
+    Get the session that is shared by all URLParsers that are not given a session. It is created on first use.
+    :return: The shared requests session.
+    """
+    global _default_session
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = create_session()
+        return _default_session
@@ -0,0 +1,101 @@
+from time import time
+from typing import Optional, NamedTuple
+
+from securitytxt.parsers.sqlite_cache import SQLiteCache
+
+
+class KeyEntry(NamedTuple):
+    """A cached key: its fingerprint and the ASCII-armored public key. Both are None for a url that did not serve a
+    usable key."""
+    fingerprint: Optional[str]
+    armored: Optional[str]
+
+
+class KeyCache(SQLiteCache):
+    """A persistent cache of OpenPGP public keys, keyed by the url the key was fetched from and stored in an SQLite
+    database. Keys can be looked up by url or by fingerprint, so a key that is referenced by several Encryption urls is
+    found whichever url is used. Urls that did not serve a usable key are cached as well, for a shorter time, so they
+    are not requested for every file that refers to them. An entry is dropped after the ttl. When the entries together
+    are larger than max_size, the least recently used ones are evicted.
+
+    Attributes:
+        :class default_max_size: the default maximum size of all entries together, in bytes.
+        :class default_ttl: the default time in seconds for which a key is kept.
+        :class default_missing_ttl: the default time in seconds for which a url without a usable key is remembered.
+        path: the path of the database file, or ':memory:' for a cache that is not persisted.
+        max_size: the maximum size of all entries together, in bytes.
+        ttl: the time in seconds for which a key is kept.
+        missing_ttl: the time in seconds for which a url without a usable key is remembered.
+
+    Public methods:
+        get: Get the cached key of a url, if it is present and fresh.
+        get_by_fingerprint: Get a cached key by its fingerprint.
+        set: Store the key fetched from a url.
+        delete: Remove the cache entry of a url.
+        clear: Remove all cache entries.
+        close: Close the database.
+    """
+    table: str = 'keys'
+    default_max_size: int = 16 * 1024 * 1024
+    default_ttl: float = 7 * 24 * 60 * 60
+    default_missing_ttl: float = 60 * 60
+
+    def __init__(self, path: str = ':memory:', max_size: Optional[int] = None, ttl: Optional[float] = None,
+                 missing_ttl: Optional[float] = None):
+        """Initialize the variables and create the database if it does not exist."""
+        self.ttl: float = ttl if ttl else self.default_ttl
+        self.missing_ttl: float = missing_ttl if missing_ttl else self.default_missing_ttl
+        super().__init__(path, max_size,
+                         "CREATE TABLE IF NOT EXISTS keys (url TEXT PRIMARY KEY, fingerprint TEXT, armored TEXT, "
+                         "size INTEGER, expires_at REAL, last_access REAL)",
+                         "CREATE INDEX IF NOT EXISTS keys_fingerprint ON keys (fingerprint)",
+                         "CREATE INDEX IF NOT EXISTS keys_last_access ON keys (last_access)")
+
+    def get(self, url: str) -> Optional[KeyEntry]:
+        """
+        Get the cached key of a url.
+        :param url: The url the key was fetched from.
+        :return: The cache entry, or None if the url is not cached or the entry is no longer fresh.
+        """
+        now = time()
+        with self._lock, self._connection:
+            row = self._connection.execute("SELECT fingerprint, armored, expires_at FROM keys WHERE url = ?",
+                                           (url,)).fetchone()
+            if not row:
+                return None
+            fingerprint, armored, expires_at = row
+            if expires_at <= now:
+                self._remove(url)
+                return None
+            self._connection.execute("UPDATE keys SET last_access = ? WHERE url = ?", (now, url))
+        return KeyEntry(fingerprint, armored)
+
+    def get_by_fingerprint(self, fingerprint: str) -> Optional[str]:
+        """
+        Get a cached key by its fingerprint, whichever url it was fetched from.
+        :param fingerprint: The fingerprint of the key, in uppercase hexadecimal without spaces, or its key id: the
+        last 16 digits of the fingerprint.
+        :return: The ASCII-armored key, or None if no fresh entry has this fingerprint.
+        """
+        if len(fingerprint) == 16:
+            condition, value = "substr(fingerprint, -16) = ?", fingerprint
+        else:
+            condition, value = "fingerprint = ?", fingerprint
+        with self._lock:
+            row = self._connection.execute(f"SELECT armored FROM keys WHERE {condition} AND armored IS NOT NULL "
+                                           "AND expires_at > ? ORDER BY last_access DESC LIMIT 1",
+                                           (value, time())).fetchone()
+        return row[0] if row else None
+
+    def set(self, url: str, fingerprint: Optional[str], armored: Optional[str]) -> None:
+        """
+        Store the key fetched from a url.
+        :param url: The url the key was fetched from.
+        :param fingerprint: The fingerprint of the key, or None if the url did not serve a usable key.
+        :param armored: The ASCII-armored key, or None if the url did not serve a usable key.
+        """
+        now = time()
+        expires_at = now + (self.ttl if fingerprint else self.missing_ttl)
+        size = len(url) + len(armored or '')
+        with self._lock, self._connection:
+            self._store(url, size, (url, fingerprint, armored, size, expires_at, now))
@@ -0,0 +1,58 @@
+from securitytxt.lazy_securitytxt import LazySecurityTXT
+from securitytxt.parsers.file_parser import FileParser
+from securitytxt.parsers.textparsers.comment_line_parser import CommentLineParser
+from securitytxt.parsers.textparsers.field_line_parser import FieldLineParser
+
+
+class LazyFileParser(FileParser):
+    """Takes a security.txt file and indexes its lines by their key, without parsing the values. The values are parsed
+    when the fields of the resulting LazySecurityTXT are accessed. The signature of a signed file is split off
+    immediately. Creating an object of the parser immediately indexes the given file.
+
+    Attributes:
+        securitytxt: the resulting securitytxt after indexing.
+
+    Public methods:
+        None
+
+    Raises:
+        :raises AttributeError: if the format of the file is invalid.
+    """
+    # The fields that are set when the securitytxt is created, and are therefore not parsed lazily
+    _eager_fields = ('raw', 'source_url', 'signature')
+
+    def __init__(self, text: str):
+        """
+        Initialize LazySecurityTXT and run the parser to fill this object
+        :param text: The text to parse
+        :raises AttributeError: if the file does not has an incorrect format.
+        """
+        self.securitytxt: LazySecurityTXT = LazySecurityTXT(raw=text)
+        self._parse(text)
+
+    def _parse_unsigned(self, unsigned_text: str) -> None:
+        """
+        Index the lines of an unsigned security.txt file by their normalized key.
+        :param unsigned_text: the unsigned text to index
+        """
+        lines = unsigned_text.splitlines()
+        index = {}
+        # Most files repeat a handful of keys, so every distinct raw key is normalized only once
+        normalized_keys = {}
+        comment_identifier = CommentLineParser.comment_identifier
+        field_separator = FieldLineParser.field_separator
+        for number, line in enumerate(lines):
+            if line.lstrip().startswith(comment_identifier):
+                key = 'comments'
+            elif field_separator in line:
+                raw_key = line[:line.index(field_separator)]
+                key = normalized_keys.get(raw_key)
+                if key is None:
+                    key = normalized_keys[raw_key] = FieldLineParser.normalize_key(raw_key)
+            else:
+                continue
+            index.setdefault(key, []).append(number)
+        self.securitytxt._lines, self.securitytxt._index = lines, index
+        for key in self._eager_fields:
+            for number in index.get(key, ()):
+                self._parse_field(lines[number])
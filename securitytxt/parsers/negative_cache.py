@@ -0,0 +1,108 @@
+import socket
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Optional, Tuple
+
+
+class NegativeCache:
+    """A bounded in-memory cache of hosts on which no security.txt could be found, keyed by the netloc of the host. An
+    URLParser with a negative cache raises a FileNotFoundError for a cached host without sending any request. Each
+    outcome has its own ttl: a missing file is remembered longer than a host that could not be resolved or refused the
+    connection. When the cache is full, the least recently used entries are evicted.
+
+    Attributes:
+        :class NOT_FOUND: the outcome for a host that does not have a security.txt.
+        :class DNS_FAILURE: the outcome for a host that could not be resolved.
+        :class CONNECTION_REFUSED: the outcome for a host that refused the connection.
+        :class default_max_entries: the default maximum number of cached hosts.
+        max_entries: the maximum number of cached hosts.
+        ttls: the number of seconds an outcome is remembered, per outcome.
+        hits: the number of lookups of a host that was cached.
+        misses: the number of lookups of a host that was not cached.
+
+    Public methods:
+        get: Get the cached outcome of a host.
+        set: Remember the outcome of a host.
+        delete: Forget the outcome of a host.
+        classify: Determine the outcome of a failed request (static method)
+    """
+    NOT_FOUND: str = 'not_found'
+    DNS_FAILURE: str = 'dns_failure'
+    CONNECTION_REFUSED: str = 'connection_refused'
+
+    default_max_entries: int = 100000
+
+    def __init__(self, max_entries: Optional[int] = None, not_found_ttl: float = 24 * 60 * 60,
+                 dns_failure_ttl: float = 60 * 60, connection_refused_ttl: float = 10 * 60):
+        """Initialize the variables."""
+        self.max_entries: int = max_entries if max_entries else self.default_max_entries
+        self.ttls = {self.NOT_FOUND: not_found_ttl, self.DNS_FAILURE: dns_failure_ttl,
+                     self.CONNECTION_REFUSED: connection_refused_ttl}
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: 'OrderedDict[str, Tuple[str, float]]' = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """The number of cached hosts."""
+        return len(self._entries)
+
+    def get(self, netloc: str) -> Optional[str]:
+        """
+        Get the cached outcome of a host, and count the lookup as a hit or a miss.
+        :param netloc: The netloc of the host.
+        :return: The outcome, or None if the host is not cached or its entry has expired.
+        """
+        with self._lock:
+            outcome, expires_at = self._entries.get(netloc, (None, 0.0))
+            if outcome and expires_at > monotonic():
+                self._entries.move_to_end(netloc)
+                self.hits += 1
+                return outcome
+            self._entries.pop(netloc, None)
+            self.misses += 1
+            return None
+
+    def set(self, netloc: str, outcome: str) -> None:
+        """
+        Remember the outcome of a host.
+        :param netloc: The netloc of the host.
+        :param outcome: One of NOT_FOUND, DNS_FAILURE or CONNECTION_REFUSED.
+        """
+        with self._lock:
+            self._entries[netloc] = (outcome, monotonic() + self.ttls[outcome])
+            self._entries.move_to_end(netloc)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, netloc: str) -> None:
+        """
+        Forget the outcome of a host.
+        :param netloc: The netloc of the host.
+        """
+        with self._lock:
+            self._entries.pop(netloc, None)
+
+    @staticmethod
+    def classify(exception: BaseException) -> Optional[str]:
+        """
+        Determine whether a request failed because the host could not be resolved or refused the connection. The
+        underlying socket error is looked up through the exceptions that requests and urllib3 wrap around it.
+        :param exception: The exception raised by the request.
+        :return: DNS_FAILURE, CONNECTION_REFUSED, or None if the request failed for another reason.
+        """
+        seen = set()
+        exceptions = [exception]
+        while exceptions:
+            current = exceptions.pop()
+            if not isinstance(current, BaseException) or id(current) in seen:
+                continue
+            seen.add(id(current))
+            if isinstance(current, socket.gaierror):
+                return NegativeCache.DNS_FAILURE
+            if isinstance(current, ConnectionRefusedError):
+                return NegativeCache.CONNECTION_REFUSED
+            exceptions.extend([current.__cause__, current.__context__, getattr(current, 'reason', None)])
+            exceptions.extend(arg for arg in current.args if isinstance(arg, BaseException))
+        return None
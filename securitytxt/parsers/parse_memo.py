@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+from typing import Optional
+
+from securitytxt.parsers.file_parser import FileParser
+from securitytxt.securitytxt import SecurityTXT
+
+
+class ParseMemo:
+    """A bounded in-memory memo of parsed security.txt files, keyed by a hash of their text. Many hosts serve
+    byte-identical files, such as the subdomains of an organisation or a vendor template, and those are parsed only
+    once. Every lookup returns a copy of the memoized SecurityTXT, so the caller can set for example the source_url
+    without affecting other results. The copies share the raw text with the memoized SecurityTXT. When the memo is full,
+    the least recently used entries are evicted. Files that could not be parsed are not memoized.
+
+    Attributes:
+        :class default_max_entries: the default maximum number of memoized files.
+        max_entries: the maximum number of memoized files.
+        hits: the number of texts that were memoized.
+        misses: the number of texts that had to be parsed.
+        dedup_ratio: the number of texts looked up per text parsed.
+
+    Public methods:
+        parse: Parse a text, or get the memoized result
+        digest: Compute the hash of a text by which it is memoized (static method)
+        copy: Copy a SecurityTXT or CompactSecurityTXT, including its lists (static method)
+
+    Raises:
+        :raises AttributeError: if the format of a file is invalid.
+    """
+    default_max_entries: int = 10000
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """Initialize the variables."""
+        self.max_entries: int = max_entries if max_entries else self.default_max_entries
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: 'OrderedDict[str, SecurityTXT]' = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """The number of memoized files."""
+        return len(self._entries)
+
+    @property
+    def dedup_ratio(self) -> float:
+        """The number of texts looked up per text parsed, or 1.0 if nothing has been parsed yet."""
+        return (self.hits + self.misses) / self.misses if self.misses else 1.0
+
+    def parse(self, text: str) -> SecurityTXT:
+        """
+        Parse a text, or get a copy of the memoized SecurityTXT if the same text has been parsed before.
+        :param text: The text to parse.
+        :return: The parsed SecurityTXT.
+        :raises AttributeError: if the file does not have a valid format.
+        """
+        digest = self.digest(text)
+        with self._lock:
+            securitytxt = self._entries.get(digest)
+            if securitytxt is not None:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return self.copy(securitytxt)
+            self.misses += 1
+        securitytxt = FileParser(text).securitytxt
+        with self._lock:
+            self._entries[digest] = securitytxt
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return self.copy(securitytxt)
+
+    @staticmethod
+    def digest(text: str) -> str:
+        """
+        Compute the hash of a text by which it is memoized.
+        :param text: The text.
+        :return: The hexadecimal hash.
+        """
+        return blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+    @staticmethod
+    def copy(securitytxt: SecurityTXT) -> SecurityTXT:
+        """
+        Copy a SecurityTXT, or a CompactSecurityTXT. The lists, and the dictionary of unknown fields of a
+        CompactSecurityTXT, are copied, the other values are shared.
+        :param securitytxt: The SecurityTXT to copy.
+        :return: The copy.
+        """
+        cls = type(securitytxt)
+        copy = cls.__new__(cls)
+        if hasattr(securitytxt, '__dict__'):
+            copy.__dict__.update({key: list(value) if type(value) is list else value
+                                  for key, value in vars(securitytxt).items()})
+            return copy
+        for key in cls.__slots__:
+            try:
+                value = object.__getattribute__(securitytxt, key)
+            except AttributeError:
+                continue
+            if type(value) is dict:
+                value = {name: list(item) if type(item) is list else item for name, item in value.items()}
+            object.__setattr__(copy, key, value)
+        return copy
@@ -0,0 +1,219 @@
+import gzip
+import ipaddress
+from collections import OrderedDict
+from struct import Struct
+from threading import Lock
+from time import time
+from typing import Optional, List, Tuple
+from urllib.parse import urlparse, ParseResult
+
+
+class ProbeOrder:
+    """A memory of the url at which the security.txt of a host was found, so that url is requested first when the host
+    is looked up again. Hosts that only serve /security.txt, or only plain http, otherwise pay for the misses before
+    the hit on every lookup. The memory is keyed by netloc. If the remembered url misses, the other urls are requested
+    in the usual order. The memory can be saved to a compact file.
+
+    A url is only learned when all urls that come before it in the usual order have missed on that host, so trying it
+    first chooses the same file as the usual order, as long as the host does not start serving a file at one of those
+    urls. To notice that, a url is trusted for max_age seconds after it was learned, after which the host is probed in
+    the usual order again. Two options save more probes, but may choose a different file than the usual order:
+    with trust_remembered, every hit on a remembered url extends the time it is trusted, so a file with a higher
+    priority that has appeared keeps being missed; with by_domain, the url is also remembered per registrable domain,
+    and a new host of a known domain is probed in the order that worked for another host of the domain. That host may
+    serve a file with a higher priority as well, which is then not chosen.
+
+    Attributes:
+        :class default_max_entries: the default maximum number of remembered hosts and domains.
+        :class default_max_age: the default number of seconds a learned url is trusted.
+        :class second_level_labels: labels below a two-letter top-level domain that are treated as part of the suffix
+        when determining the registrable domain, as in example.co.uk.
+        by_domain: whether to remember the url per registrable domain as well, and request it first on other hosts of
+        the domain. This may choose a lower-priority file on those hosts.
+        max_entries: the maximum number of remembered hosts and domains.
+        max_age: the number of seconds a learned url is trusted.
+        trust_remembered: whether a hit on a remembered url extends the time it is trusted.
+        hits: the number of lookups in which the remembered url was requested first and had the file.
+        misses: the number of lookups in which the remembered url was requested first and did not have the file.
+        probes_saved: the number of requests saved compared to the usual order. A miss costs a request.
+
+    Public methods:
+        order: Order the urls to probe for a host, with the remembered url first
+        update: Learn from the result of a lookup
+        registrable_domain: Determine the registrable domain of a hostname (class method)
+        save: Save the memory to a file
+        load: Load the memory from a file (class method)
+
+    Raises:
+        :raises ValueError: if a memory file is invalid.
+    """
+    default_max_entries: int = 1000000
+    default_max_age: float = 30 * 24 * 60 * 60
+    second_level_labels = frozenset(['ac', 'co', 'com', 'edu', 'gov', 'net', 'or', 'org'])
+
+    _magic = b'STXPORD1'
+    _record = Struct('>IHBH')
+
+    def __init__(self, by_domain: bool = False, max_entries: Optional[int] = None, max_age: Optional[float] = None,
+                 trust_remembered: bool = False):
+        """Initialize the variables."""
+        self.by_domain: bool = by_domain
+        self.max_entries: int = max_entries if max_entries else self.default_max_entries
+        self.max_age: float = max_age if max_age else self.default_max_age
+        self.trust_remembered: bool = trust_remembered
+        self.hits: int = 0
+        self.misses: int = 0
+        self.probes_saved: int = 0
+        # Per netloc, or per registrable domain prefixed with a dot, the scheme and path of the file and when it was
+        # learned
+        self._entries: 'OrderedDict[str, Tuple[str, str, float]]' = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """The number of remembered hosts and domains."""
+        return len(self._entries)
+
+    def order(self, file_urls: List[str]) -> List[str]:
+        """
+        Order the urls to probe for a host, with the remembered url first and the others in the given order.
+        :param file_urls: The urls where the security.txt of a host may be located, in the usual order.
+        :return: The urls in the order in which to probe them.
+        """
+        remembered = self._remembered(file_urls)
+        if remembered is None:
+            return file_urls
+        return [file_urls[remembered]] + file_urls[:remembered] + file_urls[remembered + 1:]
+
+    def update(self, file_urls: List[str], ordered_urls: List[str], found_url: Optional[str]) -> None:
+        """
+        Learn from the result of a lookup.
+        :param file_urls: The urls where the security.txt of the host may be located, in the usual order.
+        :param ordered_urls: The urls in the order in which they were probed, as returned by order.
+        :param found_url: The url at which the security.txt was found, or None if it was not found.
+        """
+        reordered = ordered_urls[0] != file_urls[0]
+        keys = self._keys(urlparse(file_urls[0]))
+        with self._lock:
+            if found_url is None:
+                if reordered:
+                    self.misses += 1
+                self._entries.pop(keys[0], None)
+                return
+            index = file_urls.index(found_url)
+            probed = ordered_urls.index(found_url)
+            self.probes_saved += index - probed
+            if reordered:
+                if probed == 0:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            if index == 0:
+                for key in keys:
+                    self._entries.pop(key, None)
+                return
+            # A url is learned only if all urls with a higher priority have been requested and missed
+            if set(file_urls[:index]) <= set(ordered_urls[:probed]) or self.trust_remembered:
+                parsed_url = urlparse(found_url)
+                for key in keys:
+                    self._entries[key] = (parsed_url.scheme, parsed_url.path, time())
+                    self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    @classmethod
+    def registrable_domain(cls, hostname: str) -> Optional[str]:
+        """
+        Determine the registrable domain of a hostname, such as example.com for www.example.com. This is an
+        approximation that does not use the Public Suffix List: it is the last two labels, or the last three if the
+        top-level domain has two letters and the label before it is a common second-level label, as in example.co.uk.
+        :param hostname: The hostname.
+        :return: The registrable domain, or None for an IP address or a hostname with a single label.
+        """
+        hostname = hostname.rstrip('.').lower()
+        try:
+            ipaddress.ip_address(hostname)
+            return None
+        except ValueError:
+            pass
+        labels = hostname.split('.')
+        if len(labels) < 2:
+            return None
+        size = 3 if len(labels[-1]) == 2 and labels[-2] in cls.second_level_labels and len(labels) > 2 else 2
+        return '.'.join(labels[-size:])
+
+    def save(self, path: str) -> None:
+        """
+        Save the memory to a gzip-compressed file. The times at which the urls were learned are stored in whole seconds.
+        :param path: The path of the file. An existing file is overwritten.
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+        with gzip.open(path, 'wb') as memory:
+            memory.write(self._magic)
+            for key, (scheme, file_path, learned_at) in entries:
+                encoded = [value.encode('utf-8') for value in (key, scheme, file_path)]
+                memory.write(self._record.pack(min(max(int(learned_at), 0), 2 ** 32 - 1), *map(len, encoded)))
+                memory.write(b''.join(encoded))
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> 'ProbeOrder':
+        """
+        Load the memory from a file created by save.
+        :param path: The path of the file.
+        :param kwargs: The keyword arguments for the memory, such as by_domain.
+        :return: The memory.
+        :raises ValueError: if the file is not a valid memory file.
+        """
+        probe_order = cls(**kwargs)
+        with gzip.open(path, 'rb') as memory:
+            if memory.read(len(cls._magic)) != cls._magic:
+                raise ValueError(f"{path} is not a probe order file")
+            while True:
+                header = memory.read(cls._record.size)
+                if not header:
+                    break
+                if len(header) < cls._record.size:
+                    raise ValueError(f"{path} is truncated")
+                learned_at, *lengths = cls._record.unpack(header)
+                data = memory.read(sum(lengths))
+                if len(data) < sum(lengths):
+                    raise ValueError(f"{path} is truncated")
+                key = data[:lengths[0]].decode('utf-8')
+                scheme = data[lengths[0]:lengths[0] + lengths[1]].decode('utf-8')
+                file_path = data[lengths[0] + lengths[1]:].decode('utf-8')
+                probe_order._entries[key] = (scheme, file_path, float(learned_at))
+        return probe_order
+
+    def _remembered(self, file_urls: List[str]) -> Optional[int]:
+        """
+        Find the remembered url of a host among the urls to probe, by netloc or else by registrable domain.
+        :param file_urls: The urls where the security.txt of the host may be located, in the usual order.
+        :return: The index of the remembered url, or None if no url is remembered or it is not one of the urls.
+        """
+        parsed_urls = [urlparse(file_url) for file_url in file_urls]
+        now = time()
+        with self._lock:
+            for key in self._keys(parsed_urls[0]):
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                scheme, path, learned_at = entry
+                if learned_at + self.max_age <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                for index, parsed_url in enumerate(parsed_urls):
+                    if parsed_url.scheme == scheme and parsed_url.path == path:
+                        return index
+                return None
+        return None
+
+    def _keys(self, parsed_url: ParseResult) -> List[str]:
+        """
+        Get the keys under which the url of a host is remembered: its netloc, and its registrable domain prefixed with
+        a dot if by_domain is set.
+        :param parsed_url: One of the urls of the host.
+        :return: The keys, the netloc first.
+        """
+        domain = self.registrable_domain(parsed_url.hostname or '') if self.by_domain else None
+        return [parsed_url.netloc, f".{domain}"] if domain else [parsed_url.netloc]
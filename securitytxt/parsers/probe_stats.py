@@ -0,0 +1,139 @@
+from bisect import bisect_left
+from collections import Counter
+from threading import Lock
+from time import monotonic
+from typing import Optional, NamedTuple, Dict, List, Tuple, Any
+from urllib.parse import urlparse
+
+
+class ProbeEvent(NamedTuple):
+    """The outcome and timing of a single probe, that is, a request for a url where a security.txt might be located. An
+    URLParser with an on_probe callback calls it with an event for every probe. The request time is the time until
+    the headers of the response were received, so it includes resolving the host, connecting and the TLS handshake.
+    The download time is the time to read the body after that, and the parse time the time to decode and parse it."""
+    FOUND = 'found'
+    NOT_MODIFIED = 'not_modified'
+    NON_SUCCESSFUL = 'non_successful'
+    HTML = 'html'
+    TOO_LARGE = 'too_large'
+    TOO_SLOW = 'too_slow'
+    PARSE_ERROR = 'parse_error'
+    REQUEST_ERROR = 'request_error'
+
+    url: str
+    scheme: str
+    path: str
+    outcome: str
+    status: Optional[int]
+    size: int
+    request_time: float
+    download_time: float
+    parse_time: float
+    elapsed: float
+    error: Optional[BaseException]
+
+
+class ProbeRecord:
+    """The mutable record of a probe that is in progress, from which the ProbeEvent is created when it has finished."""
+    __slots__ = ('url', 'start', 'outcome', 'status', 'size', 'request_time', 'downloaded', 'parse_time')
+
+    def __init__(self, url: str):
+        """Start the probe."""
+        self.url: str = url
+        self.start: float = monotonic()
+        self.outcome: Optional[str] = None
+        self.status: Optional[int] = None
+        self.size: int = 0
+        self.request_time: Optional[float] = None
+        self.downloaded: Optional[float] = None
+        self.parse_time: float = 0.0
+
+    def event(self, error: Optional[BaseException] = None) -> ProbeEvent:
+        """
+        Finish the probe.
+        :param error: The exception that ended the probe, if any.
+        :return: The event of the probe.
+        """
+        elapsed = monotonic() - self.start
+        request_time = self.request_time if self.request_time is not None else elapsed
+        download_time = max(self.downloaded - self.start - request_time, 0.0) if self.downloaded is not None else 0.0
+        outcome = self.outcome
+        if not outcome:
+            outcome = ProbeEvent.FOUND if error is None else \
+                ProbeEvent.PARSE_ERROR if isinstance(error, AttributeError) else ProbeEvent.REQUEST_ERROR
+        url = urlparse(self.url)
+        return ProbeEvent(self.url, url.scheme, url.path, outcome, self.status, self.size, request_time, download_time,
+                          self.parse_time, elapsed, error)
+
+
+class ProbeStats:
+    """An aggregating collector of probe events, that can be passed as the on_probe callback of one or many URLParsers,
+    for example through SecurityTXT.from_urls. It counts the probes per outcome and per status code, and keeps a
+    latency histogram per phase, with cumulative buckets so they can be exported to most metrics systems as they are.
+
+    Attributes:
+        :class default_buckets: the default upper bounds of the histogram buckets, in seconds.
+        :class phases: the phases that have a histogram: request, download, parse and the total elapsed time.
+        buckets: the upper bounds of the histogram buckets, in seconds.
+        probes: the number of probes.
+        size: the total number of bytes received.
+        outcomes: the number of probes per outcome.
+        statuses: the number of probes per status code.
+
+    Public methods:
+        snapshot: Get all statistics as a dictionary
+        reset: Reset all statistics
+    """
+    default_buckets: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    phases: Tuple[str, ...] = ('request', 'download', 'parse', 'elapsed')
+
+    def __init__(self, buckets: Optional[Tuple[float, ...]] = None):
+        """Initialize the variables."""
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets)) if buckets else self.default_buckets
+        self._lock = Lock()
+        self.reset()
+
+    def __call__(self, event: ProbeEvent) -> None:
+        """
+        Add a probe event to the statistics.
+        :param event: The event.
+        """
+        with self._lock:
+            self.probes += 1
+            self.size += event.size
+            self.outcomes[event.outcome] += 1
+            if event.status is not None:
+                self.statuses[event.status] += 1
+            for phase in self.phases:
+                seconds = getattr(event, phase if phase == 'elapsed' else f"{phase}_time")
+                self._counts[phase][bisect_left(self.buckets, seconds)] += 1
+                self._sums[phase] += seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get all statistics.
+        :return: A dictionary with the number of probes, the bytes received, the counts per outcome and per status
+        code, and per phase a histogram with the cumulative count per bucket (the last bucket is +Inf), the sum of the
+        times and the count.
+        """
+        with self._lock:
+            histograms = {}
+            for phase in self.phases:
+                cumulative, total = [], 0
+                for count in self._counts[phase]:
+                    total += count
+                    cumulative.append(total)
+                histograms[phase] = {'buckets': list(zip(self.buckets + (float('inf'),), cumulative)),
+                                     'sum': self._sums[phase], 'count': total}
+            return {'probes': self.probes, 'size': self.size, 'outcomes': dict(self.outcomes),
+                    'statuses': dict(self.statuses), 'histograms': histograms}
+
+    def reset(self) -> None:
+        """Reset all statistics."""
+        with self._lock:
+            self.probes: int = 0
+            self.size: int = 0
+            self.outcomes: Counter = Counter()
+            self.statuses: Counter = Counter()
+            self._counts: Dict[str, List[int]] = {phase: [0] * (len(self.buckets) + 1) for phase in self.phases}
+            self._sums: Dict[str, float] = {phase: 0.0 for phase in self.phases}
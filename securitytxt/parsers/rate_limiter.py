@@ -0,0 +1,235 @@
+import socket
+from collections import OrderedDict
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from threading import Lock, BoundedSemaphore
+from time import monotonic, sleep, time
+from typing import Optional, Dict, Iterator, Any, Tuple
+from urllib.parse import urlparse
+
+from requests import Response
+
+
+class RateLimiter:
+    """Paces the requests of URLParsers that share it, for scans of many hosts. Every request takes a token from the
+    bucket of its netloc and from the bucket of the IP address the host resolves to, so hosts behind the same CDN or
+    hosting IP are paced together, and at most max_in_flight requests are sent at the same time. A host that answers
+    429 Too Many Requests, or 503 Service Unavailable with a Retry-After header, is not requested again until the
+    Retry-After time has passed. If that time is more than max_retry_after seconds away, requests to the host fail at
+    once instead of waiting.
+
+    A request waits only for its own buckets: the buckets reserve a start time per request, so a throttled host does not
+    delay the requests to other hosts. The threads of a throttled host do sleep, so use more workers than max_in_flight
+    to keep the other hosts busy. The in-flight slot is held until the response headers have been received. A request
+    that had to wait for a slot reserves a new start time once it has one, so the requests to a host that were waiting
+    for slots are not sent at once when slots become free.
+
+    Attributes:
+        :class default_host_rate: the default number of requests per second per netloc.
+        :class default_ip_rate: the default number of requests per second per IP address.
+        :class default_retry_after: the seconds to wait after a 429 response without a valid Retry-After header.
+        :class max_entries: the maximum number of resolved hosts that are remembered, and the number of buckets above
+        which the buckets that are full again are removed.
+        host_rate: the number of requests per second per netloc.
+        host_burst: the number of requests to a netloc that may be sent at once.
+        ip_rate: the number of requests per second per IP address, or None to not pace per IP address.
+        ip_burst: the number of requests to an IP address that may be sent at once.
+        max_in_flight: the maximum number of requests at the same time, or None for no maximum.
+        max_retry_after: a request is retried after a 429 response if the Retry-After is at most this many seconds.
+        max_retries: the number of times a request is retried after a 429 response.
+        requests: the number of requests that have been started.
+        throttled: the number of requests that had to wait.
+        throttle_wait: the total number of seconds requests have waited.
+        rate_limited: the number of 429 and 503 responses with a Retry-After.
+        rejected: the number of requests that failed at once because their netloc was blocked for longer than
+        max_retry_after seconds.
+        queue_depth: the number of requests that are waiting.
+        max_queue_depth: the highest number of requests that were waiting at the same time.
+        in_flight: the number of requests that have been sent and have not been answered yet.
+
+    Public methods:
+        acquire: Wait until a request to a url may be sent (context manager)
+        retry_after: Get the number of seconds to wait after a response, if it asks to slow down
+        penalize: Block the requests to a netloc for a number of seconds
+        snapshot: Get the metrics
+
+    Raises:
+        :raises ConnectionError: if a request is made to a netloc that is blocked for longer than max_retry_after.
+    """
+    default_host_rate: float = 1.0
+    default_ip_rate: float = 10.0
+    default_retry_after: float = 5.0
+    max_entries: int = 100000
+
+    def __init__(self, host_rate: Optional[float] = None, host_burst: int = 2, ip_rate: Optional[float] = None,
+                 ip_burst: int = 10, max_in_flight: Optional[int] = None, max_retry_after: float = 60.0,
+                 max_retries: int = 1, resolve: bool = True):
+        """Initialize the variables."""
+        self.host_rate: float = host_rate if host_rate else self.default_host_rate
+        self.host_burst: int = host_burst
+        self.ip_rate: Optional[float] = (ip_rate if ip_rate else self.default_ip_rate) if resolve else None
+        self.ip_burst: int = ip_burst
+        self.max_in_flight: Optional[int] = max_in_flight
+        self.max_retry_after: float = max_retry_after
+        self.max_retries: int = max_retries
+        self.requests: int = 0
+        self.throttled: int = 0
+        self.throttle_wait: float = 0.0
+        self.rate_limited: int = 0
+        self.rejected: int = 0
+        self.queue_depth: int = 0
+        self.max_queue_depth: int = 0
+        self.in_flight: int = 0
+        # The theoretical arrival time of the next request per bucket, see _reserve
+        self._arrivals: Dict[Tuple[str, str], float] = {}
+        self._blocked: Dict[str, float] = {}
+        self._resolved: 'OrderedDict[str, Optional[str]]' = OrderedDict()
+        self._slots = BoundedSemaphore(max_in_flight) if max_in_flight else None
+        self._lock = Lock()
+
+    @contextmanager
+    def acquire(self, url: str) -> Iterator[None]:
+        """
+        Wait until a request to a url may be sent, and hold an in-flight slot while it is sent.
+        :param url: The url of the request.
+        :raises ConnectionError: if the netloc is blocked for longer than max_retry_after seconds.
+        """
+        parsed_url = urlparse(url)
+        ip = self._resolve(parsed_url.hostname) if self.ip_rate and parsed_url.hostname else None
+        start = monotonic()
+        with self._lock:
+            blocked_for = self._blocked.get(parsed_url.netloc, 0.0) - start
+            if blocked_for > self.max_retry_after:
+                # Waiting that long would pin the thread, so the request fails instead
+                self.rejected += 1
+                raise ConnectionError(f"{parsed_url.netloc} is rate limited for another {blocked_for:.0f} seconds")
+            self.requests += 1
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+            ready_at = self._reserve(parsed_url.netloc, ip, start)
+        waited = ready_at > start
+        acquired = False
+        try:
+            if waited:
+                sleep(ready_at - start)
+            if self._slots is not None and not self._slots.acquire(blocking=False):
+                waited = True
+                self._slots.acquire()
+                acquired = True
+                # The reserved time passed while waiting for a slot, and requests to the same host that were waiting
+                # as well may get a slot at the same moment, so reserve again to keep them paced
+                with self._lock:
+                    ready_at = self._reserve(parsed_url.netloc, ip, monotonic())
+                delay = ready_at - monotonic()
+                if delay > 0:
+                    sleep(delay)
+        except BaseException:
+            if acquired:
+                self._slots.release()
+            raise
+        finally:
+            with self._lock:
+                self.queue_depth -= 1
+                if waited:
+                    self.throttled += 1
+                    self.throttle_wait += monotonic() - start
+        with self._lock:
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            if self._slots is not None:
+                self._slots.release()
+
+    def retry_after(self, response: Response) -> Optional[float]:
+        """
+        Get the number of seconds to wait after a response, if it asks to slow down.
+        :param response: The response.
+        :return: The Retry-After of a 429 response, or of a 503 response that has one. None otherwise.
+        """
+        if response.status_code not in (429, 503):
+            return None
+        value = response.headers.get('Retry-After', '').strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time(), 0.0)
+        except (TypeError, ValueError, IndexError):
+            return self.default_retry_after if response.status_code == 429 else None
+
+    def penalize(self, url: str, seconds: float) -> None:
+        """
+        Block the requests to the netloc of a url for a number of seconds, after it answered that it is rate limited.
+        :param url: The url of the request.
+        :param seconds: The number of seconds to block the netloc.
+        """
+        netloc = urlparse(url).netloc
+        with self._lock:
+            self.rate_limited += 1
+            self._blocked[netloc] = max(self._blocked.get(netloc, 0.0), monotonic() + seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the metrics.
+        :return: A dictionary with the counters, the waiting times and the current queue depth and requests in flight.
+        """
+        with self._lock:
+            return {'requests': self.requests, 'throttled': self.throttled, 'throttle_wait': self.throttle_wait,
+                    'mean_throttle_wait': self.throttle_wait / self.requests if self.requests else 0.0,
+                    'rate_limited': self.rate_limited, 'rejected': self.rejected, 'queue_depth': self.queue_depth,
+                    'max_queue_depth': self.max_queue_depth, 'in_flight': self.in_flight,
+                    'blocked_hosts': sum(1 for until in self._blocked.values() if until > monotonic())}
+
+    def _reserve(self, netloc: str, ip: Optional[str], now: float) -> float:
+        """
+        Reserve the earliest time at which a request is allowed by both its buckets, and take a token from each. The
+        buckets are kept as the theoretical arrival time of their next request (the generic cell rate algorithm), so a
+        reservation takes constant time and no thread has to refill the buckets.
+        :param netloc: The netloc of the request.
+        :param ip: The IP address of the host, or None if it is not known.
+        :param now: The current time.
+        :return: The time at which the request may be sent.
+        """
+        buckets = [(('host', netloc), 1.0 / self.host_rate, self.host_burst)]
+        if ip:
+            buckets.append((('ip', ip), 1.0 / self.ip_rate, self.ip_burst))
+        ready_at = max(now, self._blocked.get(netloc, 0.0))
+        for key, interval, burst in buckets:
+            arrival = max(self._arrivals.get(key, now), now)
+            ready_at = max(ready_at, arrival - (burst - 1) * interval)
+        for key, interval, burst in buckets:
+            arrival = max(self._arrivals.get(key, now), now)
+            self._arrivals[key] = max(arrival, ready_at - (burst - 1) * interval) + interval
+        if len(self._arrivals) > self.max_entries:
+            self._prune(now)
+        return ready_at
+
+    def _prune(self, now: float) -> None:
+        """
+        Remove the buckets that are full again and the blocks that have passed, since they are the same as no entry.
+        :param now: The current time.
+        """
+        self._arrivals = {key: arrival for key, arrival in self._arrivals.items() if arrival > now}
+        self._blocked = {netloc: until for netloc, until in self._blocked.items() if until > now}
+
+    def _resolve(self, hostname: str) -> Optional[str]:
+        """
+        Resolve a host to the IP address its requests are paced by. The results are remembered.
+        :param hostname: The hostname.
+        :return: The first IP address of the host, or None if it could not be resolved.
+        """
+        with self._lock:
+            if hostname in self._resolved:
+                self._resolved.move_to_end(hostname)
+                return self._resolved[hostname]
+        try:
+            ip = socket.getaddrinfo(hostname, None, proto=socket.IPPROTO_TCP)[0][4][0]
+        except (OSError, UnicodeError):
+            ip = None
+        with self._lock:
+            self._resolved[hostname] = ip
+            while len(self._resolved) > self.max_entries:
+                self._resolved.popitem(last=False)
+        return ip
@@ -0,0 +1,311 @@
+import warnings
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from threading import Lock
+from typing import Optional, NamedTuple, Iterable, Iterator, Tuple, Dict, FrozenSet, List, Deque, Union
+
+import pgpy
+from pgpy.errors import PGPError
+from requests import Session, exceptions
+
+from securitytxt.parsers.http_session import get_default_session
+from securitytxt.parsers.key_cache import KeyCache
+from securitytxt.parsers.parse_memo import ParseMemo
+from securitytxt.securitytxt import SecurityTXT
+
+# PGPy warns about every key without self-signature flags and every unsupported packet it skips
+warnings.filterwarnings('ignore', category=UserWarning, module=r'pgpy(\.|$)')
+
+
+class VerificationResult(NamedTuple):
+    """The result of verifying the signature of a security.txt: the status, and the fingerprint of the key and the url
+    it was fetched from, if a key that made the signature was found."""
+    VALID = 'valid'
+    INVALID = 'invalid'
+    UNSIGNED = 'unsigned'
+    MALFORMED = 'malformed'
+    NO_KEY = 'no_key'
+
+    status: str
+    fingerprint: Optional[str] = None
+    key_url: Optional[str] = None
+
+    @property
+    def valid(self) -> bool:
+        """Whether the signature is valid."""
+        return self.status == self.VALID
+
+
+class _Key(NamedTuple):
+    """A parsed public key, with the ids of the key and its subkeys that signatures refer to."""
+    fingerprint: str
+    key: pgpy.PGPKey
+    key_ids: FrozenSet[str]
+
+
+class SignatureVerifier:
+    """Verifies the OpenPGP signatures of signed security.txt files. The key of a file is looked for at its Encryption
+    urls: a url is fetched, and an openpgp4fpr uri is looked up on the key server. If none of these keys made the
+    signature, the key id of the signature is looked up on the key server. Note that a valid signature by a key that
+    the file refers to itself only shows that the file has not been changed since it was signed by the holder of that
+    key.
+
+    Many files share a handful of keys, so fetched keys are kept in a KeyCache and the parsed keys in memory, and a url
+    is fetched only once even if several threads need it at the same time. A key server url for a fingerprint or key id
+    is not fetched at all if the key was already found at another url. The results are memoized by the hash of the
+    file and the fingerprint of the key, so identical files served by many hosts are verified once.
+
+    Attributes:
+        :class default_key_server: the default key server, that serves the keys under the VKS paths.
+        :class default_max_workers: the default number of worker threads of verify_many.
+        :class default_max_keys: the default number of parsed keys kept in memory.
+        :class default_max_memo_entries: the default number of memoized results.
+        :class max_key_size: the maximum size in bytes of a fetched key.
+        :class fingerprint_scheme: the scheme of an Encryption uri that refers to a key by its fingerprint.
+        session: the requests session used to fetch the keys. If not given, the shared session is used.
+        key_cache: the cache of fetched keys. If not given, a cache in memory is used.
+        key_server: the url of the key server, or None to only use the Encryption urls.
+        timeout: the timeout of each request in seconds, or a (connect timeout, read timeout) tuple.
+        max_workers: the number of worker threads of verify_many.
+        max_keys: the number of parsed keys kept in memory.
+        max_memo_entries: the number of memoized results.
+        fetches: the number of keys that have been requested.
+        memo_hits: the number of results that were memoized.
+
+    Public methods:
+        verify: Verify the signature of a security.txt
+        verify_many: Verify the signatures of many security.txt files on a worker pool
+    """
+    default_key_server: str = 'https://keys.openpgp.org'
+    default_max_workers: int = 8
+    default_max_keys: int = 256
+    default_max_memo_entries: int = 100000
+    max_key_size: int = 1024 * 1024
+    fingerprint_scheme: str = 'openpgp4fpr:'
+    caught_exceptions = (exceptions.RequestException, ValueError, PGPError, NotImplementedError)
+
+    def __init__(self, session: Optional[Session] = None, key_cache: Optional[KeyCache] = None,
+                 key_server: Optional[str] = default_key_server,
+                 timeout: Optional[Union[float, Tuple[float, float]]] = None, max_workers: Optional[int] = None,
+                 max_keys: Optional[int] = None, max_memo_entries: Optional[int] = None):
+        """Initialize the variables."""
+        self.session: Session = session if session else get_default_session()
+        self.key_cache: KeyCache = key_cache if key_cache is not None else KeyCache()
+        self.key_server: Optional[str] = key_server.rstrip('/') if key_server else None
+        self.timeout: Optional[Union[float, Tuple[float, float]]] = timeout
+        self.max_workers: int = max_workers if max_workers else self.default_max_workers
+        self.max_keys: int = max_keys if max_keys else self.default_max_keys
+        self.max_memo_entries: int = max_memo_entries if max_memo_entries else self.default_max_memo_entries
+        self.fetches: int = 0
+        self.memo_hits: int = 0
+        self._keys: 'OrderedDict[str, Optional[_Key]]' = OrderedDict()
+        self._memo: 'OrderedDict[Tuple[str, str], bool]' = OrderedDict()
+        self._url_locks: Dict[str, Lock] = {}
+        self._lock = Lock()
+
+    def verify(self, securitytxt: SecurityTXT) -> VerificationResult:
+        """
+        Verify the signature of a security.txt.
+        :param securitytxt: The security.txt, with its raw text.
+        :return: The result of the verification.
+        """
+        if not securitytxt.signature or not securitytxt.raw:
+            return VerificationResult(VerificationResult.UNSIGNED)
+        try:
+            message = pgpy.PGPMessage.from_blob(securitytxt.raw)
+        except self.caught_exceptions:
+            return VerificationResult(VerificationResult.MALFORMED)
+        signers = {signature.signer for signature in message.signatures}
+        digest = ParseMemo.digest(securitytxt.raw)
+        for url, key_reference in self._key_urls(securitytxt, signers):
+            key = self._get_key(url, key_reference)
+            if key is None or not signers & key.key_ids:
+                continue
+            valid = self._verify_message(digest, key, message)
+            return VerificationResult(VerificationResult.VALID if valid else VerificationResult.INVALID,
+                                      key.fingerprint, url)
+        return VerificationResult(VerificationResult.NO_KEY)
+
+    def verify_many(self, securitytxts: Iterable[SecurityTXT],
+                    max_pending: Optional[int] = None) -> Iterator[Tuple[SecurityTXT, VerificationResult]]:
+        """
+        Verify the signatures of many security.txt files on a pool of worker threads. The input is consumed lazily.
+        :param securitytxts: The security.txt files.
+        :param max_pending: The maximum number of files that are verified or waiting to be yielded. Defaults to twice
+        the number of workers.
+        :return: An iterator of (SecurityTXT, VerificationResult) tuples, in the order of the input.
+        """
+        max_pending = max_pending if max_pending else 2 * self.max_workers
+        securitytxts = iter(securitytxts)
+        pending: Deque[Tuple[SecurityTXT, Future]] = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                for securitytxt in securitytxts:
+                    pending.append((securitytxt, executor.submit(self.verify, securitytxt)))
+                    if len(pending) >= max_pending:
+                        securitytxt, future = pending.popleft()
+                        yield securitytxt, future.result()
+                while pending:
+                    securitytxt, future = pending.popleft()
+                    yield securitytxt, future.result()
+            finally:
+                # If the caller stops iterating early, do not start the verifications that are still queued
+                for _, future in pending:
+                    future.cancel()
+
+    def _key_urls(self, securitytxt: SecurityTXT, signers: Iterable[str]) -> List[Tuple[str, Optional[str]]]:
+        """
+        Get the urls where the key of a security.txt might be found, in the order in which to try them.
+        :param securitytxt: The security.txt.
+        :param signers: The key ids of the signatures.
+        :return: A (url, fingerprint or key id) tuple per url, where the fingerprint or key id is that of the key the
+        url refers to, or None for a url that may serve any key.
+        """
+        urls: List[Tuple[str, Optional[str]]] = []
+        for uri in securitytxt.encryption:
+            if uri.lower().startswith(self.fingerprint_scheme):
+                if self.key_server:
+                    fingerprint = uri[len(self.fingerprint_scheme):].replace(' ', '').upper()
+                    urls.append((f"{self.key_server}/vks/v1/by-fingerprint/{fingerprint}", fingerprint))
+            elif uri.lower().startswith(('https://', 'http://')):
+                urls.append((uri, None))
+        if self.key_server:
+            urls.extend((f"{self.key_server}/vks/v1/by-keyid/{signer.upper()}", signer.upper())
+                        for signer in sorted(signers))
+        return urls
+
+    def _get_key(self, url: str, key_reference: Optional[str] = None) -> Optional[_Key]:
+        """
+        Get the key of a url from memory, from the key cache, or by fetching it. A url is fetched by a single thread at
+        a time, so the other threads that need it use the fetched key.
+        :param url: The url of the key.
+        :param key_reference: (optional) The fingerprint or key id of the key the url refers to. A key with it that was
+        found at another url is used without fetching the url.
+        :return: The key, or None if the url does not serve a usable key.
+        """
+        with self._lock:
+            if url in self._keys:
+                self._keys.move_to_end(url)
+                return self._keys[url]
+            url_lock = self._url_locks.setdefault(url, Lock())
+        with url_lock:
+            with self._lock:
+                if url in self._keys:
+                    return self._keys[url]
+            key = self._load_key(url, key_reference)
+            with self._lock:
+                self._keys[url] = key
+                while len(self._keys) > self.max_keys:
+                    self._keys.popitem(last=False)
+                self._url_locks.pop(url, None)
+        return key
+
+    def _load_key(self, url: str, key_reference: Optional[str] = None) -> Optional[_Key]:
+        """
+        Load the key of a url from the key cache, or find the key it refers to among the keys in memory and in the key
+        cache, or else fetch it and store it in the key cache. A cached key that cannot be parsed is dropped.
+        :param url: The url of the key.
+        :param key_reference: (optional) The fingerprint or key id of the key the url refers to.
+        :return: The key, or None if the url does not serve a usable key.
+        """
+        entry = self.key_cache.get(url)
+        if entry is not None:
+            if not entry.armored:
+                return None
+            key = self._parse_cached_key(entry.armored)
+            if key is not None:
+                return key
+            self.key_cache.delete(url)
+        if key_reference:
+            key = self._find_key(key_reference)
+            if key is not None:
+                self.key_cache.set(url, key.fingerprint, str(key.key))
+                return key
+        key = None
+        try:
+            key = self._parse_key(self._fetch_key(url))
+        except self.caught_exceptions:
+            pass
+        self.key_cache.set(url, key.fingerprint if key else None, str(key.key) if key else None)
+        return key
+
+    def _find_key(self, key_reference: str) -> Optional[_Key]:
+        """
+        Find a key by its fingerprint or key id among the parsed keys in memory, or else in the key cache.
+        :param key_reference: The fingerprint or key id, in uppercase hexadecimal without spaces.
+        :return: The key, or None if it has not been fetched before.
+        """
+        with self._lock:
+            for key in self._keys.values():
+                if key is not None and (key.fingerprint == key_reference or key_reference in key.key_ids):
+                    return key
+        armored = self.key_cache.get_by_fingerprint(key_reference)
+        return self._parse_cached_key(armored) if armored else None
+
+    def _parse_cached_key(self, armored: str) -> Optional[_Key]:
+        """
+        Parse a key from the key cache.
+        :param armored: The ASCII-armored key.
+        :return: The key, or None if the cached key cannot be parsed, for example because the cache is corrupt.
+        """
+        try:
+            return self._parse_key(armored)
+        except self.caught_exceptions:
+            return None
+
+    def _fetch_key(self, url: str) -> bytes:
+        """
+        Fetch a key.
+        :param url: The url of the key.
+        :return: The key, ASCII-armored or binary.
+        :raises ValueError: if the response is not successful or too large.
+        :raises RequestException: if the request failed.
+        """
+        with self._lock:
+            self.fetches += 1
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
+            if not response.ok:
+                raise ValueError(f"Url {url} returned status code {response.status_code}")
+            content = bytearray()
+            for chunk in response.iter_content(8192):
+                content += chunk
+                if len(content) > self.max_key_size:
+                    raise ValueError(f"Url {url} returned a key larger than {self.max_key_size} bytes")
+        return bytes(content)
+
+    @staticmethod
+    def _parse_key(data: Union[str, bytes]) -> _Key:
+        """
+        Parse a key.
+        :param data: The key, ASCII-armored or binary.
+        :return: The public key.
+        :raises ValueError: if the data is not a key.
+        """
+        key, _ = pgpy.PGPKey.from_blob(data)
+        key = key if key.is_public else key.pubkey
+        key_ids = frozenset([key.fingerprint.keyid, *(subkey.fingerprint.keyid for subkey in key.subkeys.values())])
+        return _Key(str(key.fingerprint).replace(' ', ''), key, key_ids)
+
+    def _verify_message(self, digest: str, key: _Key, message: pgpy.PGPMessage) -> bool:
+        """
+        Verify a signed message with a key, or get the memoized result.
+        :param digest: The hash of the raw text of the message.
+        :param key: The key that made the signature.
+        :param message: The signed message.
+        :return: Whether the signature is valid.
+        """
+        memo_key = (digest, key.fingerprint)
+        with self._lock:
+            if memo_key in self._memo:
+                self._memo.move_to_end(memo_key)
+                self.memo_hits += 1
+                return self._memo[memo_key]
+        try:
+            valid = bool(key.key.verify(message))
+        except self.caught_exceptions:
+            valid = False
+        with self._lock:
+            self._memo[memo_key] = valid
+            while len(self._memo) > self.max_memo_entries:
+                self._memo.popitem(last=False)
+        return valid
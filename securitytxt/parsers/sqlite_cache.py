@@ -0,0 +1,94 @@
+import sqlite3
+from threading import Lock
+from typing import Optional, Tuple
+
+
+class SQLiteCache:
+    """The base class of the persistent caches that are stored in an SQLite database, keyed by url. The table of a
+    subclass has a url column as its primary key, and a size and a last_access column. The size of all entries together
+    is loaded when the database is opened and kept up to date on every change, so storing an entry does not require a
+    scan of the table. When the entries together are larger than max_size, the least recently used ones are evicted.
+
+    Attributes:
+        :class table: the name of the table with the entries.
+        :class default_max_size: the default maximum size of all entries together, in bytes.
+        path: the path of the database file, or ':memory:' for a cache that is not persisted.
+        max_size: the maximum size of all entries together, in bytes.
+
+    Public methods:
+        delete: Remove the cache entry of a url.
+        clear: Remove all cache entries.
+        close: Close the database.
+    """
+    table: str = 'entries'
+    default_max_size: int = 64 * 1024 * 1024
+
+    def __init__(self, path: str, max_size: Optional[int], *schema: str):
+        """Initialize the variables and create the database if it does not exist."""
+        self.path: str = path
+        self.max_size: int = max_size if max_size else self.default_max_size
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            for statement in schema:
+                self._connection.execute(statement)
+        self._size: int = self._connection.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+
+    def __len__(self) -> int:
+        """The number of entries in the cache."""
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def delete(self, url: str) -> None:
+        """
+        Remove the cache entry of a url.
+        :param url: The url of the entry.
+        """
+        with self._lock, self._connection:
+            self._remove(url)
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table}")
+            self._size = 0
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def _store(self, url: str, size: int, row: Tuple) -> None:
+        """
+        Insert or replace the entry of a url, and evict the least recently used entries if the cache is full. The lock
+        must be held.
+        :param url: The url of the entry.
+        :param size: The size of the entry.
+        :param row: The values of all columns of the entry.
+        """
+        replaced = self._connection.execute(f"SELECT size FROM {self.table} WHERE url = ?", (url,)).fetchone()
+        self._connection.execute(f"INSERT OR REPLACE INTO {self.table} VALUES ({', '.join('?' * len(row))})", row)
+        self._size += size - (replaced[0] if replaced else 0)
+        if self._size > self.max_size:
+            self._evict()
+
+    def _remove(self, url: str) -> None:
+        """
+        Remove the entry of a url, if it is present. The lock must be held.
+        :param url: The url of the entry.
+        """
+        row = self._connection.execute(f"SELECT size FROM {self.table} WHERE url = ?", (url,)).fetchone()
+        if row:
+            self._connection.execute(f"DELETE FROM {self.table} WHERE url = ?", (url,))
+            self._size -= row[0]
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the entries together fit in max_size."""
+        rows = self._connection.execute(f"SELECT url, size FROM {self.table} ORDER BY last_access")
+        evicted = []
+        for url, entry_size in rows:
+            if self._size <= self.max_size:
+                break
+            evicted.append((url,))
+            self._size -= entry_size
+        self._connection.executemany(f"DELETE FROM {self.table} WHERE url = ?", evicted)
@@ -0,0 +1,104 @@
+from itertools import chain
+from re import compile
+from typing import Iterable, Iterator, List, Optional, Union
+
+from securitytxt.parsers.bytes_parser import BytesParser
+from securitytxt.parsers.file_parser import FileParser
+from securitytxt.parsers.textparsers.signed_text_parser import SignedTextParser
+from securitytxt.securitytxt import SecurityTXT
+
+
+class StreamParser(FileParser):
+    """Takes the lines of a security.txt file, for example a file object, and parses them one by one, without holding
+    more than one copy of the text in memory. The lines may be strings or UTF-8 encoded bytes. Lines that are not valid
+    UTF-8 are decoded with the fallback encoding of the BytesParser, in which case the decoding of the resulting
+    securitytxt is set to DECODING_FALLBACK. Unsigned files are parsed while the lines are read. Signed files need the
+    whole text to locate the signature, so their lines are collected first. Creating an object of the parser
+    immediately parses the given lines.
+
+    Attributes:
+        securitytxt: the resulting securitytxt after parsing.
+
+    Public methods:
+        buffer_lines: Iterate over the lines of a bytes-like object, such as a memoryview or mmap (static method)
+
+    Raises:
+        :raises AttributeError: if the format of the file is invalid.
+    """
+    _line_pattern = compile(rb'[^\n]*\n|[^\n]+')
+
+    def __init__(self, lines: Iterable[Union[str, bytes]], keep_raw: bool = True):
+        """
+        Initialize SecurityTXT and run the parser to fill this object
+        :param lines: The lines to parse, including their line endings.
+        :param keep_raw: Whether to set the raw text on the securitytxt. If False, the raw text is left empty.
+        :raises AttributeError: if the file does not has an incorrect format.
+        """
+        self.securitytxt: SecurityTXT = SecurityTXT()
+        self._raw: Optional[List[str]] = [] if keep_raw else None
+        self._parse_stream(map(self._decode, lines))
+        if self._raw is not None:
+            self.securitytxt.raw = ''.join(self._raw)
+
+    @staticmethod
+    def buffer_lines(buffer, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Iterate over the lines of a bytes-like object, such as bytes, a memoryview or a mmap, without copying more than
+        a line at a time.
+        :param buffer: The bytes-like object.
+        :param start: (optional) The position where the lines start.
+        :param end: (optional) The position where the lines end. Defaults to the end of the buffer.
+        :return: An iterator of the lines, including their line endings.
+        """
+        end = len(buffer) if end is None else end
+        return (match.group() for match in StreamParser._line_pattern.finditer(buffer, start, end))
+
+    def _parse_stream(self, lines: Iterator[str]) -> None:
+        """
+        Determine whether the file is signed from its first non-empty line, and parse the rest of the lines accordingly
+        :param lines: The decoded lines to parse.
+        :raises AttributeError: if the file is signed and the signature could not be parsed.
+        """
+        first_lines = []
+        for line in lines:
+            first_lines.append(line)
+            if self._normalize(line).strip(' \n'):
+                break
+        if SignedTextParser.is_signed_text(self._normalize(''.join(first_lines))):
+            text = ''.join(chain(first_lines, lines))
+            if self._raw is not None:
+                self._raw.append(text)
+            self._parse(text)
+        else:
+            self._parse_lines(self._split_lines(chain(first_lines, lines)))
+
+    def _split_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Split the lines the same way as str.splitlines, and keep them for the raw text if needed
+        :param lines: The decoded lines, including their line endings.
+        :return: An iterator of the lines, without line endings.
+        """
+        for line in lines:
+            if self._raw is not None:
+                self._raw.append(line)
+            yield from line.splitlines()
+
+    def _decode(self, line: Union[str, bytes]) -> str:
+        """
+        Decode a line if it is bytes, and keep track of the encoding used on the securitytxt
+        :param line: The line to decode.
+        :return: The decoded line.
+        """
+        if isinstance(line, str):
+            return line
+        if self.securitytxt.encoding is None:
+            self.securitytxt.encoding, self.securitytxt.decoding = 'utf-8', BytesParser.DECODING_UTF8
+            if line.startswith(b'\xef\xbb\xbf'):
+                self.securitytxt.encoding = 'utf-8-sig'
+                line = line[3:]
+        try:
+            return str(line, 'utf-8')
+        except UnicodeDecodeError:
+            self.securitytxt.encoding = BytesParser.fallback_encoding
+            self.securitytxt.decoding = BytesParser.DECODING_FALLBACK
+            return str(line, BytesParser.fallback_encoding)
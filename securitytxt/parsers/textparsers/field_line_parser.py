@@ -1,7 +1,7 @@
-from datetime import datetime, timezone
-from typing import Union, List, Optional
-
-from dateutil.parser import parse
+from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from re import compile
+from typing import Union, List, Optional, Any, Tuple
 
 from securitytxt.parsers.textparsers.comment_line_parser import CommentLineParser
 
@@ -15,11 +15,16 @@ class FieldLineParser:
         :class uri_fields The fields containing a URI-value.
         :class datetime_fields The fields containing a datetime value.
         :class csv_fields: The fields containing a comma-separated value.
+        :class DATETIME_RFC3339: The format of a datetime value in the RFC 3339 format required by the draft RFC.
+        :class DATETIME_LENIENT: The format of a datetime value in any other format that dateutil can parse.
         key: the key of the parsed field
         value: the value of the parsed field
 
     Public methods:
         is_field: determines whether the given line is a field (static method)
+        normalize_key: normalizes a key, so it can be an attribute of the securitytxt class (static method)
+        parse_value: parses the value of a field with the value parser for its key (static method)
+        parse_datetime: parses a datetime value and returns its format (static method)
     """
     field_separator: str = ':'
 
@@ -27,6 +32,11 @@ class FieldLineParser:
     datetime_fields = ['expires']
     csv_fields = ['preferred_languages']
 
+    DATETIME_RFC3339: str = 'rfc3339'
+    DATETIME_LENIENT: str = 'lenient'
+    _rfc3339_pattern = compile(r'\s*(\d{4})-(\d{2})-(\d{2})[Tt ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?'
+                               r'(?:[Zz]|([+-])(\d{2}):(\d{2}))\s*')
+
     def __init__(self, field_line: str):
         """Initialize all the values, launch the parser and checks validity of the resulting keys/values."""
         self.key: Optional[str] = None
@@ -41,39 +51,69 @@ class FieldLineParser:
         :param field_line: The line
         """
         key, value = field_line.split(self.field_separator, 1)
-        key = self._normalize_key(key)
-        if key in self.uri_fields:
-            self._parse_uri_field(key, value)
-        elif key in self.datetime_fields:
-            self._parse_datetime_field(key, value)
-        elif key in self.csv_fields:
-            self._parse_csv_field(key, value)
-        else:
-            self._parse_unknown_field(key, value)
-
-    def _normalize_key(self, key: str) -> str:
+        self.key = self.normalize_key(key)
+        self.value = self.parse_value(self.key, value)
+
+    @staticmethod
+    def normalize_key(key: str) -> str:
         """Normalize the given key, so it can be an attribute of the securitytxt class."""
         return key.lower().strip().replace('-', '_')
 
-    def _parse_uri_field(self, key: str, value: str) -> None:
-        """Parse a field where the value is a URI."""
-        self.key = key
-        self.value: str = value.strip()
+    @staticmethod
+    def parse_value(key: str, value: str) -> Any:
+        """
+        Parse the value of a field with the value parser for its (normalized) key.
+        :param key: The normalized key of the field.
+        :param value: The value of the field.
+        :return: The parsed value.
+        """
+        return FieldLineParser._value_parsers.get(key, FieldLineParser._parse_unknown_value)(value)
+
+    @staticmethod
+    def _parse_uri_value(value: str) -> str:
+        """Parse a value that is a URI."""
+        return value.strip()
+
+    @staticmethod
+    def _parse_datetime_value(value: str) -> datetime:
+        """Parse a value that is a date and time."""
+        return FieldLineParser.parse_datetime(value)[0]
 
-    def _parse_datetime_field(self, key: str, value: str) -> None:
-        """Parse a field where the value is a date and time."""
-        self.key = key
-        self.value: datetime = parse(value).astimezone(tz=timezone.utc)
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def parse_datetime(value: str) -> Tuple[datetime, str]:
+        """
+        Parse a value that is a date and time, and convert it to UTC. Values in the RFC 3339 format required by the
+        draft RFC are parsed directly; other values are parsed by dateutil. The results are memoized, since many files
+        share the same value.
+        :param value: The value to parse.
+        :return: A tuple of the datetime and its format, DATETIME_RFC3339 or DATETIME_LENIENT.
+        :raises ValueError: If the value is not a date and time.
+        """
+        match = FieldLineParser._rfc3339_pattern.fullmatch(value)
+        if match:
+            year, month, day, hour, minute, second, fraction, sign, offset_hours, offset_minutes = match.groups()
+            offset = timedelta(hours=int(offset_hours), minutes=int(offset_minutes)) if sign else timedelta()
+            try:
+                result = datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                                  int(fraction[:6].ljust(6, '0')) if fraction else 0,
+                                  timezone(-offset if sign == '-' else offset))
+                return result.astimezone(tz=timezone.utc), FieldLineParser.DATETIME_RFC3339
+            except ValueError:
+                pass
+        # dateutil is slow to import, and only needed for values that are not in the RFC 3339 format
+        from dateutil.parser import parse
+        return parse(value).astimezone(tz=timezone.utc), FieldLineParser.DATETIME_LENIENT
 
-    def _parse_csv_field(self, key: str, value: str) -> None:
-        """Parse a field where the value is a comma separated list."""
-        self.key = key
-        self.value: List = list(map(str.strip, value.split(',')))
+    @staticmethod
+    def _parse_csv_value(value: str) -> List[str]:
+        """Parse a value that is a comma separated list."""
+        return list(map(str.strip, value.split(',')))
 
-    def _parse_unknown_field(self, key: str, value: str) -> None:
-        """Parse a field where the value is an unknown string."""
-        self.key = key
-        self.value = value
+    @staticmethod
+    def _parse_unknown_value(value: str) -> str:
+        """Parse a value that is an unknown string."""
+        return value
 
     def _is_valid(self) -> None:
         """
@@ -91,3 +131,11 @@ class FieldLineParser:
         :return: True if the line is a field, False otherwise.
         """
         return not CommentLineParser.is_comment(line) and FieldLineParser.field_separator in line
+
+
+# The value parser per normalized key, so a field can be parsed with a single lookup
+FieldLineParser._value_parsers = {
+    **{key: FieldLineParser._parse_uri_value for key in FieldLineParser.uri_fields},
+    **{key: FieldLineParser._parse_datetime_value for key in FieldLineParser.datetime_fields},
+    **{key: FieldLineParser._parse_csv_value for key in FieldLineParser.csv_fields},
+}
@@ -1,6 +1,3 @@
-from re import compile
-from typing import Pattern
-
 from typing import Optional
 
 
@@ -10,8 +7,10 @@ class SignedTextParser:
 
     Attributes:
         :class signed_text_identifier: If this identifier is contained in the text, the text can be assumed to be signed
-        :class signature_group_name: The regex group name for the signature
-        :class unsigned_text_group_name: The regex group name for the unsigned body of the text
+        :class signature_identifier: The line that starts the signature
+        :class signature_end_identifier: The line that ends the signature
+        :class hash_header: The armor header that specifies the hash algorithm
+        :class dash_escape: The prefix of dash-escaped lines in the signed text
         signed_text: The signed text to parse
 
     Public methods:
@@ -21,9 +20,10 @@ class SignedTextParser:
         :raises AttributeError: if the signature could not be parsed.
     """
     signed_text_identifier: str = '-----BEGIN PGP SIGNED MESSAGE-----'
-
-    signature_group_name: str = 'signature'
-    unsigned_text_group_name: str = 'unsigned_text'
+    signature_identifier: str = '-----BEGIN PGP SIGNATURE-----'
+    signature_end_identifier: str = '-----END PGP SIGNATURE-----'
+    hash_header: str = 'Hash: '
+    dash_escape: str = '- '
 
     def __init__(self, signed_text: str):
         """
@@ -46,27 +46,48 @@ class SignedTextParser:
 
     def _parse(self, signed_text: str) -> None:
         """
-        Parse the signed text
+        Parse the signed text. The armor lines are located with plain string searches, so the time needed is linear in
+        the length of the text, whatever its content. The parser is slightly more lenient than the rules specified in
+        rfc4880#section-7, to accommodate for typographical errors and different file formats: the Hash armor headers
+        are optional, and if the armor lines occur more than once, the last signature is used.
         :param signed_text: The signed text to parse
         :raises AttributeError: if the signature could not be parsed.
         """
-        match = self._pattern.search(signed_text)
-        if not match:
+        start = signed_text.find(self.signed_text_identifier + '\n')
+        end = signed_text.rfind('\n' + self.signature_end_identifier)
+        if start < 0 or end < 0:
+            raise AttributeError("The signature could not be parsed")
+        start += len(self.signed_text_identifier) + 1
+        # The signature starts at the last line with the signature identifier before the end of the signature
+        signature_start = signed_text.rfind(f"\n{self.signature_identifier}\n", start - 1, end + 1)
+        if signature_start < 0:
             raise AttributeError("The signature could not be parsed")
-        groups = match.groupdict()
-        self.signature = groups[self.signature_group_name].strip()
-        self.unsigned_text = groups[self.unsigned_text_group_name].strip()
+        text_start = self._skip_hash_headers(signed_text, start, signature_start + 1)
+        self.signature = signed_text[signature_start + len(self.signature_identifier) + 2:end].strip()
+        self.unsigned_text = self._unescape(signed_text[text_start:signature_start + 1]).strip()
+
+    def _skip_hash_headers(self, signed_text: str, start: int, end: int) -> int:
+        """
+        Skip the Hash armor headers at the start of the signed text.
+        :param signed_text: The signed text
+        :param start: The position where the armor headers start
+        :param end: The position where the signed text ends
+        :return: The position after the armor headers
+        """
+        while signed_text.startswith(self.hash_header, start, end):
+            line_end = signed_text.find('\n', start, end)
+            if line_end < 0:
+                break
+            start = line_end + 1
+        return start
 
-    @property
-    def _pattern(self) -> Pattern[str]:
+    def _unescape(self, text: str) -> str:
         """
-        The regex pattern to parse a signed text. This regex is slightly more lenient than the rules specified in
-        rfc4880#section-7, to accommodate for typographical errors and different file formats. It contains two groups:
-        one for the signature and one for the unsigned text.
-        :return: The regex pattern to parse a PGP signed text
+        Remove the dash-escaping of lines in the signed text, as specified in rfc4880#section-7.1
+        :param text: The dash-escaped text
+        :return: The text without dash-escaping
         """
-        return compile(rf"-----BEGIN PGP SIGNED MESSAGE-----\n(Hash: .*\n)?"
-                       rf"(?P<{self.unsigned_text_group_name}>[\s\S]*)"
-                       rf"-----BEGIN PGP SIGNATURE-----\n"
-                       rf"(?P<{self.signature_group_name}>[\s\S]*)\n"
-                       rf"-----END PGP SIGNATURE-----")
+        if self.dash_escape not in text:
+            return text
+        return '\n'.join(line[len(self.dash_escape):] if line.startswith(self.dash_escape) else line
+                         for line in text.split('\n'))
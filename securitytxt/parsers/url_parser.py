@@ -1,13 +1,38 @@
-from typing import Optional, List, Dict
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from time import monotonic
+from threading import Lock
+from typing import Optional, List, Dict, Union, Tuple, Callable
 
-from urllib.parse import urlparse
-from requests import get, exceptions
+from requests import Session, Response, exceptions
 
-from securitytxt.parsers.file_parser import FileParser
+from securitytxt.parsers.base_url_parser import BaseURLParser
+from securitytxt.parsers.http_cache import HTTPCache
+from securitytxt.parsers.http_session import get_default_session
+from securitytxt.parsers.negative_cache import NegativeCache
+from securitytxt.parsers.parse_memo import ParseMemo
+from securitytxt.parsers.probe_order import ProbeOrder
+from securitytxt.parsers.probe_stats import ProbeEvent, ProbeRecord
+from securitytxt.parsers.rate_limiter import RateLimiter
 from securitytxt.securitytxt import SecurityTXT
 
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+_hedge_executor_lock = Lock()
 
-class URLParser:
+
+def _get_hedge_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Get the thread pool that is shared by all hedged URLParsers. It is created on first use.
+    :param max_workers: The number of threads of the pool, if it is created.
+    :return: The shared thread pool.
+    """
+    global _hedge_executor
+    with _hedge_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='securitytxt-hedge')
+        return _hedge_executor
+
+
+class URLParser(BaseURLParser):
     """Takes a URL, looks for security.txt files on the domain and when found, parses the security.txt file.
     Creating an object of the parser immediately parses the given url.
 
@@ -15,9 +40,44 @@ class URLParser:
         :class possible_paths: the paths where to look for a security.txt on a domain. Overridable in the __init__.
         :class headers: the headers for the request. Overridable in the __init__.
         :class default_scheme: the default scheme for requests, if no scheme is provided.
+        :class not_found_status_codes: the status codes that show that a url has no security.txt, as opposed to a
+        failure that may be transient.
+        :class caught_exceptions: the exceptions of a request after which the next url is probed.
+        :class max_hedge_workers: the number of threads of the thread pool on which hedged requests are sent. The pool
+        is shared by all URLParsers and created on first use.
         securitytxt: the resulting securitytxt after parsing.
         strict_url: Whether to actively look for a securitytxt on the domain of the url, or whether to 'strictly' use
         the provided url. Default is False.
+        session: the requests session used for the requests. If not given, a session shared by all URLParsers is used,
+        so connections are reused between the probes and between lookups of the same host.
+        hedge_delay: If set, the possible urls are probed concurrently instead of one after another: the next url is
+        requested after hedge_delay seconds, or as soon as all earlier requests have failed. A delay of 0 requests all
+        urls at once. The highest-priority url that has a security.txt is still the one that is parsed. Default is None.
+        cache: If set, files are revalidated with a conditional request, and a cached file that has not been modified
+        is used without parsing it again. Default is None.
+        negative_cache: If set, hosts without a security.txt are remembered, and looking them up again raises a
+        FileNotFoundError without sending any request. A host is remembered if every url returned a status code in
+        not_found_status_codes or an HTML-page, if it could not be resolved, or if it refused the connection on every
+        url. Default is None.
+        circuit_breaker: If True, the remaining urls are not probed when the host could not be resolved, and the
+        remaining urls with the same scheme and port are not probed when the host refused the connection on that port.
+        Only applies when the urls are probed one after another. Default is False.
+        timeout: The timeout of each request in seconds, or a (connect timeout, read timeout) tuple. If not given, the
+        timeout of the session is used.
+        stream: If True, responses are read in chunks, and rejected as soon as the Content-Type or the content shows
+        that the response is an HTML-page, or the response turns out to be larger than max_file_size or to take longer
+        than max_download_time to download. Default is False.
+        max_file_size: The maximum size in bytes of a security.txt when streaming.
+        max_download_time: The maximum time in seconds to download a security.txt when streaming. Default is None.
+        detect_encoding: Whether to detect the charset of a file that has no charset in its Content-Type and is not
+        valid UTF-8. Detection is slow, so by default such files are decoded with a fallback encoding. See BytesParser.
+        parse_memo: If set, files that are identical to a file parsed before are not parsed again. See ParseMemo.
+        on_probe: If set, it is called with a ProbeEvent for every url that is requested, with the outcome and the
+        timing of the request. A ProbeStats collects the statistics of all probes. Default is None.
+        rate_limiter: If set, every request is paced by it, and a request that is answered with 429 Too Many Requests is
+        retried after the Retry-After time. Share a RateLimiter between the URLParsers of a scan. Default is None.
+        probe_order: If set, the url at which the security.txt of the host was found before is requested first, and the
+        other possible urls after it in the usual order. See ProbeOrder. Default is None.
 
     Public methods:
         None
@@ -25,20 +85,34 @@ class URLParser:
     Raises:
         :raises FileNotFoundError: if no security.txt could be found on the url.
     """
-    possible_paths = ['/.well-known/security.txt', '/security.txt']
-    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 6.0; WOW64; rv:24.0) Gecko/20100101 Firefox/24.0'}
-    possible_schemes = ["https", "http"]
+    caught_exceptions = (exceptions.RequestException, ConnectionError)
+    max_file_size = 1024 * 1024
+    chunk_size = 8192
+    max_hedge_workers = 32
 
     def __init__(self, url: str, strict_url: bool = False, possible_paths: Optional[List[str]] = None,
                  headers: Optional[Dict] = None, possible_schemes: Optional[List[str]] = None,
-                 allow_redirects: bool = True):
+                 allow_redirects: bool = True, session: Optional[Session] = None, hedge_delay: Optional[float] = None,
+                 cache: Optional[HTTPCache] = None, negative_cache: Optional[NegativeCache] = None,
+                 circuit_breaker: bool = False, timeout: Optional[Union[float, Tuple[float, float]]] = None,
+                 stream: bool = False, max_file_size: Optional[int] = None, max_download_time: Optional[float] = None,
+                 detect_encoding: bool = False, parse_memo: Optional[ParseMemo] = None,
+                 on_probe: Optional[Callable[[ProbeEvent], None]] = None,
+                 rate_limiter: Optional[RateLimiter] = None, probe_order: Optional[ProbeOrder] = None):
         """Initialize the variables."""
-        self.securitytxt: Optional[SecurityTXT] = None
-        self.strict_url = strict_url
-        self.possible_paths = possible_paths if possible_paths else self.possible_paths
-        self.headers = headers if headers else self.headers
-        self.possible_schemes = possible_schemes if possible_schemes else self.possible_schemes
-        self.allow_redirects = allow_redirects
+        self.session: Session = session if session else get_default_session()
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.probe_order: Optional[ProbeOrder] = probe_order
+        self.hedge_delay: Optional[float] = hedge_delay
+        self.cache: Optional[HTTPCache] = cache
+        self.negative_cache: Optional[NegativeCache] = negative_cache
+        self.circuit_breaker: bool = circuit_breaker
+        self.timeout: Optional[Union[float, Tuple[float, float]]] = timeout
+        self.stream: bool = stream
+        self.max_file_size: int = max_file_size if max_file_size else self.max_file_size
+        self.max_download_time: Optional[float] = max_download_time
+        self._configure(strict_url, possible_paths, headers, possible_schemes, allow_redirects, detect_encoding,
+                        parse_memo, on_probe)
         self._parse(url)
 
     def _parse(self, url: str) -> None:
@@ -47,37 +121,77 @@ class URLParser:
         :param url: The url to search for a security.txt.
         :raises FileNotFoundError: if no security.txt could be found on the url.
         """
+        netloc = self._check_negative_cache(url)
         possible_file_urls = self._get_possible_file_urls(url)
-        # For all possible urls where a security.txt could be located, check if there is one.
-        for file_url in possible_file_urls:
-            if self._parse_file_url(file_url):
-                # The file has been parsed and set, so we can stop looking for other security.txt files
-                return
-        raise FileNotFoundError(f"No SecurityTXT File found on this url: {url}")
+        file_urls = possible_file_urls
+        if self.probe_order is not None and len(possible_file_urls) > 1:
+            file_urls = self.probe_order.order(possible_file_urls)
+        if self.hedge_delay is not None and len(file_urls) > 1:
+            found = self._parse_hedged(file_urls)
+        else:
+            found = self._parse_sequential(file_urls)
+        if self.probe_order is not None and len(possible_file_urls) > 1:
+            self.probe_order.update(possible_file_urls, file_urls, self.securitytxt.source_url if found else None)
+        if not found:
+            self._not_found(url, netloc, file_urls)
 
-    def _get_possible_file_urls(self, base_url: str) -> List[str]:
+    def _parse_sequential(self, file_urls: List[str]) -> bool:
         """
-        Returns all the possible urls where a security.txt could be located according to the draft RFC, section 4.
-        If strict_url has been set, it simply returns the given URL.
-        :param base_url: The base url.
-        :return: A list of URLS where the security.txt could be located. If strict_url is True, it returns a list
-        containing only the given url.
+        Request the possible urls one after another, and parse the file of the first url that has a security.txt.
+        :param file_urls: The possible urls, ordered by priority.
+        :returns True if a file has been found and parsed. False otherwise.
+        :raises AttributeError: if the file could not be parsed.
         """
-        if self.strict_url:
-            return [base_url]
-        normalized_url = self._normalize_url(base_url)
-        parsed_url = urlparse(normalized_url)
-        return [f"{scheme}://{parsed_url.netloc}{path}"
-                for path in self.possible_paths
-                for scheme in self.possible_schemes]
+        # For all possible urls where a security.txt could be located, check if there is one.
+        for file_url in file_urls:
+            if self._skip(file_url):
+                # The host refused the connection on this port, so the other urls on this port will fail as well
+                continue
+            if self._parse_file_url(file_url):
+                # The file has been parsed and set, so we can stop looking for other security.txt files
+                return True
+            if self._unreachable():
+                # The host cannot be resolved, so the other urls on this host will fail as well
+                return False
+        return False
 
-    def _normalize_url(self, url: str) -> str:
+    def _parse_hedged(self, file_urls: List[str]) -> bool:
         """
-        Normalize a url for further processing, e.g. add slashes for urlparse
-        :param url: The url to normalize
-        :return: The normalized url.
+        Request the possible urls concurrently, staggered by hedge_delay, and parse the file of the highest-priority url
+        that has a security.txt. The requests run on a thread pool that is shared by all URLParsers, with at most
+        max_hedge_workers threads. Requests that are no longer needed are cancelled if they have not started yet, and
+        ignored otherwise. A request that hangs blocks the lower-priority urls, so use a session with a timeout.
+        :param file_urls: The possible urls, ordered by priority.
+        :returns True if a file has been found and parsed. False otherwise.
+        :raises AttributeError: if the file could not be parsed.
         """
-        return url if '//' in url else f"//{url}"
+        executor = _get_hedge_executor(self.max_hedge_workers)
+        futures: List[Future] = []
+        next_start = monotonic()
+        # Index of the highest-priority url for which it is not yet known whether it has a security.txt
+        index = 0
+        try:
+            while index < len(file_urls):
+                if len(futures) < len(file_urls) and (index == len(futures) or monotonic() >= next_start):
+                    futures.append(executor.submit(self._get_file, file_urls[len(futures)]))
+                    next_start = monotonic() + self.hedge_delay
+                    continue
+                # Only the result of the highest-priority pending url decides what happens next
+                timeout = max(next_start - monotonic(), 0) if len(futures) < len(file_urls) else None
+                wait([futures[index]], timeout=timeout)
+                while index < len(futures) and futures[index].done():
+                    try:
+                        file = futures[index].result()
+                    except self.caught_exceptions as e:
+                        self._failed(file_urls[index], e)
+                        index += 1
+                        continue
+                    self._set_securitytxt(file, file_urls[index])
+                    return True
+            return False
+        finally:
+            for future in futures:
+                future.cancel()
 
     def _parse_file_url(self, file_url: str) -> bool:
         """
@@ -88,22 +202,156 @@ class URLParser:
         """
         try:
             file = self._get_file(file_url)
-            self.securitytxt = FileParser(file).securitytxt
-            self.securitytxt.source_url = file_url
-            return True
-        except (exceptions.RequestException, ConnectionError):
+        except self.caught_exceptions as e:
+            self._failed(file_url, e)
             return False
+        self._set_securitytxt(file, file_url)
+        return True
+
+    def _get_file(self, url: str) -> SecurityTXT:
+        """
+        Get a file from the URL, check if it could be a security.txt file and parse it. If on_probe is set, it is called
+        with the outcome of the probe.
+        :param url: A URL to location where a security.txt might be located.
+        :return: The parsed SecurityTXT.
+        :raises ConnectionError: If the URL does not contain a security.txt
+        :raises AttributeError: If the file could not be parsed.
+        """
+        if self.on_probe is None:
+            return self._fetch_file(url)
+        probe = self._probes.current = ProbeRecord(url)
+        try:
+            securitytxt = self._fetch_file(url)
+        except Exception as e:
+            self.on_probe(probe.event(e))
+            raise
+        self.on_probe(probe.event())
+        return securitytxt
 
-    def _get_file(self, url: str) -> str:
+    def _fetch_file(self, url: str) -> SecurityTXT:
         """
-        Get a file from the URL and check if it could be a security.txt file.
+        Get a file from the URL, check if it could be a security.txt file and parse it.
         :param url: A URL to location where a security.txt might be located.
-        :return: The text of a security.txt
+        :return: The parsed SecurityTXT.
         :raises ConnectionError: If the URL does not contain a security.txt
+        :raises AttributeError: If the file could not be parsed.
         """
-        response = get(url, headers=self.headers, allow_redirects=self.allow_redirects)
-        if not response.ok:
-            raise ConnectionError(f"Url {url} returned non-successful status code {response.status_code}")
-        if '<htm' in response.text:
-            raise ConnectionError(f"Url {url} returned an HTML-page")
-        return response.text
+        if self.cache is not None:
+            return self._get_cached_file(url)
+        return self._read_file(url, self._request(url, self.headers))
+
+    def _get_cached_file(self, url: str) -> SecurityTXT:
+        """
+        Get a file from the URL with a conditional request if it is cached. If the file has not been modified, the
+        cached SecurityTXT is returned. Otherwise, the file is parsed and stored in the cache.
+        :param url: A URL to location where a security.txt might be located.
+        :return: The parsed SecurityTXT.
+        :raises ConnectionError: If the URL does not contain a security.txt
+        :raises AttributeError: If the file could not be parsed.
+        """
+        entry = self.cache.get(url)
+        headers = {**self.headers, **entry.conditional_headers} if entry else self.headers
+        response = self._request(url, headers)
+        if entry and response.status_code == 304:
+            response.close()
+            self._record(outcome=ProbeEvent.NOT_MODIFIED)
+            return entry.securitytxt
+        securitytxt = self._read_file(url, response)
+        self.cache.set(url, securitytxt, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return securitytxt
+
+    def _request(self, url: str, headers: Dict) -> Response:
+        """
+        Send a GET request to the URL.
+        :param url: A URL to location where a security.txt might be located.
+        :param headers: The headers for the request.
+        :return: The response. If stream is set, the content has not been read yet.
+        """
+        if self.rate_limiter is not None:
+            response = self._request_limited(url, headers)
+        else:
+            response = self.session.get(url, headers=headers, allow_redirects=self.allow_redirects,
+                                        timeout=self.timeout, stream=self.stream)
+        self._record(status=response.status_code, request_time=response.elapsed.total_seconds())
+        return response
+
+    def _request_limited(self, url: str, headers: Dict) -> Response:
+        """
+        Send a GET request to the URL when the rate limiter allows it. If the host answers that it is rate limited, it
+        is blocked for the Retry-After time, and the request is retried if that time is short enough.
+        :param url: A URL to location where a security.txt might be located.
+        :param headers: The headers for the request.
+        :return: The response. If stream is set, the content has not been read yet.
+        """
+        for attempt in range(self.rate_limiter.max_retries + 1):
+            with self.rate_limiter.acquire(url):
+                response = self.session.get(url, headers=headers, allow_redirects=self.allow_redirects,
+                                            timeout=self.timeout, stream=self.stream)
+            retry_after = self.rate_limiter.retry_after(response)
+            if retry_after is None:
+                return response
+            self.rate_limiter.penalize(url, retry_after)
+            if attempt == self.rate_limiter.max_retries or retry_after > self.rate_limiter.max_retry_after:
+                return response
+            response.close()
+        return response
+
+    def _read_file(self, url: str, response: Response) -> SecurityTXT:
+        """
+        Read the content of a response, check if it could be a security.txt file and parse it.
+        :param url: The URL the response was retrieved from.
+        :param response: The response.
+        :return: The parsed SecurityTXT.
+        :raises ConnectionError: If the response is not a security.txt
+        :raises AttributeError: If the file could not be parsed.
+        """
+        content_type = response.headers.get('Content-Type', '')
+        if not self.stream:
+            return self._parse_content(url, response.ok, response.status_code, response.content, content_type)
+        with response:
+            self._check_file(url, response.ok, response.status_code, '')
+            if 'html' in content_type.lower():
+                self._miss(ProbeEvent.HTML)
+                raise ConnectionError(f"Url {url} returned an HTML-page")
+            content_length = self._content_length(response)
+            if content_length is not None and content_length > self.max_file_size:
+                self._record(outcome=ProbeEvent.TOO_LARGE)
+                raise ConnectionError(f"Url {url} returned a file larger than {self.max_file_size} bytes")
+            content = self._read_content(url, response)
+        return self._parse_content(url, True, response.status_code, content, content_type)
+
+    @staticmethod
+    def _content_length(response: Response) -> Optional[int]:
+        """
+        Get the Content-Length of a response. The header is sent by the server, so it may be malformed.
+        :param response: The response.
+        :return: The length in bytes, or None if the header is missing or not a single non-negative integer.
+        """
+        content_length = response.headers.get('Content-Length', '').strip()
+        return int(content_length) if content_length.isascii() and content_length.isdigit() else None
+
+    def _read_content(self, url: str, response: Response) -> bytes:
+        """
+        Read the content of a streamed response in chunks, and stop as soon as it is clear that it is not a
+        security.txt.
+        :param url: The URL the response was retrieved from.
+        :param response: The streamed response.
+        :return: The content of the response.
+        :raises ConnectionError: If the response is an HTML-page, is too large or takes too long to download.
+        """
+        content = bytearray()
+        deadline = monotonic() + self.max_download_time if self.max_download_time is not None else None
+        for chunk in response.iter_content(self.chunk_size):
+            # Include the end of the previous chunk, in case the HTML-tag is split over two chunks
+            if b'<htm' in content[-3:] + chunk:
+                self._miss(ProbeEvent.HTML)
+                raise ConnectionError(f"Url {url} returned an HTML-page")
+            content += chunk
+            if len(content) > self.max_file_size:
+                self._record(outcome=ProbeEvent.TOO_LARGE)
+                raise ConnectionError(f"Url {url} returned a file larger than {self.max_file_size} bytes")
+            if deadline is not None and monotonic() > deadline:
+                self._record(outcome=ProbeEvent.TOO_SLOW)
+                raise ConnectionError(f"Url {url} took longer than {self.max_download_time} seconds to download")
+        return bytes(content)
+
@@ -0,0 +1,355 @@
+import mmap
+import sys
+import zlib
+from array import array
+from calendar import timegm
+from datetime import datetime, timedelta, timezone
+from struct import Struct
+from typing import Any, Dict, Iterator, List, Tuple
+
+from securitytxt.securitytxt import SecurityTXT
+
+
+class _Format:
+    """The constants of the result archive format, shared by the ArchiveWriter and the ArchiveReader.
+
+    An archive starts with the magic bytes, followed by the records. A record is its length as a 4-byte unsigned
+    integer, followed by the number of fields and per field the id of its name in the string table, a type tag and the
+    value. Fields that have the value of a new SecurityTXT, such as empty lists, are left out. After the records come
+    the string table, as the concatenated UTF-8 strings followed by the offsets at which they start, and the offsets of
+    the records. The archive ends with the positions of those tables and their sizes, and the magic bytes again. All
+    integers are big-endian.
+    """
+    magic = b'STXARCH1'
+    length = Struct('>I')
+    count = Struct('>H')
+    field = Struct('>IB')
+    offset = Struct('>Q')
+    footer = Struct('>QQQQ')
+    expires = Struct('>qIi')
+    # Stored in place of the utc offset of a datetime without timezone
+    naive = -2 ** 31
+
+    NONE = 0
+    STRING = 1
+    INLINE_STRING = 2
+    COMPRESSED_STRING = 3
+    STRING_LIST = 4
+    INLINE_STRING_LIST = 5
+    DATETIME = 6
+
+    # The fields whose values are mostly unique, that are stored in the record instead of in the string table
+    inline_fields = frozenset(['raw', 'signature', 'source_url', 'comments'])
+    # The fields that a new SecurityTXT has, with their values. Fields that still have this value are not stored.
+    defaults = SecurityTXT().to_dict()
+    epoch = datetime(1970, 1, 1)
+
+
+class ArchiveWriter:
+    """Writes scan results to a compact binary archive, that can be read back with the ArchiveReader. A record is
+    written per SecurityTXT as soon as it is added, with all its fields, including the signature and the unknown fields.
+    Field names and the values of the url fields are written once to a string table and referred to by id, so urls that
+    are repeated across files, such as those of bug bounty platforms, are stored once. The raw text is compressed, and
+    expires is stored as seconds since the epoch. The string table is kept in memory until the archive is closed.
+
+    Attributes:
+        path: the path of the archive.
+        keep_raw: whether to store the raw texts.
+        compress_raw: whether to compress the raw texts.
+
+    Public methods:
+        write: Add a SecurityTXT to the archive
+        close: Write the string table and the index, and close the archive
+
+    Raises:
+        :raises ValueError: if a field has a value that cannot be stored.
+    """
+
+    def __init__(self, path: str, keep_raw: bool = True, compress_raw: bool = True):
+        """Initialize the variables and start the archive. An existing file is overwritten."""
+        self.path: str = path
+        self.keep_raw: bool = keep_raw
+        self.compress_raw: bool = compress_raw
+        self._file = open(path, 'wb')
+        self._file.write(_Format.magic)
+        self._position: int = len(_Format.magic)
+        self._offsets = array('Q')
+        self._strings: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """The number of records written."""
+        return len(self._offsets)
+
+    def __enter__(self) -> 'ArchiveWriter':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def write(self, securitytxt: SecurityTXT) -> int:
+        """
+        Add a SecurityTXT to the archive.
+        :param securitytxt: The SecurityTXT, or another object with a to_dict method such as a CompactSecurityTXT.
+        :return: The index of the record.
+        :raises ValueError: if a field has a value that cannot be stored.
+        """
+        fields = {key: value for key, value in securitytxt.to_dict(include_raw=self.keep_raw).items()
+                  if key not in _Format.defaults or value != _Format.defaults[key]}
+        record = bytearray(_Format.count.pack(len(fields)))
+        for key, value in fields.items():
+            self._encode_field(record, key, value)
+        self._offsets.append(self._position)
+        self._file.write(_Format.length.pack(len(record)))
+        self._file.write(record)
+        self._position += _Format.length.size + len(record)
+        return len(self._offsets) - 1
+
+    def close(self) -> None:
+        """Write the string table and the index, and close the archive."""
+        if self._file.closed:
+            return
+        strings_position = self._position
+        string_offsets = array('Q', [0])
+        for string in self._strings:
+            encoded = string.encode('utf-8', 'surrogatepass')
+            self._file.write(encoded)
+            string_offsets.append(string_offsets[-1] + len(encoded))
+        string_index_position = strings_position + string_offsets[-1]
+        self._file.write(self._pack_offsets(string_offsets))
+        records_position = string_index_position + len(string_offsets) * _Format.offset.size
+        self._file.write(self._pack_offsets(self._offsets))
+        self._file.write(_Format.footer.pack(strings_position, len(self._strings), records_position,
+                                             len(self._offsets)))
+        self._file.write(_Format.magic)
+        self._file.close()
+
+    def _encode_field(self, record: bytearray, key: str, value: Any) -> None:
+        """
+        Encode a field and append it to a record.
+        :param record: The record.
+        :param key: The name of the field.
+        :param value: The value of the field.
+        :raises ValueError: if the value cannot be stored.
+        """
+        key_id = self._string_id(key)
+        if value is None:
+            record += _Format.field.pack(key_id, _Format.NONE)
+        elif isinstance(value, str) and key == 'raw' and self.compress_raw:
+            record += _Format.field.pack(key_id, _Format.COMPRESSED_STRING)
+            self._append_bytes(record, zlib.compress(value.encode('utf-8', 'surrogatepass')))
+        elif isinstance(value, str) and key in _Format.inline_fields:
+            record += _Format.field.pack(key_id, _Format.INLINE_STRING)
+            self._append_bytes(record, value.encode('utf-8', 'surrogatepass'))
+        elif isinstance(value, str):
+            record += _Format.field.pack(key_id, _Format.STRING)
+            record += _Format.length.pack(self._string_id(value))
+        elif isinstance(value, datetime):
+            offset = value.utcoffset()
+            seconds = timegm(value.utctimetuple())
+            record += _Format.field.pack(key_id, _Format.DATETIME)
+            record += _Format.expires.pack(seconds, value.microsecond,
+                                           _Format.naive if offset is None else int(offset.total_seconds()))
+        elif isinstance(value, list) and all(isinstance(item, str) for item in value):
+            inline = key in _Format.inline_fields
+            record += _Format.field.pack(key_id, _Format.INLINE_STRING_LIST if inline else _Format.STRING_LIST)
+            record += _Format.length.pack(len(value))
+            for item in value:
+                if inline:
+                    self._append_bytes(record, item.encode('utf-8', 'surrogatepass'))
+                else:
+                    record += _Format.length.pack(self._string_id(item))
+        else:
+            raise ValueError(f"The value of field {key} cannot be stored: {value!r}")
+
+    def _string_id(self, string: str) -> int:
+        """
+        Get the id of a string in the string table, and add it if it is not in the table yet.
+        :param string: The string.
+        :return: The id.
+        """
+        string_id = self._strings.get(string)
+        if string_id is None:
+            string_id = self._strings[string] = len(self._strings)
+        return string_id
+
+    @staticmethod
+    def _append_bytes(record: bytearray, data: bytes) -> None:
+        """Append length-prefixed bytes to a record."""
+        record += _Format.length.pack(len(data))
+        record += data
+
+    @staticmethod
+    def _pack_offsets(offsets: array) -> bytes:
+        """Pack offsets as big-endian 8-byte unsigned integers."""
+        packed = array('Q', offsets)
+        if sys.byteorder == 'little':
+            packed.byteswap()
+        return packed.tobytes()
+
+
+class ArchiveReader:
+    """Reads an archive written by the ArchiveWriter. The archive is memory-mapped, and a record is only decoded when
+    it is accessed, so opening an archive takes constant time and memory, whatever its size. Records can be accessed by
+    index or iterated over in order. The strings of the string table are decoded on first use.
+
+    Attributes:
+        path: the path of the archive.
+        keep_raw: whether to decode the raw texts. If False, the raw texts are skipped without decompressing them.
+
+    Public methods:
+        get_dict: Decode the fields of a record, without creating a SecurityTXT
+        close: Close the archive
+
+    Raises:
+        :raises ValueError: if the file is not an archive or is truncated.
+        :raises IndexError: if a record index is out of range.
+    """
+
+    def __init__(self, path: str, keep_raw: bool = True):
+        """Initialize the variables and map the archive."""
+        self.path: str = path
+        self.keep_raw: bool = keep_raw
+        with open(path, 'rb') as archive:
+            size = archive.seek(0, 2)
+            if size < 2 * len(_Format.magic) + _Format.footer.size:
+                raise ValueError(f"{path} is not a result archive or is truncated")
+            self._buffer = mmap.mmap(archive.fileno(), 0, access=mmap.ACCESS_READ)
+        end = size - len(_Format.magic)
+        if self._buffer[:len(_Format.magic)] != _Format.magic or self._buffer[end:] != _Format.magic:
+            self._buffer.close()
+            raise ValueError(f"{path} is not a result archive or is truncated")
+        self._strings_position, self._string_count, self._records_position, self._record_count = \
+            _Format.footer.unpack_from(self._buffer, end - _Format.footer.size)
+        self._string_index_position = self._records_position - (self._string_count + 1) * _Format.offset.size
+        index_end = self._records_position + self._record_count * _Format.offset.size
+        if not self._strings_position <= self._string_index_position or index_end != end - _Format.footer.size:
+            self._buffer.close()
+            raise ValueError(f"{path} is not a result archive or is truncated")
+        self._strings: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        """The number of records in the archive."""
+        return self._record_count
+
+    def __enter__(self) -> 'ArchiveReader':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __getitem__(self, index: int) -> SecurityTXT:
+        """
+        Decode a record.
+        :param index: The index of the record. Negative indexes count from the end.
+        :return: The SecurityTXT.
+        :raises IndexError: if the index is out of range.
+        """
+        return SecurityTXT.from_dict(self.get_dict(index))
+
+    def __iter__(self) -> Iterator[SecurityTXT]:
+        """
+        Decode the records in order.
+        :return: An iterator of the SecurityTXTs.
+        """
+        return (self[index] for index in range(self._record_count))
+
+    def get_dict(self, index: int) -> Dict[str, Any]:
+        """
+        Decode the fields of a record, in the form of SecurityTXT.to_dict, without creating a SecurityTXT.
+        :param index: The index of the record. Negative indexes count from the end.
+        :return: The fields, by name.
+        :raises IndexError: if the index is out of range.
+        """
+        if index < 0:
+            index += self._record_count
+        if not 0 <= index < self._record_count:
+            raise IndexError(f"Record index {index} is out of range")
+        position = _Format.offset.unpack_from(self._buffer, self._records_position + index * _Format.offset.size)[0]
+        length = _Format.length.unpack_from(self._buffer, position)[0]
+        position += _Format.length.size
+        if position + length > self._strings_position:
+            raise ValueError(f"{self.path} is truncated at record {index}")
+        fields = {key: list(value) if type(value) is list else value for key, value in _Format.defaults.items()
+                  if key != 'raw' or self.keep_raw}
+        count = _Format.count.unpack_from(self._buffer, position)[0]
+        position += _Format.count.size
+        for _ in range(count):
+            key_id, tag = _Format.field.unpack_from(self._buffer, position)
+            key = self._string(key_id)
+            skip = key == 'raw' and not self.keep_raw
+            value, position = self._decode_value(tag, position + _Format.field.size, skip)
+            if not skip:
+                fields[key] = value
+        return fields
+
+    def close(self) -> None:
+        """Close the archive."""
+        self._buffer.close()
+
+    def _decode_value(self, tag: int, position: int, skip: bool) -> Tuple[Any, int]:
+        """
+        Decode the value of a field.
+        :param tag: The type tag of the value.
+        :param position: The position of the value.
+        :param skip: Whether the value is not needed, so a compressed value is not decompressed.
+        :return: The value, and the position after it.
+        :raises ValueError: if the tag is unknown.
+        """
+        if tag == _Format.NONE:
+            return None, position
+        if tag == _Format.STRING:
+            return self._string(_Format.length.unpack_from(self._buffer, position)[0]), position + _Format.length.size
+        if tag in (_Format.INLINE_STRING, _Format.COMPRESSED_STRING):
+            data, position = self._bytes(position)
+            if skip:
+                return None, position
+            if tag == _Format.COMPRESSED_STRING:
+                data = zlib.decompress(data)
+            return data.decode('utf-8', 'surrogatepass'), position
+        if tag == _Format.DATETIME:
+            seconds, microseconds, offset = _Format.expires.unpack_from(self._buffer, position)
+            value = _Format.epoch + timedelta(seconds=seconds, microseconds=microseconds)
+            if offset != _Format.naive:
+                value = value.replace(tzinfo=timezone.utc).astimezone(timezone(timedelta(seconds=offset)))
+            return value, position + _Format.expires.size
+        if tag in (_Format.STRING_LIST, _Format.INLINE_STRING_LIST):
+            count = _Format.length.unpack_from(self._buffer, position)[0]
+            position += _Format.length.size
+            values: List[str] = []
+            for _ in range(count):
+                if tag == _Format.STRING_LIST:
+                    values.append(self._string(_Format.length.unpack_from(self._buffer, position)[0]))
+                    position += _Format.length.size
+                else:
+                    data, position = self._bytes(position)
+                    values.append(data.decode('utf-8', 'surrogatepass'))
+            return values, position
+        raise ValueError(f"{self.path} contains an unknown field type {tag}")
+
+    def _bytes(self, position: int) -> Tuple[bytes, int]:
+        """
+        Read length-prefixed bytes.
+        :param position: The position of the length.
+        :return: The bytes, and the position after them.
+        """
+        start = position + _Format.length.size
+        end = start + _Format.length.unpack_from(self._buffer, position)[0]
+        return self._buffer[start:end], end
+
+    def _string(self, string_id: int) -> str:
+        """
+        Get a string from the string table, decoding it on first use.
+        :param string_id: The id of the string.
+        :return: The string.
+        """
+        string = self._strings.get(string_id)
+        if string is None:
+            if not 0 <= string_id < self._string_count:
+                raise ValueError(f"{self.path} refers to an unknown string {string_id}")
+            index = self._string_index_position + string_id * _Format.offset.size
+            start, end = _Format.offset.unpack_from(self._buffer, index)[0], \
+                _Format.offset.unpack_from(self._buffer, index + _Format.offset.size)[0]
+            string = self._buffer[self._strings_position + start:self._strings_position + end].decode(
+                'utf-8', 'surrogatepass')
+            self._strings[string_id] = string
+        return string
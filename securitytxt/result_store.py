@@ -0,0 +1,114 @@
+from typing import Dict, Iterator, Optional
+
+from securitytxt.parsers.parse_memo import ParseMemo
+from securitytxt.securitytxt import SecurityTXT
+
+
+class ResultStore:
+    """A store of the securitytxts found on many hosts, that keeps a single SecurityTXT per distinct file. Files are
+    identified by the hash of their raw text, and the source urls are kept separately, so byte-identical files served
+    by many hosts take the memory of one. Securitytxts without a raw text, such as the results of parse_many, are
+    identified by the hash of their fields instead.
+
+    Attributes:
+        dedup_ratio: the number of source urls per distinct file.
+
+    Public methods:
+        add: Add the securitytxt found on a source url
+        get: Get the securitytxt found on a source url
+        get_shared: Get the single SecurityTXT that is stored for a file
+        digest: Get the hash of the file found on a source url
+        file_digest: Compute the hash by which a securitytxt is identified (static method)
+
+    Raises:
+        :raises KeyError: if a source url or hash is not in the store.
+    """
+
+    def __init__(self):
+        """Initialize the variables."""
+        self._results: Dict[str, SecurityTXT] = {}
+        self._sources: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        """The number of source urls in the store."""
+        return len(self._sources)
+
+    def __contains__(self, source_url: str) -> bool:
+        """Whether a source url is in the store."""
+        return source_url in self._sources
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the source urls in the store."""
+        return iter(self._sources)
+
+    @property
+    def unique(self) -> int:
+        """The number of distinct files in the store."""
+        return len(self._results)
+
+    @property
+    def dedup_ratio(self) -> float:
+        """The number of source urls per distinct file, or 1.0 if the store is empty."""
+        return len(self._sources) / len(self._results) if self._results else 1.0
+
+    def add(self, securitytxt: SecurityTXT, source_url: Optional[str] = None) -> str:
+        """
+        Add the securitytxt found on a source url. If the same file has been added before, only the source url is
+        stored.
+        :param securitytxt: The securitytxt.
+        :param source_url: (optional) The url the securitytxt was found on. Defaults to its source_url attribute.
+        :return: The hash of the file.
+        """
+        source_url = source_url if source_url else securitytxt.source_url
+        digest = self.file_digest(securitytxt)
+        if digest not in self._results:
+            shared = ParseMemo.copy(securitytxt)
+            shared.source_url = None
+            self._results[digest] = shared
+        self._sources[source_url] = digest
+        return digest
+
+    def get(self, source_url: str) -> SecurityTXT:
+        """
+        Get the securitytxt found on a source url.
+        :param source_url: The source url.
+        :return: A copy of the stored SecurityTXT, with the source_url set.
+        :raises KeyError: if the source url is not in the store.
+        """
+        securitytxt = ParseMemo.copy(self._results[self._sources[source_url]])
+        securitytxt.source_url = source_url
+        return securitytxt
+
+    def get_shared(self, digest: str) -> SecurityTXT:
+        """
+        Get the single SecurityTXT that is stored for a file. It is shared by all source urls with that file, so it
+        should not be modified, and its source_url is not set.
+        :param digest: The hash of the file.
+        :return: The stored SecurityTXT.
+        :raises KeyError: if no file with the hash is in the store.
+        """
+        return self._results[digest]
+
+    def digest(self, source_url: str) -> str:
+        """
+        Get the hash of the file found on a source url.
+        :param source_url: The source url.
+        :return: The hash of the file.
+        :raises KeyError: if the source url is not in the store.
+        """
+        return self._sources[source_url]
+
+    @staticmethod
+    def file_digest(securitytxt: SecurityTXT) -> str:
+        """
+        Compute the hash by which a securitytxt is identified: the hash of its raw text, or if it has no raw text, the
+        hash of its fields other than the source url.
+        :param securitytxt: The securitytxt.
+        :return: The hexadecimal hash.
+        """
+        raw = securitytxt.raw
+        if raw:
+            return ParseMemo.digest(raw)
+        fields = securitytxt.to_dict(include_raw=False)
+        fields.pop('source_url', None)
+        return ParseMemo.digest(repr(sorted(fields.items())))
@@ -0,0 +1,162 @@
+import gzip
+import heapq
+from random import Random
+from struct import Struct
+from time import time
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from securitytxt.securitytxt import SecurityTXT
+
+
+class RecrawlScheduler:
+    """Decides when to look up hosts again, based on the results of the previous lookup. A host with a security.txt is
+    due when its file expires, a host without a security.txt is due after a backoff that grows with every failed
+    lookup, and every interval is kept between min_interval and max_interval and jittered, so that hosts that were
+    looked up together do not all become due at the same moment. The hosts are kept in a heap keyed on the time they
+    are due, so the due hosts are found without looking at the others. The state can be saved to a compact file.
+
+    Attributes:
+        :class default_min_interval: the default minimum interval between two lookups of a host, in seconds.
+        :class default_max_interval: the default maximum interval between two lookups of a host, in seconds.
+        min_interval: the minimum interval between two lookups of a host, in seconds.
+        max_interval: the maximum interval between two lookups of a host, in seconds.
+        jitter: the fraction by which an interval is randomly made shorter or longer.
+        backoff_factor: the factor by which the interval grows with every failed lookup.
+
+    Public methods:
+        add: Add a host, that is due immediately unless it is already scheduled
+        update: Schedule the next lookup of a host based on the result of its lookup
+        due: Iterate over the hosts that are due
+        next_due: Get the time at which the next host is due
+        save: Save the state to a file
+        load: Load the state from a file (class method)
+
+    Raises:
+        :raises ValueError: if a state file is invalid.
+    """
+    default_min_interval: float = 24 * 60 * 60
+    default_max_interval: float = 30 * 24 * 60 * 60
+
+    _magic = b'STXSCHD1'
+    _record = Struct('>IBH')
+
+    def __init__(self, min_interval: Optional[float] = None, max_interval: Optional[float] = None,
+                 jitter: float = 0.1, backoff_factor: float = 2.0, seed: Optional[int] = None):
+        """Initialize the variables."""
+        self.min_interval: float = min_interval if min_interval else self.default_min_interval
+        self.max_interval: float = max_interval if max_interval else self.default_max_interval
+        self.jitter: float = jitter
+        self.backoff_factor: float = backoff_factor
+        self._random = Random(seed)
+        # Per host the time it is due and the number of failed lookups in a row
+        self._hosts: Dict[str, Tuple[float, int]] = {}
+        # Entries that no longer match the due time of their host are skipped when they are popped
+        self._heap: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        """The number of scheduled hosts."""
+        return len(self._hosts)
+
+    def __contains__(self, host: str) -> bool:
+        """Whether a host is scheduled."""
+        return host in self._hosts
+
+    def add(self, host: str, due: Optional[float] = None) -> None:
+        """
+        Add a host. Hosts that are already scheduled are not changed.
+        :param host: The host.
+        :param due: (optional) The time at which the host is due. Defaults to now.
+        """
+        if host not in self._hosts:
+            self._schedule(host, time() if due is None else due, 0)
+
+    def update(self, host: str, result: Union[SecurityTXT, Exception], now: Optional[float] = None) -> float:
+        """
+        Schedule the next lookup of a host based on the result of its lookup.
+        :param host: The host.
+        :param result: The SecurityTXT found on the host, or the exception raised while looking for it.
+        :param now: (optional) The time of the lookup. Defaults to now.
+        :return: The time at which the host is due again.
+        """
+        now = time() if now is None else now
+        if isinstance(result, Exception):
+            failures = min(self._hosts.get(host, (0.0, 0))[1] + 1, 255)
+            interval = self.min_interval * self.backoff_factor ** (failures - 1)
+        else:
+            failures = 0
+            interval = result.expires.timestamp() - now if result.expires else self.max_interval
+        interval = min(max(interval, self.min_interval), self.max_interval)
+        interval *= 1 + self._random.uniform(-self.jitter, self.jitter)
+        self._schedule(host, now + interval, failures)
+        return now + interval
+
+    def due(self, now: Optional[float] = None) -> Iterator[str]:
+        """
+        Iterate over the hosts that are due, the host that has been due the longest first. A host stays scheduled
+        until update is called with the result of its lookup, but is not yielded again before that.
+        :param now: (optional) The current time. Defaults to now.
+        :return: An iterator of the due hosts.
+        """
+        now = time() if now is None else now
+        while self._heap and self._heap[0][0] <= now:
+            due, host = heapq.heappop(self._heap)
+            if self._hosts.get(host, (None,))[0] == due:
+                yield host
+
+    def next_due(self) -> Optional[float]:
+        """
+        Get the time at which the next host is due.
+        :return: The time, or None if no host is waiting to become due.
+        """
+        while self._heap and self._hosts.get(self._heap[0][1], (None,))[0] != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def save(self, path: str) -> None:
+        """
+        Save the state to a gzip-compressed file, with a fixed-size record per host. Due times are stored in whole
+        seconds.
+        :param path: The path of the file. An existing file is overwritten.
+        """
+        with gzip.open(path, 'wb') as state:
+            state.write(self._magic)
+            for host, (due, failures) in self._hosts.items():
+                encoded = host.encode('utf-8')
+                state.write(self._record.pack(min(max(int(due), 0), 2 ** 32 - 1), failures, len(encoded)))
+                state.write(encoded)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> 'RecrawlScheduler':
+        """
+        Load the state from a file created by save.
+        :param path: The path of the file.
+        :param kwargs: The keyword arguments for the scheduler, such as min_interval.
+        :return: The scheduler.
+        :raises ValueError: if the file is not a valid state file.
+        """
+        scheduler = cls(**kwargs)
+        with gzip.open(path, 'rb') as state:
+            if state.read(len(cls._magic)) != cls._magic:
+                raise ValueError(f"{path} is not a scheduler state file")
+            while True:
+                header = state.read(cls._record.size)
+                if not header:
+                    break
+                if len(header) < cls._record.size:
+                    raise ValueError(f"{path} is truncated")
+                due, failures, length = cls._record.unpack(header)
+                host = state.read(length).decode('utf-8')
+                scheduler._hosts[host] = (float(due), failures)
+                scheduler._heap.append((float(due), host))
+        heapq.heapify(scheduler._heap)
+        return scheduler
+
+    def _schedule(self, host: str, due: float, failures: int) -> None:
+        """
+        Set the time at which a host is due.
+        :param host: The host.
+        :param due: The time.
+        :param failures: The number of failed lookups in a row.
+        """
+        self._hosts[host] = (due, failures)
+        heapq.heappush(self._heap, (due, host))
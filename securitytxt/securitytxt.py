@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import List, Union, Optional
+from typing import List, Union, Optional, Iterable, Iterator, Tuple, AsyncIterator, Dict, Any
 
 
 class SecurityTXT:
@@ -10,6 +10,8 @@ class SecurityTXT:
         source_url: the url where the securitytxt was found, if the file is retrieved from the internet.
         contact: list if contacts provided in the security.txt file.
         expires: expiry date of the security.txt (if available, None otherwise)
+        expires_format: the format of the expiry date: 'rfc3339' if it follows the draft RFC, 'lenient' otherwise (if
+        available, None otherwise)
         encryption: list of urls to public keys as provided in the security.txt file
         acknowledgement: list of urls to acknowledgement pages as provided in the security.txt file
         preferred_languages: list of preferred languages for contact as provided in security.txt file
@@ -18,16 +20,32 @@ class SecurityTXT:
         hiring: list of urls to job advertisement pages as provided in the security.txt file
         comments: list of comment lines in the security.txt file
         signature: the PGP signature of the file, (if available, None otherwise)
+        encoding: the encoding the file was decoded with, if it was parsed from bytes (None otherwise)
+        decoding: how the encoding was chosen, if it was parsed from bytes (None otherwise). See BytesParser.
 
     Public methods:
         from_url: Retrieve and parse a security.txt file from a given url (static method)
-        from_file: Parse a given security.txt file (static method)
+        from_urls: Retrieve and parse security.txt files from many urls concurrently (static method)
+        afrom_url: Retrieve and parse a security.txt file from a given url with asyncio (static coroutine)
+        afrom_urls: Retrieve and parse security.txt files from many urls concurrently with asyncio (static method)
+        from_text: Parse a given security.txt file from a string (static method)
+        from_file: Parse a given security.txt file from a file object, line by line (static method)
+        from_bytes: Parse a given security.txt file from its raw bytes (static method)
+        parse_many: Parse many security.txt files on a pool of worker processes (static method)
+        verify_signatures: Verify the signatures of many security.txt files on a pool of worker threads (static method)
+        verify_signature: Verify the PGP signature of the securitytxt
         add_field: Add a field (key/value pair) to the securitytxt object
+        compact: Create a memory-efficient representation of the securitytxt, see CompactSecurityTXT
+        to_dict: Get the fields of the securitytxt as a dictionary
+        from_dict: Create a securitytxt from a dictionary created by to_dict (static method)
         is_valid: Checks if securitytxt file is considered valid according to the draft RFC.
         required_fields_present: Checks if the fields required according to the draft RFC are non-empty
         canonical_url: Checks if a given url is in the list of canonical urls
         expired: Checks if a security.txt has expired according to the specified expiry date.
     """
+    expires_format: Optional[str] = None
+    encoding: Optional[str] = None
+    decoding: Optional[str] = None
 
     def __init__(self, raw: str = "", source_url: str = None, contact: List[str] = None, expires: datetime = None,
                  encryption: List[str] = None, acknowledgement: List[str] = None, preferred_languages: List[str] = None,
@@ -95,28 +113,201 @@ class SecurityTXT:
         else:
             getattr(self, key).append(value)
 
+    def to_dict(self, include_raw: bool = True) -> Dict[str, Any]:
+        """
+        Get the fields of the securitytxt as a dictionary, including the unknown fields. The lists are copied, the other
+        values are shared. expires remains a datetime.
+        :param include_raw: Whether to include the raw text.
+        :return: The fields, by name.
+        """
+        return {key: list(value) if type(value) is list else value for key, value in vars(self).items()
+                if not key.startswith('_') and (include_raw or key != 'raw')}
+
+    @staticmethod
+    def from_dict(fields: Dict[str, Any]) -> 'SecurityTXT':
+        """
+        Create a securitytxt from a dictionary created by to_dict.
+        :param fields: The fields, by name. Missing fields get their default value.
+        :return: The SecurityTXT.
+        """
+        securitytxt = SecurityTXT()
+        for key, value in fields.items():
+            setattr(securitytxt, key, list(value) if type(value) is list else value)
+        return securitytxt
+
+    def compact(self, keep_raw: bool = True) -> 'CompactSecurityTXT':
+        """
+        Create a memory-efficient representation of the securitytxt, for keeping many of them in memory.
+        :param keep_raw: Whether to keep the raw text. If False, the raw text is dropped to save memory.
+        :return: A CompactSecurityTXT with the same fields.
+        """
+        from securitytxt.compact_securitytxt import CompactSecurityTXT
+        return CompactSecurityTXT.from_securitytxt(self, keep_raw)
+
+    def verify_signature(self, verifier: Optional['SignatureVerifier'] = None, **kwargs) -> 'VerificationResult':
+        """
+        Verify the PGP signature of the securitytxt against the key at its Encryption urls. Requires pgpy.
+        :param verifier: (optional) The verifier, to share its key cache and results between files.
+        :param kwargs: Keyword arguments for a new SignatureVerifier, if no verifier is given.
+        :return: The result of the verification. See SignatureVerifier.
+        """
+        from securitytxt.parsers.signature_verifier import SignatureVerifier
+        return (verifier if verifier else SignatureVerifier(**kwargs)).verify(self)
+
     @staticmethod
-    def from_url(url: str, strict_url: bool = False) -> 'SecurityTXT':
+    def from_url(url: str, strict_url: bool = False, **kwargs) -> 'SecurityTXT':
         """
         Retrieve and parse a securitytxt from a given url or IP address. Unless strict_url is set, it will also look for
         the securitytxt at paths that are allowed according to the specification, such as /.well-known/security.txt
         :param url: The url / IP from which to retrieve the securitytxt
         :param strict_url: Set to True to only look at the url specified, not any subpaths like '.well-known/security.txt'
+        :param kwargs: Additional keyword arguments for the URLParser, such as a requests session. See
+        securitytxt.parsers.http_session.create_session for a session with configurable pooling, retries and timeouts.
         :return: A SecurityTXT object, that represents the securitytxt found.
         :raises FileNotFoundError: if no security.txt file could be found on the URL.
         :raises AttributeError: if a security.txt has been found, but could not be parsed.
         :raises requests.exceptions.RequestException: for all other exceptions concerning requests
         """
         from securitytxt.parsers.url_parser import URLParser
-        return URLParser(url, strict_url).securitytxt
+        return URLParser(url, strict_url, **kwargs).securitytxt
+
+    @staticmethod
+    def from_urls(urls: Iterable[str], max_workers: Optional[int] = None, strict_url: bool = False,
+                  **kwargs) -> Iterator[Tuple[str, Union['SecurityTXT', Exception]]]:
+        """
+        Retrieve and parse securitytxts from many urls or IP addresses concurrently, on a bounded pool of worker
+        threads. Results are yielded as soon as they are available, so the order of the results may differ from the
+        input order.
+        :param urls: The urls / IPs from which to retrieve the securitytxts. May be a (lazy) iterator of any length.
+        :param max_workers: (optional) The number of lookups to run at the same time.
+        :param strict_url: Set to True to only look at the urls specified, not any subpaths like
+        '.well-known/security.txt'
+        :param kwargs: Additional keyword arguments for the URLParser, such as possible_paths or headers.
+        :return: An iterator of (url, result) tuples. The result is a SecurityTXT object if one was found, or the
+        FileNotFoundError, AttributeError, ValueError or requests.exceptions.RequestException raised while looking for
+        it.
+        """
+        from securitytxt.parsers.bulk_url_parser import BulkURLParser
+        return iter(BulkURLParser(urls, max_workers, strict_url, **kwargs))
+
+    @staticmethod
+    async def afrom_url(url: str, strict_url: bool = False, **kwargs) -> 'SecurityTXT':
+        """
+        Retrieve and parse a securitytxt from a given url or IP address with asyncio. It looks on the same paths and
+        raises the same exceptions as from_url, except that aiohttp is used for the requests. Requires aiohttp.
+        :param url: The url / IP from which to retrieve the securitytxt
+        :param strict_url: Set to True to only look at the url specified, not any subpaths like
+        '.well-known/security.txt'
+        :param kwargs: Additional keyword arguments for the AsyncURLParser, such as an aiohttp session or a timeout.
+        :return: A SecurityTXT object, that represents the securitytxt found.
+        :raises FileNotFoundError: if no security.txt file could be found on the URL.
+        :raises AttributeError: if a security.txt has been found, but could not be parsed.
+        """
+        from securitytxt.parsers.async_url_parser import AsyncURLParser
+        return await AsyncURLParser(url, strict_url, **kwargs).parse()
 
     @staticmethod
-    def from_text(text: str) -> 'SecurityTXT':
+    def afrom_urls(urls: Iterable[str], max_concurrency: Optional[int] = None, strict_url: bool = False,
+                   **kwargs) -> AsyncIterator[Tuple[str, Union['SecurityTXT', Exception]]]:
+        """
+        Retrieve and parse securitytxts from many urls or IP addresses concurrently on the running event loop. Results
+        are yielded as soon as they are available. Requires aiohttp.
+        :param urls: The urls / IPs from which to retrieve the securitytxts. May be a (lazy) iterator of any length.
+        :param max_concurrency: (optional) The number of lookups to run at the same time.
+        :param strict_url: Set to True to only look at the urls specified, not any subpaths like
+        '.well-known/security.txt'
+        :param kwargs: Additional keyword arguments for the AsyncURLParser, such as possible_paths or an aiohttp
+        session.
+        :return: An asynchronous iterator of (url, result) tuples. The result is a SecurityTXT object if one was found,
+        or the exception raised while looking for it.
+        """
+        from securitytxt.parsers.async_bulk_url_parser import AsyncBulkURLParser
+        return AsyncBulkURLParser(urls, max_concurrency, strict_url, **kwargs).__aiter__()
+
+    @staticmethod
+    def from_text(text: str, lazy: bool = False, memo: Optional['ParseMemo'] = None) -> 'SecurityTXT':
         """
         Parse a securitytxt from a text string.
         :param text: The text of the security.txt file
+        :param lazy: Set to True to only index the lines of the file, and parse every field on first access. This is
+        faster if only a few fields are used. See LazySecurityTXT.
+        :param memo: (optional) A ParseMemo, so that a text that is identical to a text parsed before is not parsed
+        again. Not used if lazy is set.
         :return: A SecurityTXT object, that represents the securitytxt found.
         :raises AttributeError: if the file does not have a valid format.
         """
+        if lazy:
+            from securitytxt.parsers.lazy_file_parser import LazyFileParser
+            return LazyFileParser(text).securitytxt
+        if memo is not None:
+            return memo.parse(text)
         from securitytxt.parsers.file_parser import FileParser
         return FileParser(text).securitytxt
+
+    @staticmethod
+    def from_file(fileobj: Iterable[Union[str, bytes]], keep_raw: bool = True) -> 'SecurityTXT':
+        """
+        Parse a securitytxt from a file object, opened in text or binary mode, line by line. Files opened in binary mode
+        are decoded as UTF-8, and lines that are not valid UTF-8 with a fallback encoding. Unsigned files are parsed
+        without reading the whole file first.
+        :param fileobj: The file object, or any other iterable of lines including their line endings.
+        :param keep_raw: Whether to set the raw text. If False, the raw text is left empty to save memory.
+        :return: A SecurityTXT object, that represents the securitytxt found.
+        :raises AttributeError: if the file does not have a valid format.
+        """
+        from securitytxt.parsers.stream_parser import StreamParser
+        return StreamParser(fileobj, keep_raw).securitytxt
+
+    @staticmethod
+    def from_bytes(data, charset: Optional[str] = None, detect_encoding: bool = False) -> 'SecurityTXT':
+        """
+        Parse a securitytxt from its raw bytes. The bytes are decoded as UTF-8, as required by the draft RFC, unless a
+        charset is given. If they are not valid UTF-8, the charset is detected if detect_encoding is set, and a fallback
+        encoding is used otherwise. The encoding used is set in the encoding and decoding attributes. Unless a charset
+        is given or detect_encoding is set, the bytes are parsed line by line, without decoding them as a whole.
+        :param data: The bytes of the security.txt file, or any other bytes-like object such as a memoryview or mmap.
+        :param charset: (optional) The charset to decode with, for example from the Content-Type header.
+        :param detect_encoding: Whether to detect the charset if the bytes are not valid UTF-8.
+        :return: A SecurityTXT object, that represents the securitytxt found.
+        :raises AttributeError: if the file does not have a valid format.
+        """
+        if charset or detect_encoding:
+            from securitytxt.parsers.bytes_parser import BytesParser
+            return BytesParser(bytes(data), charset, detect_encoding).securitytxt
+        from securitytxt.parsers.stream_parser import StreamParser
+        return StreamParser(StreamParser.buffer_lines(data)).securitytxt
+
+    @staticmethod
+    def parse_many(texts: Iterable[str], processes: Optional[int] = None, chunksize: Optional[int] = None,
+                   ordered: bool = True, keep_raw: bool = False) -> Iterator[Tuple[int, Union['CompactSecurityTXT',
+                                                                                             Exception]]]:
+        """
+        Parse many securitytxts from text strings on a pool of worker processes, for CPU-bound batches such as
+        re-analysing stored files. The results are CompactSecurityTXT objects, without the raw text unless keep_raw is
+        set, since they are sent back from the worker processes.
+        :param texts: The texts of the security.txt files. May be a (lazy) iterator of any length.
+        :param processes: (optional) The number of worker processes. Defaults to the number of CPUs. If 1, the texts
+        are parsed in the current process.
+        :param chunksize: (optional) The number of texts sent to a worker process at once.
+        :param ordered: Whether to yield the results in input order, or as soon as they are available.
+        :param keep_raw: Whether to keep the raw texts in the results.
+        :return: An iterator of (index, result) tuples, where index is the position of the text in the input. The
+        result is a CompactSecurityTXT object, or the AttributeError or ValueError raised if the file does not have a
+        valid format.
+        """
+        from securitytxt.parsers.batch_parser import BatchParser
+        return iter(BatchParser(texts, processes, chunksize, ordered, keep_raw))
+
+    @staticmethod
+    def verify_signatures(securitytxts: Iterable['SecurityTXT'], max_workers: Optional[int] = None,
+                          **kwargs) -> Iterator[Tuple['SecurityTXT', 'VerificationResult']]:
+        """
+        Verify the PGP signatures of many securitytxts on a bounded pool of worker threads. Keys and results are shared
+        between the files, so files signed with the same key fetch it once. Requires pgpy.
+        :param securitytxts: The securitytxts, with their raw text. May be a (lazy) iterator of any length.
+        :param max_workers: (optional) The number of verifications to run at the same time.
+        :param kwargs: Additional keyword arguments for the SignatureVerifier, such as a key_cache or key_server.
+        :return: An iterator of (securitytxt, result) tuples, in input order. See SignatureVerifier.
+        """
+        from securitytxt.parsers.signature_verifier import SignatureVerifier
+        return SignatureVerifier(max_workers=max_workers, **kwargs).verify_many(securitytxts)
@@ -24,4 +24,6 @@ setuptools.setup(
     packages=setuptools.find_packages(),
     python_requires=">=3.6",
     install_requires=['requests', 'python-dateutil'],
+    extras_require={'async': ['aiohttp'], 'verify': ['pgpy']},
+    entry_points={'console_scripts': ['securitytxt=securitytxt.cli:main']},
 )
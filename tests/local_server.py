@@ -0,0 +1,53 @@
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Tuple, Union, List
+
+
+class LocalServer:
+    """A stand-in HTTP server on localhost for tests. It serves the given routes, a path mapped to a (status code, body)
+    tuple or a (status code, body, headers) tuple, and returns a 404 for any other path. A path can also be mapped to a
+    list of such tuples, which are served one after another, repeating the last one. Every response can be delayed to
+    simulate a slow host."""
+
+    def __init__(self, routes: Dict[str, Union[Tuple, List[Tuple]]] = None, delay: float = 0.0):
+        self.routes = routes if routes else {}
+        self.delay = delay
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # The headers and the body are sent separately, which would otherwise wait for a delayed ACK
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                server.requests.append(self.path)
+                time.sleep(server.delay)
+                route = server.routes.get(self.path, (404, "Not found"))
+                if isinstance(route, list):
+                    route = route.pop(0) if len(route) > 1 else route[0]
+                status, body, headers = route if len(route) == 3 else (*route, {})
+                data = body.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "text/plain")
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self.netloc = f"127.0.0.1:{self._httpd.server_address[1]}"
+
+    def __enter__(self) -> 'LocalServer':
+        threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,67 @@
+import asyncio
+import os
+import socket
+import unittest
+
+from securitytxt.parsers.negative_cache import NegativeCache
+from securitytxt.securitytxt import SecurityTXT
+from tests.local_server import LocalServer
+
+
+class TestAFromURL(unittest.TestCase):
+    example_file = open(f"{os.path.dirname(os.path.realpath(__file__))}/files/test_signed/in.txt").read()
+
+    def test_standard_location(self):
+        with LocalServer({"/.well-known/security.txt": (200, self.example_file)}) as server:
+            securitytxt = asyncio.run(SecurityTXT.afrom_url(server.netloc))
+        self.assertEqual(securitytxt.source_url, f"http://{server.netloc}/.well-known/security.txt")
+        self.assertEqual(securitytxt.contact, ['mailto:whitehats@test.ts', 'http://test.ts/whitehats'])
+
+    def test_prioritize_well_known(self):
+        routes = {"/.well-known/security.txt": (200, self.example_file), "/security.txt": (200, "Contact: a@b.c")}
+        with LocalServer(routes) as server:
+            securitytxt = asyncio.run(SecurityTXT.afrom_url(server.netloc))
+        self.assertEqual(securitytxt.source_url, f"http://{server.netloc}/.well-known/security.txt")
+
+    def test_root_location(self):
+        with LocalServer({"/security.txt": (200, self.example_file)}) as server:
+            securitytxt = asyncio.run(SecurityTXT.afrom_url(server.netloc))
+        self.assertEqual(securitytxt.source_url, f"http://{server.netloc}/security.txt")
+
+    def test_html_404(self):
+        routes = {"/.well-known/security.txt": (200, "<html><body>Not found</body></html>")}
+        with LocalServer(routes) as server:
+            with self.assertRaises(FileNotFoundError):
+                asyncio.run(SecurityTXT.afrom_url(server.netloc))
+
+    def test_timeout(self):
+        with LocalServer({"/security.txt": (200, self.example_file)}, delay=0.5) as server:
+            with self.assertRaises(FileNotFoundError):
+                asyncio.run(SecurityTXT.afrom_url(server.netloc, possible_paths=["/security.txt"], timeout=0.1))
+
+    def test_circuit_breaker_connection_refused(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            netloc = f"127.0.0.1:{sock.getsockname()[1]}"
+        cache = NegativeCache()
+        probes = []
+        with self.assertRaises(FileNotFoundError):
+            asyncio.run(SecurityTXT.afrom_url(netloc, negative_cache=cache, circuit_breaker=True,
+                                              on_probe=probes.append))
+        # The second path is not requested on either scheme, since the port refused the connection
+        self.assertEqual(len(probes), 2)
+        self.assertEqual(cache.get(netloc), NegativeCache.CONNECTION_REFUSED)
+        with self.assertRaisesRegex(FileNotFoundError, "connection_refused, cached"):
+            asyncio.run(SecurityTXT.afrom_url(netloc, negative_cache=cache))
+
+    def test_afrom_urls(self):
+        invalid_file = "Contact: mailto:a@b.c\nExpires: not a date"
+        with LocalServer({"/security.txt": (200, self.example_file)}) as server, LocalServer() as empty_server, \
+                LocalServer({"/security.txt": (200, invalid_file)}) as invalid_server:
+            async def collect():
+                urls = [server.netloc, empty_server.netloc, invalid_server.netloc]
+                return {url: result async for url, result in SecurityTXT.afrom_urls(urls, max_concurrency=2)}
+            results = asyncio.run(collect())
+        self.assertIsInstance(results[server.netloc], SecurityTXT)
+        self.assertIsInstance(results[empty_server.netloc], FileNotFoundError)
+        self.assertIsInstance(results[invalid_server.netloc], ValueError)
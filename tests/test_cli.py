@@ -0,0 +1,117 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+
+import requests_mock
+
+from securitytxt.cli import main
+from securitytxt.securitytxt import SecurityTXT
+from tests.local_server import LocalServer
+
+
+class TestCLI(unittest.TestCase):
+    example_file = open(f"{os.path.dirname(os.path.realpath(__file__))}/files/test_signed/in.txt").read()
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.hosts_path = os.path.join(self.directory.name, 'hosts.txt')
+        self.output_path = os.path.join(self.directory.name, 'out.jsonl')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_hosts(self, server: LocalServer, names):
+        with open(self.hosts_path, 'w') as hosts:
+            hosts.write("# hosts to scan\n\n")
+            hosts.writelines(f"http://{server.netloc}/{name}/security.txt\n" for name in names)
+
+    def read_output(self):
+        with open(self.output_path) as output:
+            return {record['host'].split('/')[3]: record for record in map(json.loads, output)}
+
+    def test_scan(self):
+        with LocalServer({"/a/security.txt": (200, self.example_file)}) as server:
+            self.write_hosts(server, ["a", "b"])
+            self.assertEqual(main([self.hosts_path, '-o', self.output_path, '--strict-url', '-w', '2']), 0)
+        records = self.read_output()
+        self.assertEqual(records['a']['error'], None)
+        self.assertEqual(records['a']['source_url'], f"http://{server.netloc}/a/security.txt")
+        securitytxt = SecurityTXT.from_text(self.example_file)
+        self.assertEqual(records['a']['expires'], securitytxt.expires.isoformat())
+        self.assertEqual(records['a']['contact'], securitytxt.contact)
+        self.assertEqual(records['a']['valid'], securitytxt.is_valid(records['a']['source_url']))
+        self.assertNotIn('raw', records['a'])
+        self.assertEqual(records['b']['error'], 'FileNotFoundError')
+
+    def test_stdin_and_stdout(self):
+        with LocalServer({"/a/security.txt": (200, "Contact: mailto:a@b.c")}) as server:
+            stdin, sys.stdin = sys.stdin, io.StringIO(f"http://{server.netloc}/a/security.txt\n")
+            try:
+                with redirect_stdout(io.StringIO()) as stdout:
+                    main(['--strict-url', '--raw'])
+            finally:
+                sys.stdin = stdin
+        record = json.loads(stdout.getvalue())
+        self.assertEqual((record['contact'], record['raw']), (["mailto:a@b.c"], "Contact: mailto:a@b.c"))
+
+    def test_resume(self):
+        with LocalServer({"/a/security.txt": (200, self.example_file)}) as server:
+            self.write_hosts(server, ["a", "b", "c"])
+            with open(self.output_path, 'w') as output:
+                output.write(json.dumps({'host': f"http://{server.netloc}/a/security.txt", 'error': None}) + '\n')
+                output.write('{"host": "http://')
+            main([self.hosts_path, '-o', self.output_path, '--strict-url', '--resume'])
+        self.assertEqual(sorted(server.requests), ["/b/security.txt", "/c/security.txt"])
+        self.assertEqual(sorted(self.read_output()), ["a", "b", "c"])
+
+    def test_invalid_file(self):
+        routes = {"/a/security.txt": (200, "Contact: mailto:a@b.c\nExpires: not a date"),
+                  "/b/security.txt": (200, self.example_file)}
+        with LocalServer(routes) as server:
+            self.write_hosts(server, ["a", "b", "c"])
+            self.assertEqual(main([self.hosts_path, '-o', self.output_path, '--strict-url', '-w', '1']), 0)
+        records = self.read_output()
+        self.assertEqual(sorted(records), ["a", "b", "c"])
+        self.assertEqual((records['a']['valid'], records['a']['error']), (False, 'ParserError'))
+        self.assertEqual(records['b']['error'], None)
+
+    def test_fields_do_not_replace_host(self):
+        routes = {"/a/security.txt": (200, "Contact: mailto:a@b.c\nHost: other.example\nError: none")}
+        with LocalServer(routes) as server:
+            self.write_hosts(server, ["a", "b"])
+            main([self.hosts_path, '-o', self.output_path, '--strict-url'])
+            records = self.read_output()
+            self.assertEqual(records['a']['host'], f"http://{server.netloc}/a/security.txt")
+            self.assertEqual(records['a']['error'], None)
+            main([self.hosts_path, '-o', self.output_path, '--strict-url', '--resume'])
+        self.assertEqual(len(server.requests), 2)
+
+    def test_probe_order_by_domain_is_opt_in(self):
+        with open(self.hosts_path, 'w') as hosts:
+            hosts.write("a.example.com\nb.example.com\n")
+        for options, contact in [([], "mailto:well-known@b.c"), (['--probe-order-by-domain'], "mailto:root@b.c")]:
+            state_path = os.path.join(self.directory.name, f"order{len(options)}")
+            with requests_mock.Mocker() as m:
+                m.get(requests_mock.ANY, status_code=404)
+                m.get("https://a.example.com/security.txt", text="Contact: mailto:a@b.c")
+                m.get("https://b.example.com/.well-known/security.txt", text="Contact: mailto:well-known@b.c")
+                m.get("https://b.example.com/security.txt", text="Contact: mailto:root@b.c")
+                with redirect_stderr(io.StringIO()):
+                    main([self.hosts_path, '-o', self.output_path, '-w', '1', '--probe-order', state_path, *options])
+            with open(self.output_path) as output:
+                records = {record['host']: record for record in map(json.loads, output)}
+            self.assertEqual(records['b.example.com']['contact'], [contact])
+
+    def test_schedule(self):
+        state_path = os.path.join(self.directory.name, 'state')
+        with LocalServer({"/a/security.txt": (200, self.example_file)}) as server:
+            self.write_hosts(server, ["a", "b"])
+            main([self.hosts_path, '-o', self.output_path, '--strict-url', '--schedule', state_path])
+            main([self.hosts_path, '-o', self.output_path, '--strict-url', '--schedule', state_path])
+        # The hosts are not due again on the second run
+        self.assertEqual(sorted(server.requests), ["/a/security.txt", "/b/security.txt"])
+        self.assertTrue(os.path.exists(state_path))
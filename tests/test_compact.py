@@ -0,0 +1,64 @@
+import os
+import pickle
+import unittest
+
+from securitytxt.compact_securitytxt import CompactSecurityTXT
+from securitytxt.securitytxt import SecurityTXT
+
+
+class TestCompact(unittest.TestCase):
+    files_dir = f"{os.path.dirname(os.path.realpath(__file__))}/files"
+
+    def read(self, folder: str) -> SecurityTXT:
+        with open(f"{self.files_dir}/{folder}/in.txt", 'r') as in_file:
+            return SecurityTXT.from_text(in_file.read())
+
+    def test_round_trip(self):
+        for folder in next(os.walk(self.files_dir))[1]:
+            with self.subTest(msg=f"Checking test case {folder}"):
+                securitytxt = self.read(folder)
+                self.assertEqual(vars(securitytxt.compact().to_securitytxt()), vars(securitytxt))
+
+    def test_no_dict(self):
+        compact = self.read('test_signed').compact()
+        self.assertFalse(hasattr(compact, '__dict__'))
+
+    def test_shared_empty_tuples(self):
+        first, second = CompactSecurityTXT(), CompactSecurityTXT(contact=[])
+        self.assertIs(first.hiring, second.contact)
+        self.assertEqual(first.hiring, ())
+
+    def test_interned_values(self):
+        first = CompactSecurityTXT(policy=[''.join(['https://example.com/', 'policy'])])
+        second = CompactSecurityTXT(policy=[''.join(['https://example.com/', 'policy'])])
+        self.assertIs(first.policy[0], second.policy[0])
+
+    def test_drop_raw(self):
+        securitytxt = self.read('test_signed')
+        self.assertEqual(securitytxt.compact().raw, securitytxt.raw)
+        self.assertEqual(securitytxt.compact(keep_raw=False).raw, "")
+
+    def test_add_field(self):
+        compact = CompactSecurityTXT()
+        compact.add_field('contact', 'mailto:a@b.c')
+        compact.add_field('contact', 'mailto:d@e.f')
+        compact.add_field('unknown', 'first')
+        compact.add_field('unknown', 'second')
+        self.assertEqual(compact.contact, ('mailto:a@b.c', 'mailto:d@e.f'))
+        self.assertEqual(compact.unknown, ['first', 'second'])
+        self.assertEqual(compact.to_securitytxt().unknown, ['first', 'second'])
+        with self.assertRaises(AttributeError):
+            compact.missing
+
+    def test_methods(self):
+        securitytxt = self.read('test_signed')
+        compact = securitytxt.compact()
+        self.assertEqual(compact.is_valid(), securitytxt.is_valid())
+        self.assertEqual(compact.expired, securitytxt.expired)
+        self.assertTrue(compact.canonical_url(securitytxt.canonical[0]))
+
+    def test_pickle(self):
+        compact = self.read('test_signed').compact()
+        compact.add_field('unknown', 'value')
+        copy = pickle.loads(pickle.dumps(compact))
+        self.assertEqual(vars(copy.to_securitytxt()), vars(compact.to_securitytxt()))
@@ -0,0 +1,70 @@
+import time
+import unittest
+from datetime import datetime, timezone, timedelta
+
+from securitytxt.corpus_index import CorpusIndex
+from securitytxt.securitytxt import SecurityTXT
+
+
+class TestCorpusIndex(unittest.TestCase):
+    now = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+    def securitytxt(self, host: str, days: float = None, contact=("mailto:security@example.com",), canonical=()):
+        return SecurityTXT(source_url=f"https://{host}/.well-known/security.txt", contact=list(contact),
+                           expires=self.now + timedelta(days=days) if days is not None else None,
+                           canonical=list(canonical), encryption=["https://keys.example.com/key.asc"])
+
+    def setUp(self):
+        self.index = CorpusIndex([
+            self.securitytxt("a.example.com", 10, canonical=["https://a.example.com/.well-known/security.txt"]),
+            self.securitytxt("B.example.com:8443", 20, contact=["mailto:Security@Example.com", "mailto:b@b.com"]),
+            self.securitytxt("c.example.org", -5, contact=["https://c.example.org/contact"],
+                             canonical=["https://www.example.org/.well-known/security.txt"]),
+            self.securitytxt("d.example.org"),
+        ])
+
+    def test_find(self):
+        self.assertEqual(self.index.find('contact', "mailto:SECURITY@example.com"),
+                         {"a.example.com", "b.example.com", "d.example.org"})
+        self.assertEqual(self.index.find('contact', "HTTPS://C.EXAMPLE.ORG/contact"), {"c.example.org"})
+        self.assertEqual(self.index.find('contact', "https://c.example.org/CONTACT"), set())
+        self.assertEqual(len(self.index.find('encryption', "https://keys.example.com/key.asc")), 4)
+        self.assertEqual(self.index.values('contact')["mailto:security@example.com"], 3)
+
+    def test_expiry(self):
+        self.assertEqual(self.index.expiring(), ["c.example.org", "a.example.com", "b.example.com"])
+        self.assertEqual(self.index.expiring(self.now, self.now + timedelta(days=20)), ["a.example.com"])
+        self.assertEqual(self.index.expired(self.now + timedelta(days=10)), {"c.example.org", "d.example.org"})
+        self.assertEqual(self.index.expired(self.now + timedelta(days=11)),
+                         {"a.example.com", "c.example.org", "d.example.org"})
+
+    def test_off_domain_canonical(self):
+        self.assertEqual(self.index.off_domain_canonical(), {"c.example.org"})
+
+    def test_replace_and_remove(self):
+        self.index.add(self.securitytxt("a.example.com", 30, contact=["mailto:new@example.com"]))
+        self.assertEqual(len(self.index), 4)
+        self.assertNotIn("a.example.com", self.index.find('contact', "mailto:security@example.com"))
+        self.assertEqual(self.index.find('contact', "mailto:new@example.com"), {"a.example.com"})
+        self.assertEqual(self.index.expiring()[-1], "a.example.com")
+        removed = self.index.remove("https://c.example.org/security.txt")
+        self.assertEqual(removed.contact, ["https://c.example.org/contact"])
+        self.assertNotIn("c.example.org", self.index)
+        self.assertNotIn("https://c.example.org/contact", self.index.values('contact'))
+        self.assertEqual(self.index.off_domain_canonical(), set())
+        self.assertEqual(self.index.expiring(), ["b.example.com", "a.example.com"])
+        with self.assertRaises(KeyError):
+            self.index.get("c.example.org")
+
+    def test_add_without_host(self):
+        with self.assertRaises(KeyError):
+            self.index.add(SecurityTXT())
+        self.assertEqual(self.index.add(SecurityTXT(), "E.example.net."), "e.example.net")
+
+    def test_query_time(self):
+        index = CorpusIndex(self.securitytxt(f"host{i}.example.com", i % 365, contact=[f"mailto:s{i % 1000}@a.com"])
+                            for i in range(20000))
+        start = time.perf_counter()
+        for i in range(1000):
+            index.find('contact', f"mailto:s{i}@a.com")
+        self.assertLess((time.perf_counter() - start) / 1000, 0.001)
@@ -0,0 +1,43 @@
+import os
+import unittest
+
+import requests_mock
+
+from securitytxt.parsers.bytes_parser import BytesParser
+from securitytxt.securitytxt import SecurityTXT
+
+
+class TestFromBytes(unittest.TestCase):
+    example_file = open(f"{os.path.dirname(os.path.realpath(__file__))}/files/test_unsigned/in.txt").read()
+
+    def test_utf8(self):
+        securitytxt = SecurityTXT.from_bytes("# Sécurité\nContact: mailto:a@b.c".encode('utf-8'))
+        self.assertEqual(securitytxt.comments, ["Sécurité"])
+        self.assertEqual((securitytxt.encoding, securitytxt.decoding), ('utf-8', BytesParser.DECODING_UTF8))
+
+    def test_utf8_bom(self):
+        securitytxt = SecurityTXT.from_bytes(b'\xef\xbb\xbf' + self.example_file.encode())
+        self.assertEqual(securitytxt.raw, self.example_file)
+        self.assertEqual(securitytxt.encoding, 'utf-8-sig')
+
+    def test_charset(self):
+        securitytxt = SecurityTXT.from_bytes("# Sécurité".encode('utf-16'), charset='utf-16')
+        self.assertEqual(securitytxt.comments, ["Sécurité"])
+        self.assertEqual(securitytxt.decoding, BytesParser.DECODING_CHARSET)
+
+    def test_fallback(self):
+        securitytxt = SecurityTXT.from_bytes("# Sécurité".encode('cp1252'))
+        self.assertEqual(securitytxt.comments, ["Sécurité"])
+        self.assertEqual((securitytxt.encoding, securitytxt.decoding), ('iso-8859-1', BytesParser.DECODING_FALLBACK))
+
+    def test_get_charset(self):
+        self.assertEqual(BytesParser.get_charset('text/plain; charset="UTF-8"'), 'UTF-8')
+        self.assertIsNone(BytesParser.get_charset('text/plain'))
+
+    def test_from_url_without_charset(self):
+        with requests_mock.Mocker() as m:
+            m.get("https://test.com/security.txt", content="# Sécurité".encode(),
+                  headers={'Content-Type': 'text/plain'})
+            securitytxt = SecurityTXT.from_url("https://test.com/security.txt", strict_url=True)
+        self.assertEqual(securitytxt.comments, ["Sécurité"])
+        self.assertEqual(securitytxt.decoding, BytesParser.DECODING_UTF8)
@@ -0,0 +1,56 @@
+import itertools
+import os
+import unittest
+from unittest import mock
+
+import requests
+import requests_mock
+
+from securitytxt.parsers.http_session import create_session
+from securitytxt.securitytxt import SecurityTXT
+
+
+@requests_mock.Mocker()
+class TestFromURLs(unittest.TestCase):
+    example_file = open(f"{os.path.dirname(os.path.realpath(__file__))}/files/test_signed/in.txt").read()
+
+    def test_results_per_host(self, m: requests_mock.Mocker):
+        m.get(requests_mock.ANY, status_code=404)
+        m.get("https://a.com/.well-known/security.txt", text=self.example_file, status_code=200)
+        m.get("http://b.com/security.txt", text=self.example_file, status_code=200)
+        results = dict(SecurityTXT.from_urls(["a.com", "b.com", "c.com"], max_workers=2))
+        self.assertEqual(set(results), {"a.com", "b.com", "c.com"})
+        self.assertEqual(results["a.com"].source_url, "https://a.com/.well-known/security.txt")
+        self.assertEqual(results["b.com"].source_url, "http://b.com/security.txt")
+        self.assertIsInstance(results["c.com"], FileNotFoundError)
+
+    def test_invalid_file_among_valid_hosts(self, m: requests_mock.Mocker):
+        m.get(requests_mock.ANY, text=self.example_file, status_code=200)
+        m.get("https://b.com/.well-known/security.txt", text="Contact: mailto:a@b.c\nExpires: not a date",
+              status_code=200)
+        results = dict(SecurityTXT.from_urls(["a.com", "b.com", "c.com"], max_workers=2))
+        self.assertIsInstance(results["a.com"], SecurityTXT)
+        self.assertIsInstance(results["b.com"], ValueError)
+        self.assertIsInstance(results["c.com"], SecurityTXT)
+
+    def test_lazy_input(self, m: requests_mock.Mocker):
+        m.get(requests_mock.ANY, text=self.example_file, status_code=200)
+        hosts = (f"host{i}.com" for i in itertools.count())
+        results = list(itertools.islice(SecurityTXT.from_urls(hosts, max_workers=2), 5))
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(isinstance(result, SecurityTXT) for _, result in results))
+
+    def test_own_session_closed(self, m: requests_mock.Mocker):
+        m.get(requests_mock.ANY, text=self.example_file, status_code=200)
+        with mock.patch.object(requests.Session, 'close', autospec=True) as close:
+            self.assertEqual(len(list(SecurityTXT.from_urls(["a.com", "b.com"], max_workers=2))), 2)
+            self.assertEqual(close.call_count, 1)
+            # The session is closed as well when the caller stops iterating early
+            results = SecurityTXT.from_urls((f"host{i}.com" for i in itertools.count()), max_workers=2)
+            next(results)
+            results.close()
+            self.assertEqual(close.call_count, 2)
+            # A session passed in by the caller is left open
+            session = create_session()
+            list(SecurityTXT.from_urls(["a.com", "b.com"], max_workers=2, session=session))
+            self.assertEqual(close.call_count, 2)
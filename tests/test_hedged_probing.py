@@ -0,0 +1,55 @@
+import os
+import time
+import unittest
+from concurrent.futures import wait
+from unittest import mock
+
+import requests_mock
+
+from securitytxt.parsers.url_parser import URLParser
+from securitytxt.securitytxt import SecurityTXT
+from tests.local_server import LocalServer
+
+
+class SlowFirstURLParser(URLParser):
+    """Finds a file at every url, but takes a while for the highest-priority one."""
+
+    def _get_file(self, url: str) -> SecurityTXT:
+        if url == "https://test.com/.well-known/security.txt":
+            time.sleep(0.3)
+        return SecurityTXT()
+
+
+class TestHedgedProbing(unittest.TestCase):
+    example_file = open(f"{os.path.dirname(os.path.realpath(__file__))}/files/test_signed/in.txt").read()
+
+    def test_prioritize_https(self):
+        with requests_mock.Mocker() as m:
+            m.get(requests_mock.ANY, status_code=404)
+            m.get("https://test.com/.well-known/security.txt", text=self.example_file, status_code=200)
+            m.get("http://test.com/.well-known/security.txt", text="Contact: test@test.com", status_code=200)
+            m.get("http://test.com/security.txt", text="Contact: test@test.com", status_code=200)
+            securitytxt = SecurityTXT.from_url("test.com", hedge_delay=0)
+        self.assertEqual(securitytxt.source_url, "https://test.com/.well-known/security.txt")
+
+    def test_nonexisting_securitytxt(self):
+        with requests_mock.Mocker() as m:
+            m.get(requests_mock.ANY, status_code=404)
+            with self.assertRaises(FileNotFoundError):
+                SecurityTXT.from_url("test.com", hedge_delay=0.01)
+
+    def test_latency_of_slowest_probe(self):
+        paths = ["/a.txt", "/b.txt", "/c.txt", "/security.txt"]
+        with LocalServer({"/security.txt": (200, self.example_file)}, delay=0.2) as server:
+            start = time.monotonic()
+            parser = URLParser(server.netloc, possible_paths=paths, possible_schemes=["http"], hedge_delay=0)
+            elapsed = time.monotonic() - start
+        self.assertEqual(parser.securitytxt.source_url, f"http://{server.netloc}/security.txt")
+        self.assertLess(elapsed, 0.6)
+
+    def test_waits_without_spinning(self):
+        with mock.patch('securitytxt.parsers.url_parser.wait', wraps=wait) as waits:
+            parser = SlowFirstURLParser("test.com", hedge_delay=0)
+        self.assertEqual(parser.securitytxt.source_url, "https://test.com/.well-known/security.txt")
+        # The lower-priority urls finish long before the first one, which must not wake up the waiting loop
+        self.assertLess(waits.call_count, 5)
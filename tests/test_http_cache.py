@@ -0,0 +1,78 @@
+import os
+import pickle
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import requests_mock
+
+from securitytxt.parsers.http_cache import HTTPCache
+from securitytxt.securitytxt import SecurityTXT
+
+
+class TestHTTPCache(unittest.TestCase):
+    example_file = open(f"{os.path.dirname(os.path.realpath(__file__))}/files/test_signed/in.txt").read()
+    url = "https://test.com/.well-known/security.txt"
+
+    def test_not_modified(self):
+        cache = HTTPCache()
+        with requests_mock.Mocker() as m:
+            m.get(self.url, [{'text': self.example_file, 'headers': {'ETag': '"v1"'}}, {'status_code': 304}])
+            first = SecurityTXT.from_url("test.com", cache=cache)
+            second = SecurityTXT.from_url("test.com", cache=cache)
+            self.assertEqual(m.last_request.headers['If-None-Match'], '"v1"')
+        self.assertEqual(second.contact, first.contact)
+        self.assertEqual(second.source_url, self.url)
+
+    def test_modified(self):
+        cache = HTTPCache()
+        with requests_mock.Mocker() as m:
+            m.get(self.url, [{'text': self.example_file, 'headers': {'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}},
+                             {'text': "Contact: mailto:new@test.com", 'headers': {'ETag': '"v2"'}}])
+            SecurityTXT.from_url("test.com", cache=cache)
+            second = SecurityTXT.from_url("test.com", cache=cache)
+            self.assertEqual(m.last_request.headers['If-Modified-Since'], 'Mon, 01 Jan 2024 00:00:00 GMT')
+        self.assertEqual(second.contact, ["mailto:new@test.com"])
+        self.assertEqual(cache.get(self.url).etag, '"v2"')
+
+    def test_ttl_capped_by_expires(self):
+        cache = HTTPCache()
+        securitytxt = SecurityTXT(expires=datetime.now(timezone.utc) - timedelta(days=1))
+        cache.set(self.url, securitytxt, etag='"v1"')
+        self.assertIsNone(cache.get(self.url))
+        cache.set(self.url, SecurityTXT(), etag='"v1"')
+        self.assertIsNotNone(cache.get(self.url))
+
+    def test_size_eviction(self):
+        securitytxt = SecurityTXT.from_text(self.example_file)
+        cache = HTTPCache(max_size=int(2.5 * len(self.example_file)))
+        for i in range(5):
+            cache.set(f"https://test{i}.com/security.txt", securitytxt, etag='"v1"')
+        self.assertLess(len(cache), 5)
+        self.assertIsNotNone(cache.get("https://test4.com/security.txt"))
+
+    def test_size_tracked(self):
+        securitytxt = SecurityTXT.from_text(self.example_file)
+        # Room for two entries, but not for three
+        max_size = int(2.5 * len(pickle.dumps(securitytxt, protocol=pickle.HIGHEST_PROTOCOL)))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            cache = HTTPCache(path, max_size=max_size)
+            # Replacing an entry does not count its size twice, so the other entry is not evicted
+            for _ in range(3):
+                cache.set("https://test0.com/security.txt", securitytxt, etag='"v1"')
+            cache.set("https://test1.com/security.txt", securitytxt, etag='"v1"')
+            self.assertEqual(len(cache), 2)
+            cache.delete("https://test0.com/security.txt")
+            cache.set("https://test2.com/security.txt", securitytxt, etag='"v1"')
+            self.assertEqual(len(cache), 2)
+            cache.close()
+            # The size of the entries that are already stored is loaded when the cache is opened
+            cache = HTTPCache(path, max_size=max_size)
+            statements = []
+            cache._connection.set_trace_callback(statements.append)
+            cache.set("https://test3.com/security.txt", securitytxt, etag='"v1"')
+            self.assertFalse([statement for statement in statements if "SUM(" in statement])
+            self.assertEqual(len(cache), 2)
+            self.assertIsNone(cache.get("https://test1.com/security.txt"))
+            cache.close()
@@ -0,0 +1,31 @@
+import os
+import unittest
+
+from securitytxt.parsers.http_session import create_session, get_default_session
+from securitytxt.parsers.url_parser import URLParser
+from tests.local_server import LocalServer
+
+
+class TestHTTPSession(unittest.TestCase):
+    example_file = open(f"{os.path.dirname(os.path.realpath(__file__))}/files/test_signed/in.txt").read()
+
+    def test_default_session_is_shared(self):
+        with LocalServer({"/.well-known/security.txt": (200, self.example_file)}) as server:
+            first = URLParser(server.netloc, possible_schemes=["http"])
+            second = URLParser(server.netloc, possible_schemes=["http"])
+        self.assertIs(first.session, get_default_session())
+        self.assertIs(first.session, second.session)
+
+    def test_given_session(self):
+        session = create_session(pool_connections=2, pool_maxsize=3)
+        with LocalServer({"/security.txt": (200, self.example_file)}) as server:
+            parser = URLParser(server.netloc, possible_schemes=["http"], session=session)
+        self.assertIs(parser.session, session)
+        self.assertEqual(parser.securitytxt.source_url, f"http://{server.netloc}/security.txt")
+        self.assertEqual(session.get_adapter("https://test.com")._pool_maxsize, 3)
+
+    def test_adapter_timeout(self):
+        session = create_session(timeout=0.05)
+        with LocalServer({"/.well-known/security.txt": (200, self.example_file)}, delay=0.5) as server:
+            with self.assertRaises(FileNotFoundError):
+                URLParser(server.netloc, possible_schemes=["http"], session=session)
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+import unittest
+
+
+class TestImport(unittest.TestCase):
+    """Importing the package and parsing files should not load the slow dependencies, which are only needed for
+    fetching files and for dates that are not in the RFC 3339 format."""
+    heavy_modules = ['requests', 'urllib3', 'charset_normalizer', 'dateutil', 'aiohttp', 'sqlite3', 'concurrent']
+
+    def loaded_modules(self, code: str) -> list:
+        script = f"import sys\n{code}\nprint(' '.join(sys.modules))"
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+        return [module for module in output.split() if module.split('.')[0] in self.heavy_modules]
+
+    def test_import(self):
+        self.assertEqual(self.loaded_modules("import securitytxt"), [])
+
+    def test_from_text(self):
+        self.assertEqual(self.loaded_modules(
+            "from securitytxt import SecurityTXT\n"
+            "SecurityTXT.from_text('Contact: mailto:a@b.c\\nExpires: 2030-01-01T00:00:00Z\\n')\n"
+            "SecurityTXT.from_text('Contact: mailto:a@b.c\\n', lazy=True).contact\n"
+            "SecurityTXT.from_bytes(b'Contact: mailto:a@b.c\\n')"), [])
+
+    def test_lenient_date(self):
+        self.assertIn('dateutil', self.loaded_modules(
+            "from securitytxt import SecurityTXT\nSecurityTXT.from_text('Expires: Tue, 31 Dec 2030 23:59:59 +0000')"))
+
+    def test_from_url(self):
+        self.assertIn('requests', self.loaded_modules(
+            "from securitytxt.parsers.url_parser import URLParser"))
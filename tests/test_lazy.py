@@ -0,0 +1,51 @@
+import os
+import unittest
+
+from securitytxt.lazy_securitytxt import LazySecurityTXT
+from securitytxt.securitytxt import SecurityTXT
+
+
+class TestLazy(unittest.TestCase):
+    files_dir = f"{os.path.dirname(os.path.realpath(__file__))}/files"
+    fields = ['raw', 'source_url', 'contact', 'expires', 'expires_format', 'encryption', 'acknowledgments',
+              'preferred_languages', 'canonical', 'policy', 'hiring', 'comments', 'signature']
+
+    def test_same_fields(self):
+        for folder in next(os.walk(self.files_dir))[1]:
+            with self.subTest(msg=f"Checking test case {folder}"):
+                with open(f"{self.files_dir}/{folder}/in.txt", 'r') as in_file:
+                    text = in_file.read()
+                eager, lazy = SecurityTXT.from_text(text), SecurityTXT.from_text(text, lazy=True)
+                self.assertIsInstance(lazy, LazySecurityTXT)
+                for field in self.fields:
+                    self.assertEqual(getattr(lazy, field), getattr(eager, field), field)
+                self.assertEqual((lazy.expired, lazy.is_valid()), (eager.expired, eager.is_valid()))
+
+    def test_parsed_on_access(self):
+        securitytxt = SecurityTXT.from_text("Contact: mailto:a@b.c\nExpires: 2030-01-01T00:00:00Z\n# comment\n",
+                                            lazy=True)
+        self.assertNotIn('contact', vars(securitytxt))
+        self.assertEqual(securitytxt.contact, ["mailto:a@b.c"])
+        self.assertIn('contact', vars(securitytxt))
+        self.assertNotIn('expires', vars(securitytxt))
+        self.assertNotIn('comments', vars(securitytxt))
+
+    def test_unknown_fields(self):
+        text = "Unknown-Field: a\nUnknown-Field: b\nEmpty:\n"
+        securitytxt = SecurityTXT.from_text(text, lazy=True)
+        self.assertEqual(securitytxt.unknown_field, SecurityTXT.from_text(text).unknown_field)
+        self.assertFalse(hasattr(securitytxt, 'empty'))
+        self.assertFalse(hasattr(securitytxt, 'missing'))
+
+    def test_add_field(self):
+        securitytxt = SecurityTXT.from_text("Contact: mailto:a@b.c\nUnknown: a\n", lazy=True)
+        securitytxt.add_field('contact', 'mailto:d@e.f')
+        securitytxt.add_field('unknown', 'b')
+        securitytxt.add_field('other', 'c')
+        self.assertEqual(securitytxt.contact, ["mailto:a@b.c", "mailto:d@e.f"])
+        self.assertEqual(securitytxt.unknown, [" a", "b"])
+        self.assertEqual(securitytxt.other, ["c"])
+
+    def test_signed(self):
+        with self.assertRaises(AttributeError):
+            SecurityTXT.from_text("-----BEGIN PGP SIGNED MESSAGE-----\nContact: a@b.c\n", lazy=True)
@@ -0,0 +1,107 @@
+import socket
+import unittest
+
+import requests
+import requests_mock
+
+from securitytxt.parsers.negative_cache import NegativeCache
+from securitytxt.securitytxt import SecurityTXT
+
+
+class TestNegativeCache(unittest.TestCase):
+
+    def test_not_found_cached(self):
+        cache = NegativeCache()
+        with requests_mock.Mocker() as m:
+            m.get(requests_mock.ANY, status_code=404)
+            for _ in range(2):
+                with self.assertRaises(FileNotFoundError):
+                    SecurityTXT.from_url("test.com", negative_cache=cache)
+            self.assertEqual(m.call_count, 4)
+        self.assertEqual(cache.get("test.com"), NegativeCache.NOT_FOUND)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_html_and_gone_cached(self):
+        cache = NegativeCache()
+        with requests_mock.Mocker() as m:
+            m.get(requests_mock.ANY, status_code=410)
+            m.get("https://test.com/.well-known/security.txt", text="<html><body>Not found</body></html>")
+            with self.assertRaises(FileNotFoundError):
+                SecurityTXT.from_url("test.com", negative_cache=cache, hedge_delay=0)
+        self.assertEqual(cache.get("test.com"), NegativeCache.NOT_FOUND)
+
+    def test_transient_failures_not_cached(self):
+        failures = [{'exc': requests.exceptions.ReadTimeout("Read timed out")}, {'status_code': 503},
+                    {'status_code': 500}]
+        for failure in failures:
+            with self.subTest(failure=failure):
+                cache = NegativeCache()
+                with requests_mock.Mocker() as m:
+                    m.get(requests_mock.ANY, status_code=404)
+                    m.get("http://test.com/security.txt", **failure)
+                    with self.assertRaises(FileNotFoundError):
+                        SecurityTXT.from_url("test.com", negative_cache=cache)
+                self.assertIsNone(cache.get("test.com"))
+                self.assertEqual(len(cache), 0)
+
+    def test_circuit_breaker_dns_failure(self):
+        cache = NegativeCache()
+        with requests_mock.Mocker() as m:
+            m.get(requests_mock.ANY, exc=requests.exceptions.ConnectionError(socket.gaierror(-2, "Name unknown")))
+            with self.assertRaises(FileNotFoundError):
+                SecurityTXT.from_url("test.com", negative_cache=cache, circuit_breaker=True)
+            self.assertEqual(m.call_count, 1)
+        self.assertEqual(cache.get("test.com"), NegativeCache.DNS_FAILURE)
+
+    def test_circuit_breaker_connection_refused(self):
+        refused = requests.exceptions.ConnectionError(ConnectionRefusedError(111, "Connection refused"))
+        with open('tests/files/test_unsigned/in.txt') as f:
+            text = f.read()
+        cache = NegativeCache()
+        with requests_mock.Mocker() as m:
+            m.get(requests_mock.ANY, status_code=404)
+            m.get("https://test.com/.well-known/security.txt", exc=refused)
+            m.get("https://test.com/security.txt", exc=refused)
+            m.get("http://test.com/security.txt", text=text)
+            sec = SecurityTXT.from_url("test.com", negative_cache=cache, circuit_breaker=True)
+            # Only the second https url is skipped, the http urls are on another port
+            self.assertEqual(m.call_count, 3)
+        self.assertEqual(sec.source_url, "http://test.com/security.txt")
+        self.assertIsNone(cache.get("test.com"))
+
+    def test_connection_refused_cached_if_every_port_refused(self):
+        refused = requests.exceptions.ConnectionError(ConnectionRefusedError(111, "Connection refused"))
+        for circuit_breaker, call_count in [(True, 2), (False, 4)]:
+            with self.subTest(circuit_breaker=circuit_breaker):
+                cache = NegativeCache()
+                with requests_mock.Mocker() as m:
+                    m.get(requests_mock.ANY, exc=refused)
+                    with self.assertRaises(FileNotFoundError):
+                        SecurityTXT.from_url("test.com", negative_cache=cache, circuit_breaker=circuit_breaker)
+                    self.assertEqual(m.call_count, call_count)
+                self.assertEqual(cache.get("test.com"), NegativeCache.CONNECTION_REFUSED)
+        cache = NegativeCache()
+        with requests_mock.Mocker() as m:
+            m.get(requests_mock.ANY, status_code=404)
+            m.get("https://test.com/.well-known/security.txt", exc=refused)
+            with self.assertRaises(FileNotFoundError):
+                SecurityTXT.from_url("test.com", negative_cache=cache, circuit_breaker=True)
+        self.assertIsNone(cache.get("test.com"))
+
+    def test_classify_connection_refused(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        with self.assertRaises(requests.exceptions.ConnectionError) as context:
+            requests.get(f"http://127.0.0.1:{port}/security.txt")
+        self.assertEqual(NegativeCache.classify(context.exception), NegativeCache.CONNECTION_REFUSED)
+        self.assertIsNone(NegativeCache.classify(ConnectionError("returned non-successful status code 404")))
+
+    def test_expiry_and_eviction(self):
+        cache = NegativeCache(max_entries=2, not_found_ttl=-1)
+        cache.set("a.com", NegativeCache.NOT_FOUND)
+        self.assertIsNone(cache.get("a.com"))
+        for host in ["a.com", "b.com", "c.com"]:
+            cache.set(host, NegativeCache.DNS_FAILURE)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("a.com"))
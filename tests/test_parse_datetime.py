@@ -0,0 +1,34 @@
+import unittest
+from datetime import timezone
+
+from dateutil.parser import parse
+
+from securitytxt.parsers.textparsers.field_line_parser import FieldLineParser
+
+
+class TestParseDatetime(unittest.TestCase):
+
+    def test_rfc3339_same_as_dateutil(self):
+        values = [" 2099-11-05T00:00:00.000Z", "2028-02-13T14:00:00Z", "2023-12-31T23:59:59.1234567+05:30",
+                  "2023-06-01 08:00:00-04:00", "2023-06-01t08:00:00z "]
+        for value in values:
+            with self.subTest(value=value):
+                result, datetime_format = FieldLineParser.parse_datetime(value)
+                self.assertEqual(result, parse(value).astimezone(tz=timezone.utc))
+                self.assertEqual(result.tzinfo, timezone.utc)
+                self.assertEqual(datetime_format, FieldLineParser.DATETIME_RFC3339)
+
+    def test_lenient(self):
+        for value in [" Wed, 13 Oct 2022 12:00 -0500", "2023-06-01T08:00+02:00"]:
+            with self.subTest(value=value):
+                result, datetime_format = FieldLineParser.parse_datetime(value)
+                self.assertEqual(result, parse(value).astimezone(tz=timezone.utc))
+                self.assertEqual(datetime_format, FieldLineParser.DATETIME_LENIENT)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            FieldLineParser.parse_datetime("2023-02-30T00:00:00Z")
+
+    def test_memoized(self):
+        value = "2031-01-01T00:00:00Z"
+        self.assertIs(FieldLineParser.parse_datetime(value)[0], FieldLineParser.parse_datetime(value)[0])
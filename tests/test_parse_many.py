@@ -0,0 +1,45 @@
+import os
+import unittest
+
+from securitytxt.securitytxt import SecurityTXT
+
+
+class TestParseMany(unittest.TestCase):
+    example_file = open(f"{os.path.dirname(os.path.realpath(__file__))}/files/test_signed/in.txt").read()
+    invalid_file = "-----BEGIN PGP SIGNED MESSAGE-----\nContact: a@b.c\n"
+    invalid_expires_file = "Contact: mailto:a@b.c\nExpires: not a date\n"
+
+    def texts(self):
+        return [f"Contact: mailto:{i}@example.com\n" if i % 3 else self.example_file for i in range(50)] + \
+               [self.invalid_file, self.invalid_expires_file]
+
+    def check_results(self, results):
+        self.assertEqual(sorted(index for index, _ in results), list(range(52)))
+        for index, result in results:
+            if index == 50:
+                self.assertIsInstance(result, AttributeError)
+            elif index == 51:
+                self.assertIsInstance(result, ValueError)
+            elif index % 3:
+                self.assertEqual(result.contact, (f"mailto:{index}@example.com",))
+            else:
+                self.assertEqual(result.signature, SecurityTXT.from_text(self.example_file).signature)
+
+    def test_ordered(self):
+        results = list(SecurityTXT.parse_many(iter(self.texts()), processes=2, chunksize=4))
+        self.assertEqual([index for index, _ in results], list(range(52)))
+        self.check_results(results)
+
+    def test_as_completed(self):
+        self.check_results(list(SecurityTXT.parse_many(self.texts(), processes=2, chunksize=4, ordered=False)))
+
+    def test_single_process(self):
+        results = list(SecurityTXT.parse_many(self.texts(), processes=1, chunksize=4))
+        self.assertEqual([index for index, _ in results], list(range(52)))
+        self.check_results(results)
+
+    def test_raw(self):
+        (_, dropped), = SecurityTXT.parse_many([self.example_file], processes=1)
+        (_, kept), = SecurityTXT.parse_many([self.example_file], processes=1, keep_raw=True)
+        self.assertEqual(dropped.raw, "")
+        self.assertEqual(kept.raw, self.example_file)
@@ -0,0 +1,101 @@
+import os
+import unittest
+
+import requests_mock
+
+from securitytxt.parsers.parse_memo import ParseMemo
+from securitytxt.result_store import ResultStore
+from securitytxt.securitytxt import SecurityTXT
+
+
+class TestParseMemo(unittest.TestCase):
+    example_file = open(f"{os.path.dirname(os.path.realpath(__file__))}/files/test_signed/in.txt").read()
+
+    def test_memoized(self):
+        memo = ParseMemo()
+        first = SecurityTXT.from_text(self.example_file, memo=memo)
+        second = SecurityTXT.from_text(self.example_file, memo=memo)
+        self.assertEqual(vars(first), vars(SecurityTXT.from_text(self.example_file)))
+        self.assertEqual(vars(first), vars(second))
+        self.assertIs(first.raw, second.raw)
+        self.assertEqual((memo.hits, memo.misses, memo.dedup_ratio), (1, 1, 2.0))
+
+    def test_copies_are_independent(self):
+        memo = ParseMemo()
+        first = memo.parse(self.example_file)
+        first.contact.append("mailto:other@example.com")
+        first.source_url = "https://example.com/security.txt"
+        second = memo.parse(self.example_file)
+        self.assertNotIn("mailto:other@example.com", second.contact)
+        self.assertIsNone(second.source_url)
+
+    def test_eviction(self):
+        memo = ParseMemo(max_entries=2)
+        for text in ["Contact: a", "Contact: b", "Contact: a", "Contact: c"]:
+            memo.parse(text)
+        self.assertEqual(len(memo), 2)
+        memo.parse("Contact: a")
+        self.assertEqual((memo.hits, memo.misses), (2, 3))
+
+    def test_invalid_not_memoized(self):
+        memo = ParseMemo()
+        for _ in range(2):
+            with self.assertRaises(AttributeError):
+                memo.parse("-----BEGIN PGP SIGNED MESSAGE-----\nContact: a@b.c\n")
+        self.assertEqual(len(memo), 0)
+
+    def test_from_url(self):
+        memo = ParseMemo()
+        with requests_mock.Mocker() as m:
+            for host in ["a.example", "b.example"]:
+                m.get(f"https://{host}/security.txt", text=self.example_file)
+            results = [SecurityTXT.from_url(f"https://{host}/security.txt", strict_url=True, parse_memo=memo)
+                       for host in ["a.example", "b.example"]]
+        self.assertEqual([result.source_url for result in results],
+                         ["https://a.example/security.txt", "https://b.example/security.txt"])
+        self.assertEqual(results[1].encoding, 'utf-8')
+        self.assertEqual(memo.hits, 1)
+
+
+class TestResultStore(unittest.TestCase):
+    example_file = TestParseMemo.example_file
+
+    def test_store(self):
+        store = ResultStore()
+        for host in ["a.example", "b.example", "c.example"]:
+            securitytxt = SecurityTXT.from_text(self.example_file)
+            securitytxt.source_url = f"https://{host}/security.txt"
+            store.add(securitytxt)
+        store.add(SecurityTXT.from_text("Contact: mailto:a@b.c"), "https://d.example/security.txt")
+        self.assertEqual((len(store), store.unique, store.dedup_ratio), (4, 2, 2.0))
+        result = store.get("https://b.example/security.txt")
+        self.assertEqual(result.source_url, "https://b.example/security.txt")
+        self.assertEqual(result.contact, SecurityTXT.from_text(self.example_file).contact)
+        shared = store.get_shared(store.digest("https://a.example/security.txt"))
+        self.assertIsNone(shared.source_url)
+        self.assertIs(shared.raw, result.raw)
+        self.assertIn("https://d.example/security.txt", store)
+        with self.assertRaises(KeyError):
+            store.get("https://e.example/security.txt")
+
+    def test_without_raw(self):
+        store = ResultStore()
+        for host, contact in [("a.com", "mailto:a@a.com"), ("b.com", "mailto:b@b.com"), ("c.com", "mailto:a@a.com")]:
+            securitytxt = SecurityTXT.from_text(f"Contact: {contact}").compact(keep_raw=False)
+            store.add(securitytxt, host)
+        self.assertEqual(store.unique, 2)
+        self.assertEqual(store.get("a.com").contact, ("mailto:a@a.com",))
+        self.assertEqual(store.get("b.com").contact, ("mailto:b@b.com",))
+        self.assertEqual(store.get("b.com").source_url, "b.com")
+        self.assertIsNone(store.get_shared(store.digest("b.com")).source_url)
+
+    def test_copy_compact(self):
+        compact = SecurityTXT.from_text(self.example_file).compact()
+        compact.add_field('x-custom', 'value')
+        copy = ParseMemo.copy(compact)
+        copy.add_field('x-custom', 'other')
+        copy.source_url = "https://example.com/security.txt"
+        self.assertEqual(copy.to_dict()['x-custom'], ['value', 'other'])
+        self.assertEqual(compact.to_dict()['x-custom'], ['value'])
+        self.assertIsNone(compact.source_url)
+        self.assertEqual(copy.raw, self.example_file)
@@ -0,0 +1,115 @@
+import gzip
+import os
+import tempfile
+import unittest
+
+import requests_mock
+
+from securitytxt.parsers.probe_order import ProbeOrder
+from securitytxt.securitytxt import SecurityTXT
+from tests.local_server import LocalServer
+
+
+class TestProbeOrder(unittest.TestCase):
+    file_urls = ["https://{}/.well-known/security.txt", "http://{}/.well-known/security.txt",
+                 "https://{}/security.txt", "http://{}/security.txt"]
+
+    def urls(self, netloc: str):
+        return [url.format(netloc) for url in self.file_urls]
+
+    def lookup(self, server: LocalServer, probe_order: ProbeOrder) -> SecurityTXT:
+        return SecurityTXT.from_url(server.netloc, possible_schemes=["http"], probe_order=probe_order)
+
+    def test_remembered_url_first(self):
+        probe_order = ProbeOrder()
+        with LocalServer({"/security.txt": (200, "Contact: mailto:a@b.c")}) as server:
+            self.lookup(server, probe_order)
+            self.assertEqual(server.requests, ["/.well-known/security.txt", "/security.txt"])
+            securitytxt = self.lookup(server, probe_order)
+        self.assertEqual(server.requests[2:], ["/security.txt"])
+        self.assertEqual(securitytxt.source_url, f"http://{server.netloc}/security.txt")
+        self.assertEqual((probe_order.hits, probe_order.misses, probe_order.probes_saved), (1, 0, 1))
+
+    def test_fall_back_on_miss(self):
+        probe_order = ProbeOrder()
+        routes = {"/security.txt": [(200, "Contact: mailto:a@b.c"), (404, "Not found")],
+                  "/.well-known/security.txt": [(404, "Not found"), (200, "Contact: mailto:b@b.c")]}
+        with LocalServer(routes) as server:
+            self.lookup(server, probe_order)
+            securitytxt = self.lookup(server, probe_order)
+            self.assertEqual(server.requests[2:], ["/security.txt", "/.well-known/security.txt"])
+            self.assertEqual(securitytxt.contact, ["mailto:b@b.c"])
+            self.assertEqual((probe_order.hits, probe_order.misses, probe_order.probes_saved), (0, 1, -1))
+            # The file was found at the first url in the usual order, so there is nothing left to remember
+            self.assertEqual(len(probe_order), 0)
+
+    def test_not_found_forgets_host(self):
+        probe_order = ProbeOrder()
+        urls = self.urls("a.test")
+        probe_order.update(urls, urls, urls[3])
+        probe_order.update(urls, probe_order.order(urls), None)
+        self.assertEqual(probe_order.order(urls), urls)
+        self.assertEqual(probe_order.misses, 1)
+
+    def test_keeps_choice_of_usual_order(self):
+        probe_order = ProbeOrder()
+        urls = self.urls("a.test")
+        # Found at the remembered url without requesting the urls before it, so it is not learned again
+        probe_order.update(urls, [urls[3], urls[0], urls[1], urls[2]], urls[3])
+        self.assertEqual(len(probe_order), 0)
+        probe_order.update(urls, urls, urls[2])
+        self.assertEqual(probe_order.order(urls), [urls[2], urls[0], urls[1], urls[3]])
+
+    def test_max_age(self):
+        probe_order = ProbeOrder(max_age=1e-9)
+        urls = self.urls("a.test")
+        probe_order.update(urls, urls, urls[3])
+        self.assertEqual(probe_order.order(urls), urls)
+        self.assertEqual(len(probe_order), 0)
+
+    def test_by_domain(self):
+        probe_order = ProbeOrder(by_domain=True)
+        urls = self.urls("www.example.co.uk")
+        probe_order.update(urls, urls, urls[3])
+        other = self.urls("mail.example.co.uk:8080")
+        self.assertEqual(probe_order.order(other), [other[3], other[0], other[1], other[2]])
+        self.assertEqual(ProbeOrder().order(other), other)
+        self.assertEqual(probe_order.order(self.urls("www.other.co.uk")), self.urls("www.other.co.uk"))
+
+    def test_by_domain_is_opt_in(self):
+        with requests_mock.Mocker() as m:
+            m.get(requests_mock.ANY, status_code=404)
+            m.get("http://a.example.com/security.txt", text="Contact: mailto:a@b.c")
+            m.get("http://b.example.com/.well-known/security.txt", text="Contact: mailto:well-known@b.c")
+            m.get("http://b.example.com/security.txt", text="Contact: mailto:root@b.c")
+            for by_domain, contact in [(False, "mailto:well-known@b.c"), (True, "mailto:root@b.c")]:
+                with self.subTest(by_domain=by_domain):
+                    probe_order = ProbeOrder(by_domain=by_domain)
+                    for host in ["a.example.com", "b.example.com"]:
+                        securitytxt = SecurityTXT.from_url(host, possible_schemes=["http"], probe_order=probe_order)
+                    self.assertEqual(securitytxt.contact, [contact])
+
+    def test_registrable_domain(self):
+        self.assertEqual(ProbeOrder.registrable_domain("www.Example.com."), "example.com")
+        self.assertEqual(ProbeOrder.registrable_domain("a.b.example.co.uk"), "example.co.uk")
+        self.assertEqual(ProbeOrder.registrable_domain("co.uk"), "co.uk")
+        self.assertIsNone(ProbeOrder.registrable_domain("127.0.0.1"))
+        self.assertIsNone(ProbeOrder.registrable_domain("localhost"))
+
+    def test_save_and_load(self):
+        probe_order = ProbeOrder(by_domain=True)
+        urls = self.urls("www.example.com")
+        probe_order.update(urls, urls, urls[3])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "order.gz")
+            probe_order.save(path)
+            loaded = ProbeOrder.load(path, by_domain=True)
+            urls = self.urls("api.example.com")
+            self.assertEqual(loaded.order(urls), probe_order.order(urls))
+            self.assertEqual(len(loaded), 2)
+            with gzip.open(path, 'rb') as memory:
+                data = memory.read()
+            with gzip.open(path, 'wb') as memory:
+                memory.write(data[:-3])
+            with self.assertRaises(ValueError):
+                ProbeOrder.load(path)
@@ -0,0 +1,100 @@
+import asyncio
+import os
+import unittest
+
+import requests_mock
+
+from securitytxt.parsers.probe_stats import ProbeEvent, ProbeStats
+from securitytxt.securitytxt import SecurityTXT
+from tests.local_server import LocalServer
+
+
+class TestProbeEvents(unittest.TestCase):
+    example_file = open(f"{os.path.dirname(os.path.realpath(__file__))}/files/test_signed/in.txt").read()
+
+    def lookup(self, url: str = "test.com", **kwargs):
+        events = []
+        try:
+            SecurityTXT.from_url(url, on_probe=events.append, **kwargs)
+        except (FileNotFoundError, AttributeError):
+            pass
+        return events
+
+    def test_outcomes(self):
+        with requests_mock.Mocker() as m:
+            m.get("https://test.com/.well-known/security.txt", status_code=404)
+            m.get("http://test.com/.well-known/security.txt", text="<html></html>")
+            m.get("https://test.com/security.txt", text=self.example_file)
+            events = self.lookup()
+        self.assertEqual([(event.scheme, event.path, event.outcome, event.status) for event in events], [
+            ('https', '/.well-known/security.txt', ProbeEvent.NON_SUCCESSFUL, 404),
+            ('http', '/.well-known/security.txt', ProbeEvent.HTML, 200),
+            ('https', '/security.txt', ProbeEvent.FOUND, 200)])
+        self.assertEqual(events[2].size, len(self.example_file.encode()))
+        self.assertGreater(events[2].parse_time, 0)
+        self.assertGreaterEqual(events[2].elapsed, events[2].parse_time)
+
+    def test_request_and_parse_errors(self):
+        with requests_mock.Mocker() as m:
+            m.get("https://test.com/.well-known/security.txt", exc=ConnectionError("refused"))
+            m.get("http://test.com/.well-known/security.txt", text="-----BEGIN PGP SIGNED MESSAGE-----\nContact: a\n")
+            events = self.lookup()
+        self.assertEqual([event.outcome for event in events], [ProbeEvent.REQUEST_ERROR, ProbeEvent.PARSE_ERROR])
+        self.assertIsInstance(events[0].error, ConnectionError)
+        self.assertIsInstance(events[1].error, AttributeError)
+
+    def test_streaming_too_large(self):
+        with requests_mock.Mocker() as m:
+            m.get(requests_mock.ANY, text=self.example_file)
+            events = self.lookup("https://test.com/security.txt", stream=True, max_file_size=100, strict_url=True)
+        self.assertEqual([event.outcome for event in events], [ProbeEvent.TOO_LARGE])
+
+    def test_timing_against_server(self):
+        with LocalServer({"/security.txt": (200, self.example_file)}, delay=0.05) as server:
+            events = []
+            SecurityTXT.from_url(f"http://{server.netloc}/security.txt", strict_url=True, on_probe=events.append)
+        event, = events
+        self.assertGreaterEqual(event.request_time, 0.05)
+        self.assertLess(event.download_time, event.request_time)
+        self.assertGreaterEqual(event.elapsed, event.request_time + event.parse_time)
+
+    def test_async(self):
+        events = []
+
+        async def lookup():
+            with LocalServer({"/security.txt": (200, self.example_file)}) as server:
+                await SecurityTXT.afrom_url(f"http://{server.netloc}/security.txt", strict_url=True,
+                                            on_probe=events.append)
+
+        asyncio.run(lookup())
+        self.assertEqual([(event.outcome, event.status) for event in events], [(ProbeEvent.FOUND, 200)])
+
+
+class TestProbeStats(unittest.TestCase):
+
+    def event(self, outcome: str, status: int, elapsed: float) -> ProbeEvent:
+        return ProbeEvent("https://test.com/security.txt", "https", "/security.txt", outcome, status, 10, elapsed, 0.0,
+                          0.0, elapsed, None)
+
+    def test_snapshot(self):
+        stats = ProbeStats(buckets=(0.1, 1.0))
+        stats(self.event(ProbeEvent.FOUND, 200, 0.05))
+        stats(self.event(ProbeEvent.NON_SUCCESSFUL, 404, 0.5))
+        stats(self.event(ProbeEvent.NON_SUCCESSFUL, 404, 5.0))
+        snapshot = stats.snapshot()
+        self.assertEqual((snapshot['probes'], snapshot['size']), (3, 30))
+        self.assertEqual(snapshot['outcomes'], {ProbeEvent.FOUND: 1, ProbeEvent.NON_SUCCESSFUL: 2})
+        self.assertEqual(snapshot['statuses'], {200: 1, 404: 2})
+        self.assertEqual(snapshot['histograms']['elapsed']['buckets'], [(0.1, 1), (1.0, 2), (float('inf'), 3)])
+        self.assertAlmostEqual(snapshot['histograms']['request']['sum'], 5.55)
+        stats.reset()
+        self.assertEqual(stats.snapshot()['probes'], 0)
+
+    def test_from_urls(self):
+        stats = ProbeStats()
+        with LocalServer({"/a/security.txt": (200, "Contact: mailto:a@b.c")}) as server:
+            results = dict(SecurityTXT.from_urls([f"http://{server.netloc}/a/security.txt",
+                                                  f"http://{server.netloc}/b/security.txt"],
+                                                 strict_url=True, on_probe=stats))
+        self.assertEqual(len(results), 2)
+        self.assertEqual(stats.outcomes, {ProbeEvent.FOUND: 1, ProbeEvent.NON_SUCCESSFUL: 1})
@@ -0,0 +1,146 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+
+from requests import Response
+
+from securitytxt.parsers.rate_limiter import RateLimiter
+from securitytxt.securitytxt import SecurityTXT
+from tests.local_server import LocalServer
+
+
+def response(status: int, retry_after: str = None) -> Response:
+    result = Response()
+    result.status_code = status
+    if retry_after is not None:
+        result.headers['Retry-After'] = retry_after
+    return result
+
+
+class TestRateLimiter(unittest.TestCase):
+    def request_all(self, limiter: RateLimiter, urls) -> float:
+        start = time.monotonic()
+        for url in urls:
+            with limiter.acquire(url):
+                pass
+        return time.monotonic() - start
+
+    def test_host_rate(self):
+        limiter = RateLimiter(host_rate=20, host_burst=1, resolve=False)
+        self.assertGreaterEqual(self.request_all(limiter, ["http://a.test/"] * 5), 0.2)
+        self.assertEqual(limiter.throttled, 4)
+        self.assertGreaterEqual(limiter.snapshot()['throttle_wait'], 0.19)
+
+    def test_hosts_are_independent(self):
+        limiter = RateLimiter(host_rate=1, host_burst=1, resolve=False)
+        self.assertLess(self.request_all(limiter, [f"http://{i}.test/" for i in range(20)]), 0.5)
+        self.assertEqual(limiter.throttled, 0)
+
+    def test_burst(self):
+        limiter = RateLimiter(host_rate=1, host_burst=4, resolve=False)
+        self.assertLess(self.request_all(limiter, ["http://a.test/"] * 4), 0.5)
+
+    def test_ip_rate(self):
+        limiter = RateLimiter(host_rate=1000, ip_rate=20, ip_burst=1)
+        urls = [f"http://127.0.0.1:{port}/" for port in range(8000, 8005)]
+        self.assertGreaterEqual(self.request_all(limiter, urls), 0.2)
+        self.assertEqual(limiter.throttled, 4)
+
+    def test_max_in_flight(self):
+        limiter = RateLimiter(host_rate=1000, max_in_flight=2, resolve=False)
+        peak = []
+
+        def request(i):
+            with limiter.acquire(f"http://{i}.test/"):
+                peak.append(limiter.in_flight)
+                time.sleep(0.05)
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(request, range(6)))
+        self.assertEqual(max(peak), 2)
+        snapshot = limiter.snapshot()
+        self.assertEqual((snapshot['requests'], snapshot['in_flight'], snapshot['queue_depth']), (6, 0, 0))
+        self.assertGreaterEqual(snapshot['max_queue_depth'], 3)
+        self.assertGreaterEqual(snapshot['throttled'], 4)
+
+    def test_paced_after_waiting_for_slots(self):
+        limiter = RateLimiter(host_rate=20, host_burst=1, max_in_flight=3, resolve=False)
+        starts = []
+
+        def request(url, duration):
+            with limiter.acquire(url):
+                if "a.test" in url:
+                    starts.append(time.monotonic())
+                time.sleep(duration)
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            # The other hosts hold all slots while the requests to a.test wait for theirs
+            for i in range(3):
+                executor.submit(request, f"http://{i}.test/", 0.3)
+            time.sleep(0.05)
+            list(executor.map(request, ["http://a.test/"] * 3, [0] * 3))
+        starts.sort()
+        self.assertGreaterEqual(min(b - a for a, b in zip(starts, starts[1:])), 0.04)
+
+    def test_penalize(self):
+        limiter = RateLimiter(host_rate=1000, resolve=False)
+        limiter.penalize("http://a.test/security.txt", 0.2)
+        self.assertGreaterEqual(self.request_all(limiter, ["http://a.test/.well-known/security.txt"]), 0.2)
+        self.assertLess(self.request_all(limiter, ["http://b.test/"]), 0.1)
+        self.assertEqual(limiter.rate_limited, 1)
+
+    def test_retry_after(self):
+        limiter = RateLimiter()
+        self.assertEqual(limiter.retry_after(response(429, "7")), 7.0)
+        self.assertAlmostEqual(limiter.retry_after(response(429, formatdate(time.time() + 30, usegmt=True))), 30, -1)
+        self.assertEqual(limiter.retry_after(response(429)), RateLimiter.default_retry_after)
+        self.assertEqual(limiter.retry_after(response(503, "3")), 3.0)
+        self.assertIsNone(limiter.retry_after(response(503)))
+        self.assertIsNone(limiter.retry_after(response(200, "3")))
+
+
+class TestRateLimitedURLParser(unittest.TestCase):
+    def test_retry_after_429(self):
+        routes = {"/security.txt": [(429, "Slow down", {"Retry-After": "0"}), (200, "Contact: mailto:a@b.c")]}
+        limiter = RateLimiter(host_rate=1000)
+        with LocalServer(routes) as server:
+            securitytxt = SecurityTXT.from_url(f"http://{server.netloc}/security.txt", strict_url=True,
+                                               rate_limiter=limiter)
+        self.assertEqual(securitytxt.contact, ["mailto:a@b.c"])
+        self.assertEqual(server.requests, ["/security.txt"] * 2)
+        self.assertEqual((limiter.requests, limiter.rate_limited), (2, 1))
+
+    def test_long_retry_after_not_retried(self):
+        routes = {"/security.txt": [(429, "Slow down", {"Retry-After": "3600"}), (200, "Contact: mailto:a@b.c")]}
+        limiter = RateLimiter(host_rate=1000)
+        with LocalServer(routes) as server:
+            with self.assertRaises(FileNotFoundError):
+                SecurityTXT.from_url(f"http://{server.netloc}/security.txt", strict_url=True, rate_limiter=limiter)
+        self.assertEqual(server.requests, ["/security.txt"])
+        self.assertEqual(limiter.snapshot()['blocked_hosts'], 1)
+
+    def test_long_retry_after_fails_next_probe(self):
+        routes = {"/.well-known/security.txt": (429, "Slow down", {"Retry-After": "3600"}),
+                  "/security.txt": (200, "Contact: mailto:a@b.c")}
+        limiter = RateLimiter(host_rate=1000)
+        with LocalServer(routes) as server:
+            start = time.monotonic()
+            with self.assertRaises(FileNotFoundError):
+                SecurityTXT.from_url(server.netloc, possible_schemes=["http"], rate_limiter=limiter)
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(server.requests, ["/.well-known/security.txt"])
+        self.assertEqual((limiter.rejected, limiter.snapshot()['blocked_hosts']), (1, 1))
+        with self.assertRaises(ConnectionError):
+            with limiter.acquire(f"http://{server.netloc}/security.txt"):
+                pass
+
+    def test_paced_scan(self):
+        with LocalServer({"/.well-known/security.txt": (200, "Contact: mailto:a@b.c")}) as server:
+            limiter = RateLimiter(host_rate=20, host_burst=1, resolve=False)
+            start = time.monotonic()
+            results = list(SecurityTXT.from_urls([server.netloc] * 4, max_workers=4, possible_schemes=["http"],
+                                                rate_limiter=limiter))
+        self.assertGreaterEqual(time.monotonic() - start, 3 / 20)
+        self.assertTrue(all(isinstance(result, SecurityTXT) for _, result in results))
+        self.assertEqual(limiter.throttled, 3)
@@ -0,0 +1,136 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from securitytxt.result_archive import ArchiveWriter, ArchiveReader
+from securitytxt.securitytxt import SecurityTXT
+
+files_directory = f"{os.path.dirname(os.path.realpath(__file__))}/files"
+example_files = [open(f"{files_directory}/{name}/in.txt").read() for name in sorted(os.listdir(files_directory))]
+
+
+class TestToDict(unittest.TestCase):
+    texts = example_files
+
+    def test_round_trip(self):
+        for text in self.texts:
+            with self.subTest(text=text[:40]):
+                securitytxt = SecurityTXT.from_text(text)
+                copy = SecurityTXT.from_dict(securitytxt.to_dict())
+                self.assertEqual(vars(copy), vars(securitytxt))
+                copy.contact.append("mailto:other@example.com")
+                self.assertNotIn("mailto:other@example.com", securitytxt.contact)
+
+    def test_without_raw(self):
+        fields = SecurityTXT.from_text(self.texts[0]).to_dict(include_raw=False)
+        self.assertNotIn('raw', fields)
+        self.assertEqual(SecurityTXT.from_dict(fields).raw, "")
+
+    def test_lazy_and_compact(self):
+        for text in self.texts:
+            with self.subTest(text=text[:40]):
+                securitytxt = SecurityTXT.from_text(text)
+                self.assertEqual(securitytxt.compact().to_dict(), securitytxt.to_dict())
+                lazy = SecurityTXT.from_text(text, lazy=True).to_dict()
+                self.assertEqual({key: value for key, value in lazy.items() if value is not None},
+                                 {key: value for key, value in securitytxt.to_dict().items() if value is not None})
+
+
+class TestResultArchive(unittest.TestCase):
+    texts = example_files
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "results.stx")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def securitytxts(self):
+        securitytxts = [SecurityTXT.from_text(text) for text in self.texts]
+        for index, securitytxt in enumerate(securitytxts):
+            securitytxt.source_url = f"https://host{index}.test/.well-known/security.txt"
+        return securitytxts
+
+    def test_round_trip(self):
+        securitytxts = self.securitytxts()
+        securitytxts[0].add_field('x-custom', 'value')
+        with ArchiveWriter(self.path) as writer:
+            for securitytxt in securitytxts:
+                writer.write(securitytxt)
+        with ArchiveReader(self.path) as reader:
+            self.assertEqual(len(reader), len(securitytxts))
+            for securitytxt, loaded in zip(securitytxts, reader):
+                self.assertEqual(vars(loaded), vars(securitytxt))
+            self.assertEqual(reader[-1].to_dict(), securitytxts[-1].to_dict())
+            self.assertEqual(vars(reader[0])['x-custom'], ['value'])
+            with self.assertRaises(IndexError):
+                reader[len(securitytxts)]
+
+    def test_signature(self):
+        securitytxt = SecurityTXT.from_text(open(f"{files_directory}/test_signed/in.txt").read())
+        with ArchiveWriter(self.path) as writer:
+            writer.write(securitytxt)
+        with ArchiveReader(self.path) as reader:
+            self.assertEqual(reader[0].signature, securitytxt.signature)
+            self.assertIsNotNone(reader[0].signature)
+
+    def test_without_raw(self):
+        securitytxts = self.securitytxts()
+        with ArchiveWriter(self.path) as writer:
+            for securitytxt in securitytxts:
+                writer.write(securitytxt)
+        with ArchiveReader(self.path, keep_raw=False) as reader:
+            fields = reader.get_dict(0)
+            self.assertNotIn('raw', fields)
+            self.assertEqual(fields, securitytxts[0].to_dict(include_raw=False))
+        with ArchiveWriter(self.path, keep_raw=False) as writer:
+            writer.write(securitytxts[0])
+        with ArchiveReader(self.path) as reader:
+            self.assertEqual(reader[0].raw, "")
+            self.assertEqual(reader[0].contact, securitytxts[0].contact)
+
+    def test_string_table(self):
+        securitytxt = SecurityTXT.from_text("Contact: https://hackerone.com/example\n"
+                                            "Policy: https://example.com/policy")
+        sizes = []
+        for count in (1, 101):
+            with ArchiveWriter(self.path, keep_raw=False) as writer:
+                for _ in range(count):
+                    writer.write(securitytxt)
+            sizes.append(os.path.getsize(self.path))
+        # The field names and urls are stored once, and the empty fields are left out
+        self.assertLess((sizes[1] - sizes[0]) / 100, len("https://hackerone.com/examplehttps://example.com/policy"))
+
+    def test_expires(self):
+        values = [datetime(2030, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+                  datetime(2030, 1, 2, 3, 4, 5, 678, tzinfo=timezone(timedelta(hours=-5, minutes=-30))),
+                  datetime(1960, 1, 1), None]
+        with ArchiveWriter(self.path) as writer:
+            for value in values:
+                writer.write(SecurityTXT(expires=value))
+        with ArchiveReader(self.path) as reader:
+            for value, loaded in zip(values, reader):
+                self.assertEqual(loaded.expires, value)
+                self.assertEqual(loaded.expires.utcoffset() if loaded.expires else None,
+                                 value.utcoffset() if value else None)
+
+    def test_unsupported_value(self):
+        securitytxt = SecurityTXT()
+        securitytxt.add_field('x-number', 42)
+        with ArchiveWriter(self.path) as writer:
+            with self.assertRaises(ValueError):
+                writer.write(securitytxt)
+
+    def test_invalid(self):
+        with ArchiveWriter(self.path) as writer:
+            for securitytxt in self.securitytxts():
+                writer.write(securitytxt)
+        with open(self.path, 'rb') as archive:
+            data = archive.read()
+        for invalid in (data[:-1], data[:len(data) // 2], b"not an archive" * 10):
+            with open(self.path, 'wb') as archive:
+                archive.write(invalid)
+            with self.assertRaises(ValueError):
+                ArchiveReader(self.path)
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+from securitytxt.scheduler import RecrawlScheduler
+from securitytxt.securitytxt import SecurityTXT
+
+day = 24 * 60 * 60
+
+
+class TestRecrawlScheduler(unittest.TestCase):
+    now = datetime(2030, 1, 1, tzinfo=timezone.utc).timestamp()
+
+    def scheduler(self, **kwargs) -> RecrawlScheduler:
+        return RecrawlScheduler(min_interval=day, max_interval=30 * day, jitter=0.0, **kwargs)
+
+    def expiring(self, days: float) -> SecurityTXT:
+        return SecurityTXT(expires=datetime.fromtimestamp(self.now + days * day, timezone.utc))
+
+    def test_due_at_expiry(self):
+        scheduler = self.scheduler()
+        self.assertEqual(scheduler.update('a', self.expiring(10), self.now), self.now + 10 * day)
+        self.assertEqual(scheduler.update('b', self.expiring(100), self.now), self.now + 30 * day)
+        self.assertEqual(scheduler.update('c', self.expiring(-1), self.now), self.now + day)
+        self.assertEqual(scheduler.update('d', SecurityTXT(), self.now), self.now + 30 * day)
+        self.assertEqual(list(scheduler.due(self.now + 10 * day)), ['c', 'a'])
+        self.assertEqual(scheduler.next_due(), self.now + 30 * day)
+
+    def test_backoff(self):
+        scheduler = self.scheduler()
+        intervals = [scheduler.update('a', FileNotFoundError(), self.now) - self.now for _ in range(7)]
+        self.assertEqual(intervals, [day, 2 * day, 4 * day, 8 * day, 16 * day, 30 * day, 30 * day])
+        self.assertEqual(scheduler.update('a', self.expiring(5), self.now), self.now + 5 * day)
+        self.assertEqual(scheduler.update('a', FileNotFoundError(), self.now), self.now + day)
+
+    def test_jitter(self):
+        scheduler = RecrawlScheduler(min_interval=day, max_interval=30 * day, jitter=0.1, seed=1)
+        dues = {scheduler.update(str(i), self.expiring(10), self.now) for i in range(100)}
+        self.assertGreater(len(dues), 1)
+        self.assertTrue(all(self.now + 9 * day <= due <= self.now + 11 * day for due in dues))
+
+    def test_add_and_due_once(self):
+        scheduler = self.scheduler()
+        scheduler.add('a', self.now)
+        scheduler.add('b', self.now + day)
+        scheduler.add('a', self.now + 5 * day)
+        self.assertEqual(list(scheduler.due(self.now)), ['a'])
+        self.assertEqual(list(scheduler.due(self.now)), [])
+        self.assertIn('a', scheduler)
+        self.assertEqual(len(scheduler), 2)
+
+    def test_save_and_load(self):
+        scheduler = self.scheduler()
+        scheduler.update('a', self.expiring(10), self.now)
+        scheduler.update('ü.example', FileNotFoundError(), self.now)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'state')
+            scheduler.save(path)
+            loaded = RecrawlScheduler.load(path, min_interval=day, max_interval=30 * day, jitter=0.0)
+            with open(path, 'wb') as state:
+                state.write(b'invalid')
+            with self.assertRaises((ValueError, OSError)):
+                RecrawlScheduler.load(path)
+        self.assertEqual(list(loaded.due(self.now + 10 * day)), ['ü.example', 'a'])
+        self.assertEqual(loaded.update('ü.example', FileNotFoundError(), self.now), self.now + 2 * day)
@@ -0,0 +1,178 @@
+import os
+import tempfile
+import unittest
+
+import pgpy
+from pgpy.constants import PubKeyAlgorithm, KeyFlags, HashAlgorithm
+
+from securitytxt.parsers.key_cache import KeyCache
+from securitytxt.parsers.signature_verifier import SignatureVerifier, VerificationResult
+from securitytxt.securitytxt import SecurityTXT
+from tests.local_server import LocalServer
+
+
+def new_key(name: str) -> pgpy.PGPKey:
+    key = pgpy.PGPKey.new(PubKeyAlgorithm.RSAEncryptOrSign, 1024)
+    key.add_uid(pgpy.PGPUID.new(name), usage={KeyFlags.Sign}, hashes=[HashAlgorithm.SHA256])
+    return key
+
+
+def sign(key: pgpy.PGPKey, text: str) -> str:
+    message = pgpy.PGPMessage.new(text, cleartext=True)
+    message |= key.sign(message)
+    return str(message)
+
+
+class TestSignatureVerifier(unittest.TestCase):
+    key = new_key("Security Team")
+    other_key = new_key("Someone Else")
+    fingerprint = str(key.fingerprint).replace(' ', '')
+
+    def signed_file(self, server: LocalServer, contact: str = "mailto:a@b.c", key: pgpy.PGPKey = None) -> SecurityTXT:
+        text = f"Contact: {contact}\nEncryption: http://{server.netloc}/key.asc\nExpires: 2099-01-01T00:00:00z\n"
+        return SecurityTXT.from_text(sign(key if key else self.key, text))
+
+    def test_valid(self):
+        with LocalServer({"/key.asc": (200, str(self.key.pubkey))}) as server:
+            result = self.signed_file(server).verify_signature(key_server=None)
+        self.assertTrue(result.valid)
+        self.assertEqual(result, VerificationResult('valid', self.fingerprint, f"http://{server.netloc}/key.asc"))
+
+    def test_tampered(self):
+        with LocalServer({"/key.asc": (200, str(self.key.pubkey))}) as server:
+            securitytxt = self.signed_file(server)
+            securitytxt.raw = securitytxt.raw.replace("mailto:a@b.c", "mailto:evil@b.c")
+            result = securitytxt.verify_signature(key_server=None)
+        self.assertEqual(result.status, VerificationResult.INVALID)
+
+    def test_unsigned_and_malformed(self):
+        verifier = SignatureVerifier(key_server=None)
+        self.assertEqual(verifier.verify(SecurityTXT.from_text("Contact: a@b.c")).status, VerificationResult.UNSIGNED)
+        malformed = SecurityTXT.from_text("-----BEGIN PGP SIGNED MESSAGE-----\nContact: a@b.c\n"
+                                          "-----BEGIN PGP SIGNATURE-----\nabc\n-----END PGP SIGNATURE-----\n")
+        self.assertEqual(verifier.verify(malformed).status, VerificationResult.MALFORMED)
+
+    def test_wrong_key_falls_back_to_key_server(self):
+        routes = {"/key.asc": (200, str(self.other_key.pubkey)),
+                  f"/vks/v1/by-keyid/{self.key.fingerprint.keyid}": (200, str(self.key.pubkey))}
+        with LocalServer(routes) as server:
+            result = self.signed_file(server).verify_signature(key_server=f"http://{server.netloc}")
+        self.assertTrue(result.valid)
+        self.assertEqual(result.key_url, f"http://{server.netloc}/vks/v1/by-keyid/{self.key.fingerprint.keyid}")
+
+    def test_no_key(self):
+        with LocalServer({"/key.asc": (200, "not a key")}) as server:
+            result = self.signed_file(server).verify_signature(key_server=f"http://{server.netloc}")
+        self.assertEqual(result, VerificationResult(VerificationResult.NO_KEY))
+
+    def test_fingerprint_uri(self):
+        routes = {f"/vks/v1/by-fingerprint/{self.fingerprint}": (200, str(self.key.pubkey))}
+        with LocalServer(routes) as server:
+            securitytxt = SecurityTXT.from_text(sign(self.key, f"Contact: a@b.c\nEncryption: openpgp4fpr:"
+                                                               f"{self.fingerprint.lower()}\n"))
+            result = securitytxt.verify_signature(key_server=f"http://{server.netloc}/")
+        self.assertTrue(result.valid)
+        self.assertEqual(server.requests, [f"/vks/v1/by-fingerprint/{self.fingerprint}"])
+
+    def test_key_found_at_other_url(self):
+        with LocalServer({"/key.asc": (200, str(self.key.pubkey))}) as server:
+            verifier = SignatureVerifier(key_server=f"http://{server.netloc}")
+            self.assertTrue(verifier.verify(self.signed_file(server)).valid)
+            by_fingerprint = SecurityTXT.from_text(sign(self.key, f"Contact: a@b.c\nEncryption: openpgp4fpr:"
+                                                                  f"{self.fingerprint}\n"))
+            by_key_id = SecurityTXT.from_text(sign(self.key, "Contact: b@b.c\n"))
+            for verifier in (verifier, SignatureVerifier(key_cache=verifier.key_cache,
+                                                         key_server=f"http://{server.netloc}")):
+                self.assertTrue(verifier.verify(by_fingerprint).valid)
+                result = verifier.verify(by_key_id)
+                self.assertEqual(result.key_url, f"http://{server.netloc}/vks/v1/by-keyid/{self.key.fingerprint.keyid}")
+                self.assertTrue(result.valid)
+        self.assertEqual(server.requests, ["/key.asc"])
+
+    def test_corrupt_cached_key(self):
+        with LocalServer({"/key.asc": (200, str(self.key.pubkey))}) as server:
+            cache = KeyCache()
+            cache.set(f"http://{server.netloc}/key.asc", self.fingerprint, "corrupt")
+            result = SignatureVerifier(key_cache=cache, key_server=None).verify(self.signed_file(server))
+        self.assertTrue(result.valid)
+        self.assertEqual(server.requests, ["/key.asc"])
+        self.assertEqual(cache.get(f"http://{server.netloc}/key.asc").armored, str(self.key.pubkey))
+
+    def test_bulk_shares_keys_and_results(self):
+        with LocalServer({"/key.asc": (200, str(self.key.pubkey))}) as server:
+            distinct = [self.signed_file(server, f"mailto:{i}@b.c") for i in range(10)]
+            files = [SecurityTXT.from_text(distinct[i % 10].raw) for i in range(50)]
+            verifier = SignatureVerifier(key_server=None, max_workers=4)
+            results = list(verifier.verify_many(iter(files)))
+            self.assertEqual([securitytxt for securitytxt, _ in results], files)
+            self.assertTrue(all(result.valid for _, result in results))
+            self.assertEqual(server.requests, ["/key.asc"])
+            self.assertEqual(verifier.fetches, 1)
+            hits = verifier.memo_hits
+            verifier.verify(files[0])
+            self.assertEqual(verifier.memo_hits, hits + 1)
+
+    def test_verify_signatures(self):
+        with LocalServer({"/key.asc": (200, str(self.key.pubkey))}) as server:
+            files = [self.signed_file(server), self.signed_file(server, key=self.other_key),
+                     SecurityTXT.from_text("Contact: a@b.c")]
+            statuses = [result.status for _, result in SecurityTXT.verify_signatures(files, key_server=None)]
+        self.assertEqual(statuses, [VerificationResult.VALID, VerificationResult.NO_KEY, VerificationResult.UNSIGNED])
+
+    def test_persistent_key_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "keys.sqlite")
+            with LocalServer({"/key.asc": (200, str(self.key.pubkey))}) as server:
+                securitytxt = self.signed_file(server)
+                SignatureVerifier(key_cache=KeyCache(path), key_server=None).verify(securitytxt)
+                cache = KeyCache(path)
+                result = SignatureVerifier(key_cache=cache, key_server=None).verify(securitytxt)
+            self.assertTrue(result.valid)
+            self.assertEqual(server.requests, ["/key.asc"])
+            self.assertEqual(cache.get(f"http://{server.netloc}/key.asc").fingerprint, self.fingerprint)
+            self.assertEqual(cache.get_by_fingerprint(self.fingerprint), str(self.key.pubkey))
+            cache.close()
+
+
+class TestKeyCache(unittest.TestCase):
+    def test_missing_key(self):
+        cache = KeyCache()
+        cache.set("https://example.com/key.asc", None, None)
+        self.assertEqual(cache.get("https://example.com/key.asc"), (None, None))
+        self.assertIsNone(cache.get("https://example.com/other.asc"))
+
+    def test_eviction(self):
+        cache = KeyCache(max_size=100)
+        cache.set("a", "A" * 40, "x" * 40)
+        cache.set("b", "B" * 40, "x" * 40)
+        cache.set("c", "C" * 40, "x" * 40)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNone(cache.get_by_fingerprint("A" * 40))
+
+    def test_size_tracked(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "keys.sqlite")
+            cache = KeyCache(path, max_size=100)
+            # Replacing an entry does not count its size twice, so the other entry is not evicted
+            for _ in range(3):
+                cache.set("a", "A" * 40, "x" * 40)
+            cache.set("b", "B" * 40, "x" * 40)
+            cache.delete("a")
+            cache.set("c", "C" * 40, "x" * 40)
+            self.assertEqual(len(cache), 2)
+            cache.close()
+            # The size of the keys that are already stored is loaded when the cache is opened
+            cache = KeyCache(path, max_size=100)
+            statements = []
+            cache._connection.set_trace_callback(statements.append)
+            cache.set("d", "D" * 40, "x" * 40)
+            self.assertFalse([statement for statement in statements if "SUM(" in statement])
+            self.assertEqual(len(cache), 2)
+            self.assertIsNone(cache.get("b"))
+            cache.close()
+
+    def test_expired(self):
+        cache = KeyCache(ttl=1e-9)
+        cache.set("a", "A" * 40, "x")
+        self.assertIsNone(cache.get("a"))
@@ -0,0 +1,46 @@
+import time
+import unittest
+
+from securitytxt.parsers.textparsers.signed_text_parser import SignedTextParser
+
+
+class TestSignedTextParser(unittest.TestCase):
+    time_bound = 1.0
+
+    def test_multiple_hash_headers(self):
+        parser = SignedTextParser("-----BEGIN PGP SIGNED MESSAGE-----\nHash: SHA256\nHash: SHA512\n\n"
+                                  "Contact: a@b.c\n-----BEGIN PGP SIGNATURE-----\n\nabc\n-----END PGP SIGNATURE-----")
+        self.assertEqual(parser.unsigned_text, "Contact: a@b.c")
+        self.assertEqual(parser.signature, "abc")
+
+    def test_missing_hash_header(self):
+        parser = SignedTextParser("-----BEGIN PGP SIGNED MESSAGE-----\nContact: a@b.c\n"
+                                  "-----BEGIN PGP SIGNATURE-----\nabc\n-----END PGP SIGNATURE-----\n")
+        self.assertEqual(parser.unsigned_text, "Contact: a@b.c")
+        self.assertEqual(parser.signature, "abc")
+
+    def test_dash_escaped_lines(self):
+        parser = SignedTextParser("-----BEGIN PGP SIGNED MESSAGE-----\nHash: SHA512\n\nContact: a@b.c\n"
+                                  "- -----BEGIN PGP SIGNATURE-----\n- - x\n-----BEGIN PGP SIGNATURE-----\n\nabc\n"
+                                  "-----END PGP SIGNATURE-----")
+        self.assertEqual(parser.unsigned_text, "Contact: a@b.c\n-----BEGIN PGP SIGNATURE-----\n- x")
+        self.assertEqual(parser.signature, "abc")
+
+    def test_missing_end(self):
+        with self.assertRaises(AttributeError):
+            SignedTextParser("-----BEGIN PGP SIGNED MESSAGE-----\nContact: a@b.c\n-----BEGIN PGP SIGNATURE-----\nabc")
+
+    def test_many_signature_lines_without_end(self):
+        text = "-----BEGIN PGP SIGNED MESSAGE-----\n" + "-----BEGIN PGP SIGNATURE-----\n" * 100000
+        start = time.monotonic()
+        with self.assertRaises(AttributeError):
+            SignedTextParser(text)
+        self.assertLess(time.monotonic() - start, self.time_bound)
+
+    def test_many_signature_lines_with_end(self):
+        text = ("-----BEGIN PGP SIGNED MESSAGE-----\n" + "-----BEGIN PGP SIGNATURE-----\n" * 100000 +
+                "\n-----END PGP SIGNATURE-----\n" * 100000)
+        start = time.monotonic()
+        parser = SignedTextParser(text)
+        self.assertLess(time.monotonic() - start, self.time_bound)
+        self.assertTrue(parser.signature.startswith("-----END PGP SIGNATURE-----"))
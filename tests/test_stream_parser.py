@@ -0,0 +1,94 @@
+import io
+import os
+import tempfile
+import unittest
+
+from securitytxt.parsers.bytes_parser import BytesParser
+from securitytxt.parsers.corpus_reader import CorpusReader
+from securitytxt.securitytxt import SecurityTXT
+
+
+class TestStreamParser(unittest.TestCase):
+    files_dir = f"{os.path.dirname(os.path.realpath(__file__))}/files"
+    folders = next(os.walk(files_dir))[1]
+
+    def read(self, folder: str) -> bytes:
+        with open(f"{self.files_dir}/{folder}/in.txt", 'rb') as in_file:
+            return in_file.read()
+
+    def test_from_file_binary(self):
+        for folder in self.folders:
+            with self.subTest(msg=f"Checking test case {folder}"):
+                with open(f"{self.files_dir}/{folder}/in.txt", 'rb') as in_file:
+                    securitytxt = SecurityTXT.from_file(in_file)
+                self.assertEqual(vars(securitytxt), vars(BytesParser(self.read(folder)).securitytxt))
+
+    def test_from_file_text(self):
+        for folder in self.folders:
+            with self.subTest(msg=f"Checking test case {folder}"):
+                with open(f"{self.files_dir}/{folder}/in.txt", 'r', newline='') as in_file:
+                    securitytxt = SecurityTXT.from_file(in_file)
+                self.assertEqual(vars(securitytxt), vars(SecurityTXT.from_text(self.read(folder).decode())))
+
+    def test_crlf_and_leading_blank_lines(self):
+        text = "\r\n\r\n-----BEGIN PGP SIGNED MESSAGE-----\r\nHash: SHA256\r\n\r\nContact: a@b.c\r\n" \
+               "-----BEGIN PGP SIGNATURE-----\r\n\r\nabc\r\n-----END PGP SIGNATURE-----\r\n"
+        securitytxt = SecurityTXT.from_file(io.BytesIO(text.encode()))
+        self.assertEqual(vars(securitytxt), vars(BytesParser(text.encode()).securitytxt))
+        self.assertEqual(securitytxt.signature, "abc")
+
+    def test_drop_raw(self):
+        securitytxt = SecurityTXT.from_file(io.BytesIO(self.read('test_unsigned')), keep_raw=False)
+        self.assertEqual(securitytxt.raw, "")
+        self.assertTrue(securitytxt.contact)
+
+    def test_from_memoryview(self):
+        data = self.read('test_signed')
+        self.assertEqual(vars(SecurityTXT.from_bytes(memoryview(data))), vars(BytesParser(data).securitytxt))
+
+    def test_fallback_line(self):
+        securitytxt = SecurityTXT.from_bytes("Contact: mailto:a@b.c\n# Sécurité".encode('cp1252'))
+        self.assertEqual(securitytxt.comments, ["Sécurité"])
+        self.assertEqual(securitytxt.decoding, BytesParser.DECODING_FALLBACK)
+
+
+class TestCorpusReader(unittest.TestCase):
+    example_file = open(f"{os.path.dirname(os.path.realpath(__file__))}/files/test_signed/in.txt").read()
+
+    def setUp(self):
+        self.path = tempfile.mktemp(suffix='.corpus')
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_read(self):
+        bodies = [self.example_file, "Contact: mailto:a@b.c\n", "-----BEGIN PGP SIGNED MESSAGE-----\n", "",
+                  "Expires: not a date\n", "Contact: mailto:b@b.c\n"]
+        self.assertEqual(CorpusReader.write(self.path, bodies), 6)
+        results = list(CorpusReader(self.path))
+        self.assertEqual([index for index, _ in results], [0, 1, 2, 3, 4, 5])
+        self.assertEqual(vars(results[0][1]), vars(BytesParser(self.example_file.encode()).securitytxt))
+        self.assertEqual(results[1][1].contact, ["mailto:a@b.c"])
+        self.assertIsInstance(results[2][1], AttributeError)
+        self.assertEqual(results[3][1].raw, "")
+        self.assertIsInstance(results[4][1], ValueError)
+        self.assertEqual(results[5][1].contact, ["mailto:b@b.c"])
+        self.assertEqual(list(CorpusReader(self.path).bodies()), [body.encode() for body in bodies])
+
+    def test_empty(self):
+        CorpusReader.write(self.path, [])
+        self.assertEqual(list(CorpusReader(self.path)), [])
+
+    def test_truncated(self):
+        CorpusReader.write(self.path, [self.example_file])
+        with open(self.path, 'r+b') as archive:
+            archive.truncate(100)
+        with self.assertRaises(ValueError):
+            list(CorpusReader(self.path))
+
+    def test_drop_raw(self):
+        CorpusReader.write(self.path, [self.example_file] * 3)
+        for _, securitytxt in CorpusReader(self.path, keep_raw=False):
+            self.assertEqual(securitytxt.raw, "")
+            self.assertTrue(securitytxt.contact)
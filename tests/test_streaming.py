@@ -0,0 +1,46 @@
+import os
+import unittest
+import requests_mock
+
+from securitytxt.securitytxt import SecurityTXT
+
+
+@requests_mock.Mocker()
+class TestStreaming(unittest.TestCase):
+    example_file = open(f"{os.path.dirname(os.path.realpath(__file__))}/files/test_signed/in.txt").read()
+    url = "https://test.com/security.txt"
+
+    def test_accepted(self, m: requests_mock.Mocker):
+        m.get(self.url, text=self.example_file, headers={'Content-Type': 'text/plain; charset=utf-8'})
+        securitytxt = SecurityTXT.from_url(self.url, strict_url=True, stream=True)
+        self.assertEqual(securitytxt.raw, self.example_file)
+
+    def test_html_content_type(self, m: requests_mock.Mocker):
+        m.get(self.url, text=self.example_file, headers={'Content-Type': 'text/html'})
+        with self.assertRaises(FileNotFoundError):
+            SecurityTXT.from_url(self.url, strict_url=True, stream=True)
+
+    def test_html_split_over_chunks(self, m: requests_mock.Mocker):
+        m.get(self.url, text="Contact: a@b.c\n" + "#" * 8175 + "<html><body></body></html>")
+        with self.assertRaises(FileNotFoundError):
+            SecurityTXT.from_url(self.url, strict_url=True, stream=True)
+
+    def test_too_large(self, m: requests_mock.Mocker):
+        m.get(self.url, text=self.example_file)
+        with self.assertRaises(FileNotFoundError):
+            SecurityTXT.from_url(self.url, strict_url=True, stream=True, max_file_size=1000)
+
+    def test_too_large_content_length(self, m: requests_mock.Mocker):
+        m.get(self.url, text="Contact: a@b.c", headers={'Content-Length': str(10 ** 9)})
+        with self.assertRaises(FileNotFoundError):
+            SecurityTXT.from_url(self.url, strict_url=True, stream=True)
+
+    def test_malformed_content_length(self, m: requests_mock.Mocker):
+        for content_length in ["abc", "10, 10", "-1"]:
+            with self.subTest(content_length=content_length):
+                m.get(self.url, text="Contact: a@b.c", headers={'Content-Length': content_length})
+                securitytxt = SecurityTXT.from_url(self.url, strict_url=True, stream=True)
+                self.assertEqual(securitytxt.contact, ["a@b.c"])
+        m.get(self.url, text=self.example_file, headers={'Content-Length': "abc"})
+        with self.assertRaises(FileNotFoundError):
+            SecurityTXT.from_url(self.url, strict_url=True, stream=True, max_file_size=1000)